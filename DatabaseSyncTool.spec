@@ -40,6 +40,7 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    optimize=1,  # Bundle bytecode compiled with -O; the app has no asserts
 )
 
 # Remove unnecessary modules to reduce size
@@ -0,0 +1,45 @@
+"""
+Default configuration shared by the installer support scripts
+"""
+
+import json
+import os
+
+# Default configuration with 'admin' password hash
+DEFAULT_CONFIG = {
+    "app_password_hash": "d74ff0ee8da3b9806b18c877dbf29bbde50b5bd8e4dad7a3a725000feb82e8f1",
+    "database_pairs": [],
+    "log_level": "INFO",
+    "auto_start": False,
+    "default_sync_interval": 300,
+    "max_log_size": 10,
+    "backup_enabled": True
+}
+
+# Serialized once so every script writes byte-identical templates
+DEFAULT_CONFIG_PAYLOAD = json.dumps(DEFAULT_CONFIG, indent=4).encode('utf-8')
+
+TEMPLATE_FILE = 'config.json.template'
+
+
+def write_config_template():
+    """
+    Write the default config template unless it is already up to date.
+
+    Returns:
+        True if the file was written, False if it already matched
+    """
+    try:
+        with open(TEMPLATE_FILE, 'rb') as f:
+            if f.read() == DEFAULT_CONFIG_PAYLOAD:
+                return False
+    except FileNotFoundError:
+        pass
+
+    # Write the whole payload to a temporary file and swap it in, so an
+    # interrupted run never leaves a truncated template behind
+    tmp_file = f"{TEMPLATE_FILE}.tmp"
+    with open(tmp_file, 'wb', buffering=0) as f:
+        f.write(DEFAULT_CONFIG_PAYLOAD)
+    os.replace(tmp_file, TEMPLATE_FILE)
+    return True
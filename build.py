@@ -11,6 +11,7 @@ import os
 import shutil
 import subprocess
 import argparse
+import importlib
 from pathlib import Path
 
 
@@ -159,6 +160,7 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    optimize=1,  # Bundle bytecode compiled with -O; the app has no asserts
 )
 
 # Remove unnecessary modules to reduce size
@@ -251,13 +253,33 @@ VSVersionInfo(
         f.write(version_info.strip())
 
 
+def create_dependency_manifest():
+    """Record which runtime dependencies are missing from the build environment."""
+    # The frozen app bundles whatever this environment has, so the result
+    # is fixed at build time and the app need not import drivers to check
+    missing = []
+    for module_name in ('pymysql', 'psycopg2', 'winreg'):
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            missing.append(module_name)
+
+    if missing:
+        print(f"⚠ Not available to bundle: {', '.join(missing)}")
+
+    with open('_dep_manifest.py', 'w') as f:
+        f.write("# Generated by build.py: modules missing from the frozen bundle\n")
+        f.write(f"MISSING_MODULES = {missing!r}\n")
+
+
 def build_executable(debug=False):
     """Build the executable using PyInstaller."""
     print("Building executable...")
 
-    # Create spec file and version info
+    # Create spec file, version info and dependency manifest
     create_spec_file()
     create_version_info()
+    create_dependency_manifest()
 
     # Build command
     cmd = ['pyinstaller', 'DatabaseSyncTool.spec']
@@ -5,7 +5,9 @@ This module handles all configuration persistence, including database pairs,
 application settings, and password management.
 """
 
+import os
 import json
+import hmac
 import hashlib
 import logging
 from pathlib import Path
@@ -16,9 +18,21 @@ from utils.custom_encoder import CustomEncoder
 from .models import DatabasePair, AppConfig
 from utils.constants import (
     DEFAULT_PASSWORD, DEFAULT_LOG_LEVEL,
-    DEFAULT_SYNC_INTERVAL, ERROR_MESSAGES
+    DEFAULT_SYNC_INTERVAL, ERROR_MESSAGES,
+    PASSWORD_HASH_ITERATIONS, PASSWORD_SALT_BYTES
 )
 
+# hashlib binds sha256 to OpenSSL's EVP implementation when the interpreter
+# was built against it, and to CPython's portable fallback otherwise
+_SHA256_IMPL = 'openssl' if hashlib.sha256.__name__.startswith('openssl_') else 'builtin'
+
+# Digest of the default password, computed once for first-run checks. The
+# default is stored as a plain SHA-256 hex digest, as in config.json.template
+_DEFAULT_PASSWORD_DIGEST = hashlib.sha256(DEFAULT_PASSWORD.encode('utf-8')).digest()
+
+# Prefix of salted password hashes: pbkdf2_sha256$<iterations>$<salt>$<digest>
+_PBKDF2_PREFIX = 'pbkdf2_sha256'
+
 
 class ConfigManager:
     """Manages application configuration and persistence."""
@@ -47,13 +61,34 @@ class ConfigManager:
 
         # Default configuration
         self._config = AppConfig(
-            app_password_hash=self._hash_password(DEFAULT_PASSWORD),
+            app_password_hash=_DEFAULT_PASSWORD_DIGEST.hex(),
             database_pairs=[],
             log_level=DEFAULT_LOG_LEVEL,
             auto_start=False,
             default_sync_interval=DEFAULT_SYNC_INTERVAL
         )
 
+        # Parsed form of the stored password hash; a salt of None marks a
+        # legacy unsalted SHA-256 hash
+        self._password_digest = _DEFAULT_PASSWORD_DIGEST
+        self._password_salt: Optional[bytes] = None
+        self._password_iterations = 0
+
+        # Bytes last read from or written to the config file, used to skip
+        # rewriting an unchanged configuration
+        self._saved_payload: Optional[bytes] = None
+
+        # Decoded database pairs, valid while _pairs_cache_source is still
+        # the config's pair list
+        self._pairs_cache: Optional[List[DatabasePair]] = None
+        self._pairs_cache_source: Optional[List[Dict[str, Any]]] = None
+
+        if _SHA256_IMPL == 'openssl':
+            self.logger.debug("Password hashing uses the OpenSSL SHA-256 implementation")
+        else:
+            self.logger.warning("Password hashing uses CPython's builtin SHA-256; "
+                                "OpenSSL hashing is unavailable in this build")
+
         self.load_config()
 
     @property
@@ -63,27 +98,71 @@ class ConfigManager:
 
     def _hash_password(self, password: str) -> str:
         """
-        Hash a password using SHA-256.
+        Hash a password using salted PBKDF2-HMAC-SHA256.
 
         Args:
             password: Plain text password
 
         Returns:
-            Hashed password as hex string
+            Encoded hash string holding the iteration count, salt and digest
         """
-        return hashlib.sha256(password.encode('utf-8')).hexdigest()
+        salt = os.urandom(PASSWORD_SALT_BYTES)
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt,
+                                     PASSWORD_HASH_ITERATIONS)
+        return f"{_PBKDF2_PREFIX}${PASSWORD_HASH_ITERATIONS}${salt.hex()}${digest.hex()}"
+
+    def _cache_password_digest(self):
+        """Parse the stored password hash once so verification only hashes the input."""
+        stored = self._config.app_password_hash
+        try:
+            if isinstance(stored, str) and stored.startswith(_PBKDF2_PREFIX + '$'):
+                _, iterations, salt, digest = stored.split('$')
+                self._password_iterations = int(iterations)
+                self._password_salt = bytes.fromhex(salt)
+                self._password_digest = bytes.fromhex(digest)
+            else:
+                self._password_iterations = 0
+                self._password_salt = None
+                self._password_digest = bytes.fromhex(stored)
+        except (AttributeError, TypeError, ValueError):
+            self.logger.error("Stored password hash is malformed; password checks will fail")
+            self._password_iterations = 0
+            self._password_salt = None
+            self._password_digest = b''
 
     def verify_password(self, password: str) -> bool:
         """
         Verify a password against the stored hash.
 
+        A correct password stored as a legacy unsalted hash is rehashed with
+        PBKDF2, except for the default password, which marks a first run.
+
         Args:
             password: Plain text password to verify
 
         Returns:
             True if password is correct, False otherwise
         """
-        return self._hash_password(password) == self._config.app_password_hash
+        password_bytes = password.encode('utf-8')
+
+        if self._password_salt is not None:
+            digest = hashlib.pbkdf2_hmac('sha256', password_bytes, self._password_salt,
+                                         self._password_iterations)
+            return hmac.compare_digest(digest, self._password_digest)
+
+        digest = hashlib.sha256(password_bytes).digest()
+        if not hmac.compare_digest(digest, self._password_digest):
+            return False
+
+        if not self.is_first_run():
+            try:
+                self._config.app_password_hash = self._hash_password(password)
+                self._cache_password_digest()
+                self.save_config()
+                self.logger.info("Upgraded stored password hash to PBKDF2")
+            except Exception as e:
+                self.logger.warning(f"Could not upgrade stored password hash: {e}")
+        return True
 
     def set_password(self, password: str) -> bool:
         """
@@ -97,6 +176,7 @@ class ConfigManager:
         """
         try:
             self._config.app_password_hash = self._hash_password(password)
+            self._cache_password_digest()
             self.save_config()
             self.logger.info("Password updated successfully")
             return True
@@ -111,7 +191,7 @@ class ConfigManager:
         Returns:
             True if default password is still active
         """
-        return self.verify_password(DEFAULT_PASSWORD)
+        return self._password_salt is None and self._password_digest == _DEFAULT_PASSWORD_DIGEST
 
     def load_config(self) -> bool:
         """
@@ -127,8 +207,8 @@ class ConfigManager:
             return True
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            payload = self.config_file.read_bytes()
+            data = json.loads(payload)
 
             # Validate and merge with defaults
             self._config.app_password_hash = data.get(
@@ -150,6 +230,8 @@ class ConfigManager:
                 'backup_enabled',
                 self._config.backup_enabled
             )
+            self._cache_password_digest()
+            self._saved_payload = payload
 
             self.logger.info(f"Configuration loaded from {self.config_file}")
             return True
@@ -178,6 +260,17 @@ class ConfigManager:
     def save_config(self) -> bool:
         """Save current configuration to file."""
         try:
+            # Debug: Check for enum objects before saving
+            config_dict = self._config.to_dict()
+            self._check_for_enums(config_dict)  # Add this debug method
+
+            payload = json.dumps(
+                config_dict, indent=4, ensure_ascii=False, cls=CustomEncoder
+            ).encode('utf-8')
+            if payload == self._saved_payload and self.config_file.exists():
+                self.logger.debug("Configuration unchanged, skipping save")
+                return True
+
             # Ensure the config directory exists
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -191,13 +284,12 @@ class ConfigManager:
                 except Exception as e:
                     self.logger.warning(f"Could not create backup: {e}")
 
-            # Debug: Check for enum objects before saving
-            config_dict = self._config.to_dict()
-            self._check_for_enums(config_dict)  # Add this debug method
-
-            # Save current config
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, indent=4, ensure_ascii=False, cls=CustomEncoder)
+            # Write to a temporary file and swap it in, so an interrupted save
+            # never leaves a truncated config behind
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.config_file)
+            self._saved_payload = payload
 
             self.logger.info(f"Configuration saved to {self.config_file}")
             return True
@@ -234,6 +326,7 @@ class ConfigManager:
                 return False
 
             self._config.database_pairs.append(db_pair.to_dict())
+            self._invalidate_pairs_cache()
             self.save_config()
             self.logger.info(f"Added database pair: {db_pair.name}")
             return True
@@ -257,6 +350,7 @@ class ConfigManager:
             for i, pair_data in enumerate(self._config.database_pairs):
                 if pair_data.get('id') == pair_id:
                     self._config.database_pairs[i] = db_pair.to_dict()
+                    self._invalidate_pairs_cache()
                     self.save_config()
                     self.logger.info(f"Updated database pair: {db_pair.name}")
                     return True
@@ -297,13 +391,25 @@ class ConfigManager:
             self.logger.error(f"Failed to remove database pair: {e}")
             return False
 
+    def _invalidate_pairs_cache(self):
+        """Drop the decoded database pairs after the stored pairs change."""
+        self._pairs_cache = None
+        self._pairs_cache_source = None
+
     def get_database_pairs(self) -> List[DatabasePair]:
         """
         Get all configured database pairs.
 
+        The pairs are decoded once and shared between calls until the stored
+        configuration changes; use update_database_pair to persist edits.
+
         Returns:
             List of database pair configurations
         """
+        if (self._pairs_cache is not None
+                and self._pairs_cache_source is self._config.database_pairs):
+            return list(self._pairs_cache)
+
         pairs = []
         for pair_data in self._config.database_pairs:
             try:
@@ -313,7 +419,9 @@ class ConfigManager:
                 self.logger.error(f"Failed to load database pair: {e}")
                 continue
 
-        return pairs
+        self._pairs_cache = pairs
+        self._pairs_cache_source = self._config.database_pairs
+        return list(pairs)
 
     def get_database_pair_by_id(self, pair_id: str) -> Optional[DatabasePair]:
         """
@@ -377,6 +485,7 @@ class ConfigManager:
             for pair_data in self._config.database_pairs:
                 if pair_data.get('id') == pair_id:
                     pair_data['last_sync'] = timestamp
+                    self._invalidate_pairs_cache()
                     self.save_config()
                     return True
             return False
@@ -436,6 +545,7 @@ class ConfigManager:
             if not merge:
                 # Replace existing configuration
                 self._config = AppConfig.from_dict(import_data)
+                self._cache_password_digest()
             else:
                 # Merge with existing configuration
                 if 'database_pairs' in import_data:
@@ -443,6 +553,7 @@ class ConfigManager:
                     for pair_data in import_data['database_pairs']:
                         if pair_data.get('name') not in existing_names:
                             self._config.database_pairs.append(pair_data)
+                    self._invalidate_pairs_cache()
 
             self.save_config()
             self.logger.info(f"Configuration imported from {import_path}")
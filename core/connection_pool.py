@@ -0,0 +1,122 @@
+"""
+Connection pooling for the Database Synchronization Application.
+
+This module keeps idle MySQL and PostgreSQL connections open between sync
+cycles so that each cycle does not pay the connect and authentication cost
+again.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+from core.models import DatabaseConfig
+from utils.constants import CONNECTION_POOL_SIZE
+
+
+class ConnectionPool:
+    """Thread-safe store of idle database connections keyed by configuration."""
+
+    def __init__(self, max_idle: int = CONNECTION_POOL_SIZE):
+        """
+        Initialize the connection pool.
+
+        Args:
+            max_idle: Maximum number of idle connections kept per database
+        """
+        self.max_idle = max_idle
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple, List[Any]] = {}
+
+    @staticmethod
+    def _key(config: DatabaseConfig) -> Tuple:
+        """Build the pool key; edited credentials never reuse old connections."""
+        return (config.id, config.db_type, config.host, config.port,
+                config.database, config.username, config.password)
+
+    def acquire(self, config: DatabaseConfig, factory: Callable[[], Any]) -> Any:
+        """
+        Get a live connection for a database, opening one if none is idle.
+
+        Args:
+            config: Database configuration
+            factory: Callable opening a new connection
+
+        Returns:
+            Database connection
+        """
+        key = self._key(config)
+
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                connection = idle.pop() if idle else None
+
+            if connection is None:
+                return factory()
+
+            if self._is_alive(connection):
+                self.logger.debug(f"Reusing pooled connection to {config.name}")
+                return connection
+
+            self._close(connection)
+
+    def release(self, config: DatabaseConfig, connection: Any):
+        """
+        Return a connection to the pool, closing it if the pool is full.
+
+        Args:
+            config: Database configuration the connection belongs to
+            connection: Connection to return
+        """
+        try:
+            # Never hand out a connection with an open transaction
+            connection.rollback()
+        except Exception as e:
+            self.logger.debug(f"Discarding connection that failed to roll back: {e}")
+            self._close(connection)
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(self._key(config), [])
+            if len(idle) < self.max_idle:
+                idle.append(connection)
+                return
+
+        self._close(connection)
+
+    def close_all(self):
+        """Close every idle connection in the pool."""
+        with self._lock:
+            connections = [connection for idle in self._idle.values() for connection in idle]
+            self._idle.clear()
+
+        for connection in connections:
+            self._close(connection)
+
+    def _is_alive(self, connection: Any) -> bool:
+        """Check that a pooled connection can still reach the server."""
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            connection.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _close(self, connection: Any):
+        """Close a connection, ignoring errors from dead connections."""
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+# Shared by every DatabaseManager in the process
+connection_pool = ConnectionPool()
@@ -5,23 +5,40 @@ This module handles all database connections, operations, and change tracking
 for the synchronization process.
 """
 
+import hashlib
 import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import time
+from typing import List, Dict, Any, Optional, Tuple, Sequence, Iterator
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from core.models import DatabaseConfig, ChangeRecord, DatabaseType
+from core.connection_pool import connection_pool
 from utils.constants import (
-    CHANGELOG_TABLE_SUFFIX, MYSQL_CHANGELOG_TABLE,
+    CHANGELOG_TABLE_SUFFIX, SQLITE_SUPPRESS_TABLE, MYSQL_CHANGELOG_TABLE, MYSQL_CHANGELOG_PENDING_INDEX,
     POSTGRESQL_CHANGELOG_TABLE, SQLITE_CHANGELOG_TABLE,
-    MAX_BATCH_SIZE, ERROR_MESSAGES
+    MAX_BATCH_SIZE, SCHEMA_CACHE_TTL, STREAM_CHUNK_SIZE, ERROR_MESSAGES
 )
 
 
+# Separates column values inside row hashes; unlikely to appear in data
+ROW_HASH_SEPARATOR = '\x1f'
+
+
+def _sqlite_row_hash(*values) -> str:
+    """Row hash function registered on SQLite connections (no built-in MD5)."""
+    text = ROW_HASH_SEPARATOR.join('' if value is None else f"v{value}" for value in values)
+    return hashlib.md5(text.encode('utf-8')).hexdigest()
+
+
 class DatabaseManager:
     """Handles database connections and operations for sync process."""
 
+    # Table structures shared by all managers, keyed by (database id, table)
+    # and stored with the monotonic time they were read
+    _schema_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
     def __init__(self, db_config: DatabaseConfig):
         """
         Initialize the database manager.
@@ -33,6 +50,18 @@ class DatabaseManager:
         self.connection = None
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # DB-API parameter marker used by this database's driver
+        self.param_marker = '?' if db_config.db_type == DatabaseType.SQLITE.value else '%s'
+
+        # Explicit transaction state (see transaction())
+        self._in_transaction = False
+        self._transaction_failed = False
+        self._savepoint_depth = 0
+        self._untracked_statements = False
+
+        # Session time zone offset from UTC (see get_utc_offset())
+        self._utc_offset: Optional[timedelta] = None
+
         # Import database drivers based on type
         self._import_driver()
 
@@ -67,34 +96,19 @@ class DatabaseManager:
             if self.connection:
                 self.disconnect()
 
-            if self.config.db_type == DatabaseType.MYSQL.value:
-                self.connection = self.driver.connect(
-                    host=self.config.host,
-                    port=self.config.port,
-                    user=self.config.username,
-                    password=self.config.password,
-                    database=self.config.database,
-                    charset='utf8mb4',
-                    connect_timeout=self.config.connection_timeout
-                )
-
-            elif self.config.db_type == DatabaseType.POSTGRESQL.value:
-                self.connection = self.driver.connect(
-                    host=self.config.host,
-                    port=self.config.port,
-                    user=self.config.username,
-                    password=self.config.password,
-                    database=self.config.database,
-                    connect_timeout=self.config.connection_timeout
-                )
+            self._utc_offset = None
 
-            elif self.config.db_type == DatabaseType.SQLITE.value:
+            if self.config.db_type == DatabaseType.SQLITE.value:
                 self.connection = self.driver.connect(
                     self.config.database,
                     timeout=self.config.connection_timeout
                 )
                 # Enable foreign key support
                 self.connection.execute("PRAGMA foreign_keys = ON")
+                self.connection.create_function('sync_row_hash', -1, _sqlite_row_hash, deterministic=True)
+            else:
+                # Network connections are reused across sync cycles
+                self.connection = connection_pool.acquire(self.config, self._open_connection)
 
             self.logger.info(f"Connected to {self.config.db_type} database: {self.config.name}")
             return True
@@ -103,39 +117,209 @@ class DatabaseManager:
             self.logger.error(f"Failed to connect to database {self.config.name}: {e}")
             return False
 
+    def _open_connection(self):
+        """Open a new MySQL or PostgreSQL connection."""
+        if self.config.db_type == DatabaseType.MYSQL.value:
+            return self.driver.connect(
+                host=self.config.host,
+                port=self.config.port,
+                user=self.config.username,
+                password=self.config.password,
+                database=self.config.database,
+                charset='utf8mb4',
+                connect_timeout=self.config.connection_timeout
+            )
+
+        return self.driver.connect(
+            host=self.config.host,
+            port=self.config.port,
+            user=self.config.username,
+            password=self.config.password,
+            database=self.config.database,
+            connect_timeout=self.config.connection_timeout
+        )
+
     def disconnect(self):
-        """Close database connection."""
+        """Close the database connection, or return it to the connection pool."""
         if self.connection:
             try:
-                self.connection.close()
+                if self.config.db_type == DatabaseType.SQLITE.value:
+                    self.connection.close()
+                else:
+                    connection_pool.release(self.config, self.connection)
                 self.connection = None
                 self.logger.debug(f"Disconnected from database: {self.config.name}")
             except Exception as e:
                 self.logger.error(f"Error disconnecting from database: {e}")
 
     @contextmanager
-    def get_cursor(self):
-        """Context manager for database cursors."""
+    def get_cursor(self, server_side: bool = False):
+        """
+        Context manager for database cursors.
+
+        Args:
+            server_side: Stream results from the server instead of buffering
+                them client-side (PostgreSQL and MySQL). No other statement
+                may run on the connection until the cursor is exhausted.
+        """
         if not self.connection:
             raise RuntimeError("Database not connected")
 
+        if self._untracked_statements and not self._in_transaction:
+            # See untracked_statements()
+            with self.transaction(), self.suppress_change_tracking(), \
+                    self.get_cursor(server_side) as cursor:
+                yield cursor
+            return
+
         cursor = None
         try:
             if self.config.db_type == DatabaseType.POSTGRESQL.value:
-                cursor = self.connection.cursor(cursor_factory=self.driver.extras.RealDictCursor)
+                if server_side:
+                    cursor = self.connection.cursor(name=f"sync_scan_{id(self)}",
+                                                    cursor_factory=self.driver.extras.RealDictCursor)
+                else:
+                    cursor = self.connection.cursor(cursor_factory=self.driver.extras.RealDictCursor)
+            elif self.config.db_type == DatabaseType.MYSQL.value and server_side:
+                cursor = self.connection.cursor(self.driver.cursors.SSCursor)
             else:
                 cursor = self.connection.cursor()
 
             yield cursor
-            self.connection.commit()
+            if not self._in_transaction:
+                self.connection.commit()
 
         except Exception as e:
-            self.connection.rollback()
+            if self._in_transaction:
+                # Let transaction() decide how to finish the batch
+                self._transaction_failed = True
+            else:
+                self.connection.rollback()
             raise e
         finally:
             if cursor:
                 cursor.close()
 
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager grouping all statements into a single transaction.
+
+        Cursors opened inside the block skip their per-statement commit, so the
+        whole block is committed once on exit. If any statement failed, or the
+        block raised, everything is rolled back and an exception is raised.
+        Nested calls join the outer transaction.
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected")
+
+        if self._in_transaction:
+            yield self
+            return
+
+        self._in_transaction = True
+        self._transaction_failed = False
+        try:
+            yield self
+            if self._transaction_failed:
+                raise RuntimeError("Transaction aborted by a failed statement")
+            self.connection.commit()
+
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+            self._transaction_failed = False
+
+    @contextmanager
+    def savepoint(self):
+        """
+        Context manager isolating a group of statements inside transaction().
+
+        If a statement in the block fails, only the block's work is rolled
+        back and the surrounding transaction carries on. Outside a
+        transaction the block runs unchanged.
+        """
+        if not self._in_transaction:
+            yield self
+            return
+
+        name = f"sync_sp_{self._savepoint_depth}"
+        failed_before = self._transaction_failed
+        self._transaction_failed = False
+
+        with self.get_cursor() as cursor:
+            cursor.execute(f"SAVEPOINT {name}")
+
+        self._savepoint_depth += 1
+        try:
+            yield self
+        except Exception:
+            self._transaction_failed = True
+            raise
+        finally:
+            self._savepoint_depth -= 1
+            block_failed = self._transaction_failed
+            self._transaction_failed = False
+
+            with self.get_cursor() as cursor:
+                if block_failed:
+                    cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+                cursor.execute(f"RELEASE SAVEPOINT {name}")
+
+            self._transaction_failed = failed_before
+
+    @contextmanager
+    def suppress_change_tracking(self):
+        """
+        Context manager stopping this connection's writes from being recorded
+        by the changelog triggers.
+
+        Must be used inside transaction(). MySQL uses a session variable and
+        PostgreSQL a transaction-local setting; SQLite uses an uncommitted
+        marker row, which no other connection can see while this one holds
+        the write lock.
+        """
+        if not self._in_transaction:
+            raise RuntimeError("Change tracking can only be suppressed inside a transaction")
+
+        with self.get_cursor() as cursor:
+            if self.config.db_type == DatabaseType.MYSQL.value:
+                cursor.execute("SET @sync_suppress = 1")
+            elif self.config.db_type == DatabaseType.POSTGRESQL.value:
+                cursor.execute("SELECT set_config('sync.suppress', '1', true)")
+            elif self.config.db_type == DatabaseType.SQLITE.value:
+                cursor.execute(f"CREATE TABLE IF NOT EXISTS {SQLITE_SUPPRESS_TABLE} (flag INTEGER)")
+                cursor.execute(f"INSERT INTO {SQLITE_SUPPRESS_TABLE} (flag) VALUES (1)")
+
+        try:
+            yield self
+        finally:
+            # PostgreSQL's setting is reset automatically when the transaction ends
+            with self.get_cursor() as cursor:
+                if self.config.db_type == DatabaseType.MYSQL.value:
+                    cursor.execute("SET @sync_suppress = NULL")
+                elif self.config.db_type == DatabaseType.SQLITE.value:
+                    cursor.execute(f"DELETE FROM {SQLITE_SUPPRESS_TABLE}")
+
+    @contextmanager
+    def untracked_statements(self):
+        """
+        Context manager running each statement in its own short transaction
+        with change tracking suppressed.
+
+        Used where a block of writes cannot share one transaction but must
+        still not be recorded by the changelog triggers. Statements issued
+        inside an explicit transaction() are unaffected.
+        """
+        previous = self._untracked_statements
+        self._untracked_statements = True
+        try:
+            yield self
+        finally:
+            self._untracked_statements = previous
+
     def test_connection(self) -> bool:
         """
         Test database connection.
@@ -205,7 +389,8 @@ class DatabaseManager:
 
                 # Filter out changelog tables
                 tables = [table for table in tables
-                          if not table.endswith(CHANGELOG_TABLE_SUFFIX)]
+                          if not table.endswith(CHANGELOG_TABLE_SUFFIX)
+                          and table != SQLITE_SUPPRESS_TABLE]
 
                 self.logger.info(f"Found {len(tables)} tables in {self.config.name}")
                 return tables
@@ -267,7 +452,7 @@ class DatabaseManager:
                             'type': row[2],
                             'null': row[3] == 0,
                             'default': row[4],
-                            'primary_key': row[5] == 1
+                            'primary_key': row[5] > 0
                         })
 
                 return columns
@@ -286,6 +471,11 @@ class DatabaseManager:
         Returns:
             List of primary key column names
         """
+        # Primary keys rarely change, so a cached structure answers directly
+        cached = self._get_cached_structure(table_name)
+        if cached:
+            return list(cached['primary_keys'])
+
         try:
             columns = self.get_table_columns(table_name)
 
@@ -300,6 +490,62 @@ class DatabaseManager:
             self.logger.error(f"Failed to get primary keys for table {table_name}: {e}")
             return []
 
+    def get_tables_with_pks(self, table_names: Sequence[str]) -> Dict[str, List[str]]:
+        """
+        Get the primary key columns of several tables in one query.
+
+        Args:
+            table_names: Names of the tables to look up
+
+        Returns:
+            Dictionary mapping each existing table to its primary key columns
+            (empty if it has none); missing tables are left out
+        """
+        if not table_names:
+            return {}
+
+        placeholders = ', '.join([self.param_marker] * len(table_names))
+
+        if self.config.db_type == DatabaseType.MYSQL.value:
+            query = f"""
+            SELECT t.table_name AS table_name, k.column_name AS column_name
+            FROM information_schema.tables t
+            LEFT JOIN information_schema.key_column_usage k
+              ON k.table_schema = t.table_schema AND k.table_name = t.table_name
+             AND k.constraint_name = 'PRIMARY'
+            WHERE t.table_schema = DATABASE() AND t.table_name IN ({placeholders})
+            ORDER BY t.table_name, k.ordinal_position
+            """
+        elif self.config.db_type == DatabaseType.POSTGRESQL.value:
+            query = f"""
+            SELECT t.table_name AS table_name, k.column_name AS column_name
+            FROM information_schema.tables t
+            LEFT JOIN information_schema.table_constraints c
+              ON c.table_schema = t.table_schema AND c.table_name = t.table_name
+             AND c.constraint_type = 'PRIMARY KEY'
+            LEFT JOIN information_schema.key_column_usage k
+              ON k.constraint_schema = c.constraint_schema AND k.constraint_name = c.constraint_name
+             AND k.table_name = c.table_name
+            WHERE t.table_schema = 'public' AND t.table_name IN ({placeholders})
+            ORDER BY t.table_name, k.ordinal_position
+            """
+        else:
+            query = f"""
+            SELECT m.name AS table_name, p.name AS column_name
+            FROM sqlite_master m
+            LEFT JOIN pragma_table_info(m.name) p ON p.pk > 0
+            WHERE m.type = 'table' AND m.name IN ({placeholders})
+            ORDER BY m.name, p.pk
+            """
+
+        tables: Dict[str, List[str]] = {}
+        for row in self.execute_query(query, tuple(table_names)):
+            pk_columns = tables.setdefault(row['table_name'], [])
+            if row['column_name'] is not None:
+                pk_columns.append(row['column_name'])
+
+        return tables
+
     def create_changelog_table(self, table_name: str) -> bool:
         """
         Create changelog table for tracking changes.
@@ -331,6 +577,15 @@ class DatabaseManager:
                     if statement:
                         cursor.execute(statement)
 
+                if self.config.db_type == DatabaseType.MYSQL.value:
+                    # MySQL has no CREATE INDEX IF NOT EXISTS
+                    cursor.execute("""
+                    SELECT COUNT(*) FROM information_schema.statistics
+                    WHERE table_schema = DATABASE() AND table_name = %s AND index_name = 'idx_pending'
+                    """, (changelog_table,))
+                    if not cursor.fetchone()[0]:
+                        cursor.execute(MYSQL_CHANGELOG_PENDING_INDEX.format(changelog_table=changelog_table))
+
             self.logger.info(f"Created changelog table: {changelog_table}")
             return True
 
@@ -430,10 +685,11 @@ class DatabaseManager:
         FOR EACH ROW
         INSERT INTO {changelog_table} 
         (operation, table_name, primary_key_values, change_data, database_id)
-        VALUES ('INSERT', '{table_name}', 
+        SELECT 'INSERT', '{table_name}', 
                 JSON_OBJECT({pk_json}), 
                 JSON_OBJECT(), 
-                '{db_id}')
+                '{db_id}'
+                FROM DUAL WHERE @sync_suppress IS NULL
         """
 
         # UPDATE trigger
@@ -443,10 +699,11 @@ class DatabaseManager:
         FOR EACH ROW
         INSERT INTO {changelog_table} 
         (operation, table_name, primary_key_values, change_data, database_id)
-        VALUES ('UPDATE', '{table_name}', 
+        SELECT 'UPDATE', '{table_name}', 
                 JSON_OBJECT({pk_json}), 
                 JSON_OBJECT(), 
-                '{db_id}')
+                '{db_id}'
+                FROM DUAL WHERE @sync_suppress IS NULL
         """
 
         # DELETE trigger
@@ -456,10 +713,11 @@ class DatabaseManager:
         FOR EACH ROW
         INSERT INTO {changelog_table} 
         (operation, table_name, primary_key_values, change_data, database_id)
-        VALUES ('DELETE', '{table_name}', 
+        SELECT 'DELETE', '{table_name}', 
                 JSON_OBJECT({pk_json_old}), 
                 JSON_OBJECT(), 
-                '{db_id}')
+                '{db_id}'
+                FROM DUAL WHERE @sync_suppress IS NULL
         """
 
         # Drop existing triggers first
@@ -484,6 +742,11 @@ class DatabaseManager:
         trigger_function = f"""
         CREATE OR REPLACE FUNCTION {function_name}() RETURNS TRIGGER AS $$
         BEGIN
+            -- Changes applied by the sync engine itself are not recorded
+            IF current_setting('sync.suppress', true) = '1' THEN
+                RETURN NULL;
+            END IF;
+
             IF TG_OP = 'DELETE' THEN
                 INSERT INTO {changelog_table} (operation, table_name, primary_key_values, change_data, database_id)
                 VALUES ('DELETE', '{table_name}', row_to_json(OLD), '{{}}', '{db_id}');
@@ -526,6 +789,7 @@ class DatabaseManager:
         insert_trigger = f"""
         CREATE TRIGGER {table_name}_insert_trigger
         AFTER INSERT ON {table_name}
+        WHEN NOT EXISTS (SELECT 1 FROM {SQLITE_SUPPRESS_TABLE})
         BEGIN
             INSERT INTO {changelog_table} 
             (operation, table_name, primary_key_values, change_data, database_id)
@@ -540,6 +804,7 @@ class DatabaseManager:
         update_trigger = f"""
         CREATE TRIGGER {table_name}_update_trigger
         AFTER UPDATE ON {table_name}
+        WHEN NOT EXISTS (SELECT 1 FROM {SQLITE_SUPPRESS_TABLE})
         BEGIN
             INSERT INTO {changelog_table} 
             (operation, table_name, primary_key_values, change_data, database_id)
@@ -554,6 +819,7 @@ class DatabaseManager:
         delete_trigger = f"""
         CREATE TRIGGER {table_name}_delete_trigger
         AFTER DELETE ON {table_name}
+        WHEN NOT EXISTS (SELECT 1 FROM {SQLITE_SUPPRESS_TABLE})
         BEGIN
             INSERT INTO {changelog_table} 
             (operation, table_name, primary_key_values, change_data, database_id)
@@ -572,6 +838,9 @@ class DatabaseManager:
         except:
             pass
 
+        # The triggers' WHEN clause needs the marker table to exist
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {SQLITE_SUPPRESS_TABLE} (flag INTEGER)")
+
         cursor.execute(insert_trigger)
         cursor.execute(update_trigger)
         cursor.execute(delete_trigger)
@@ -606,14 +875,17 @@ class DatabaseManager:
                 params = []
 
                 if last_sync_time:
-                    query += " AND timestamp > %s" if self.config.db_type != DatabaseType.SQLITE.value else " AND timestamp > ?"
+                    query += f" AND timestamp > {self.param_marker}"
                     params.append(last_sync_time)
 
                 if exclude_db_id:
-                    query += " AND database_id != %s" if self.config.db_type != DatabaseType.SQLITE.value else " AND database_id != ?"
+                    query += f" AND database_id != {self.param_marker}"
                     params.append(exclude_db_id)
 
-                query += " ORDER BY timestamp ASC"
+                # The id primary key follows insertion order and is indexed, so
+                # the database can stop after one batch instead of sorting
+                # every pending entry
+                query += f" ORDER BY id ASC LIMIT {MAX_BATCH_SIZE}"
 
                 if params:
                     cursor.execute(query, params)
@@ -639,19 +911,97 @@ class DatabaseManager:
                     changes.append(ChangeRecord.from_dict(change_data))
 
                 self.logger.debug(f"Found {len(changes)} pending changes for {table_name}")
-                return changes[:MAX_BATCH_SIZE]  # Limit batch size
+                return changes
 
         except Exception as e:
             self.logger.error(f"Failed to get pending changes for {table_name}: {e}")
             return []
 
-    def mark_changes_synced(self, table_name: str, change_ids: List[int]) -> bool:
+    def get_unsynced_changes(self, table_name: str, database_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the unsynced changelog entries that originated on one database.
+
+        Only the columns needed to detect conflicts are read.
+
+        Args:
+            table_name: Name of the source table
+            database_id: Database ID the changes originated on
+
+        Returns:
+            List of dictionaries with id, primary_key_values and timestamp
+        """
+        changelog_table = f"{table_name}{CHANGELOG_TABLE_SUFFIX}"
+        query = f"""
+        SELECT id, primary_key_values, timestamp
+        FROM {changelog_table}
+        WHERE synced = {self._get_boolean_value(False)} AND database_id = {self.param_marker}
+        """
+
+        results = self.execute_query(query, (database_id,))
+        for row in results:
+            row['primary_key_values'] = self._parse_json(row['primary_key_values'])
+
+        return results
+
+    def get_utc_offset(self) -> timedelta:
+        """
+        Get the offset of this connection's session time zone from UTC.
+
+        Changelog timestamps default to CURRENT_TIMESTAMP, which MySQL and
+        PostgreSQL store in session-local time and SQLite in UTC. The offset
+        is read once per connection, so a daylight saving change since then
+        is not reflected.
+
+        Returns:
+            Offset to subtract from a local timestamp to get UTC
+        """
+        if self._utc_offset is not None:
+            return self._utc_offset
+
+        if self.config.db_type == DatabaseType.MYSQL.value:
+            results = self.execute_query("SELECT TIMESTAMPDIFF(SECOND, UTC_TIMESTAMP(), NOW()) AS utc_offset")
+        elif self.config.db_type == DatabaseType.POSTGRESQL.value:
+            results = self.execute_query("SELECT EXTRACT(TIMEZONE FROM now()) AS utc_offset")
+        else:
+            results = [{'utc_offset': 0}]
+
+        if not results:
+            # Not cached, so the next call asks again
+            return timedelta()
+
+        self._utc_offset = timedelta(seconds=float(results[0]['utc_offset'] or 0))
+        return self._utc_offset
+
+    def get_changelog_heads(self, table_names: Sequence[str]) -> Dict[str, int]:
+        """
+        Get the highest changelog entry id of several tables in one query.
+
+        Args:
+            table_names: Names of the source tables
+
+        Returns:
+            Dictionary mapping table names to their highest changelog id
+            (0 for an empty changelog), or an empty dictionary on error
+        """
+        if not table_names:
+            return {}
+
+        heads = [f"(SELECT COALESCE(MAX(id), 0) FROM {table_name}{CHANGELOG_TABLE_SUFFIX}) AS head_{index}"
+                 for index, table_name in enumerate(table_names)]
+        results = self.execute_query(f"SELECT {', '.join(heads)}")
+
+        if not results:
+            return {}
+
+        return {table_name: results[0][f"head_{index}"] for index, table_name in enumerate(table_names)}
+
+    def mark_changes_synced(self, table_name: str, change_ids: Sequence[int]) -> bool:
         """
         Mark changes as synced in changelog table.
 
         Args:
             table_name: Name of the source table
-            change_ids: List of change record IDs
+            change_ids: Sequence of change record IDs
 
         Returns:
             True if marked successfully, False otherwise
@@ -667,9 +1017,7 @@ class DatabaseManager:
             changelog_table = f"{table_name}{CHANGELOG_TABLE_SUFFIX}"
 
             with self.get_cursor() as cursor:
-                placeholders = ', '.join(
-                    ['%s'] * len(change_ids)) if self.config.db_type != DatabaseType.SQLITE.value else ', '.join(
-                    ['?'] * len(change_ids))
+                placeholders = ', '.join([self.param_marker] * len(change_ids))
 
                 query = f"""
                 UPDATE {changelog_table} 
@@ -677,7 +1025,7 @@ class DatabaseManager:
                 WHERE id IN ({placeholders})
                 """
 
-                cursor.execute(query, change_ids)
+                cursor.execute(query, tuple(change_ids))
 
             self.logger.info(f"Marked {len(change_ids)} changes as synced in {changelog_table}")
             return True
@@ -686,6 +1034,107 @@ class DatabaseManager:
             self.logger.error(f"Failed to mark changes as synced: {e}")
             return False
 
+    def build_pk_in_clause(self, pk_columns: List[str], row_count: int) -> str:
+        """
+        Build a WHERE condition matching any of several primary key tuples.
+
+        Args:
+            pk_columns: Primary key column names
+            row_count: Number of primary key tuples to match
+
+        Returns:
+            SQL condition such as "(a, b) IN ((?, ?), (?, ?))"
+        """
+        marker = self.param_marker
+
+        if len(pk_columns) == 1:
+            return f"{pk_columns[0]} IN ({', '.join([marker] * row_count)})"
+
+        row = f"({', '.join([marker] * len(pk_columns))})"
+        return f"({', '.join(pk_columns)}) IN ({', '.join([row] * row_count)})"
+
+    def build_upsert(self, table_name: str, columns: List[str], pk_columns: List[str],
+                     values: str = None, guard_column: str = None) -> str:
+        """
+        Build an INSERT that updates the existing row on a primary key conflict.
+
+        Args:
+            table_name: Name of the table
+            columns: Columns to write, in parameter order
+            pk_columns: Primary key column names
+            values: VALUES clause body to use instead of one row of
+                parameter markers
+            guard_column: Timestamp column; an existing row whose value is
+                newer than the incoming one is left unchanged. Ignored by
+                SQLite before 3.24, which has no conditional upsert
+
+        Returns:
+            Dialect-specific upsert statement
+        """
+        marker = self.param_marker
+        update_columns = [col for col in columns if col not in pk_columns]
+        if values is None:
+            values = f"({', '.join([marker] * len(columns))})"
+        insert = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES {values}"
+        if guard_column not in update_columns:
+            guard_column = None
+
+        if self.config.db_type == DatabaseType.MYSQL.value:
+            if guard_column:
+                # Assignments run left to right, so the guard column is set
+                # last and every condition still sees its old value
+                newer = (f"{guard_column} IS NULL OR VALUES({guard_column}) IS NULL"
+                         f" OR {guard_column} <= VALUES({guard_column})")
+                ordered = [col for col in update_columns if col != guard_column] + [guard_column]
+                assignments = [f"{col} = IF({newer}, VALUES({col}), {col})" for col in ordered]
+            else:
+                # Assigning a key column to itself keeps the statement valid
+                # when every column is part of the primary key
+                assignments = [f"{col} = VALUES({col})" for col in update_columns or pk_columns[:1]]
+            return f"{insert} ON DUPLICATE KEY UPDATE {', '.join(assignments)}"
+
+        if (self.config.db_type == DatabaseType.SQLITE.value
+                and self.driver.sqlite_version_info < (3, 24, 0)):
+            # UPSERT syntax is unavailable before SQLite 3.24
+            return f"INSERT OR REPLACE{insert[len('INSERT'):]}"
+
+        conflict = f"ON CONFLICT ({', '.join(pk_columns)})"
+        if not update_columns:
+            return f"{insert} {conflict} DO NOTHING"
+
+        assignments = [f"{col} = excluded.{col}" for col in update_columns]
+        upsert = f"{insert} {conflict} DO UPDATE SET {', '.join(assignments)}"
+        if guard_column:
+            upsert += (f" WHERE {table_name}.{guard_column} IS NULL OR excluded.{guard_column} IS NULL"
+                       f" OR {table_name}.{guard_column} <= excluded.{guard_column}")
+        return upsert
+
+    def build_row_hash_expression(self, columns: List[str]) -> str:
+        """
+        Build an SQL expression computing an MD5 hash over a row's columns.
+
+        NULLs hash differently from every non-NULL value. Hashes are built
+        from each database's own text form of the values, so they are only
+        comparable between databases of the same type: floats, decimal
+        scale, booleans and timestamps are rendered differently by SQLite,
+        MySQL and PostgreSQL.
+
+        Args:
+            columns: Column names to include, in order
+
+        Returns:
+            SQL expression evaluating to a hex digest
+        """
+        if self.config.db_type == DatabaseType.SQLITE.value:
+            return f"sync_row_hash({', '.join(columns)})"
+
+        if self.config.db_type == DatabaseType.MYSQL.value:
+            parts = [f"COALESCE(CONCAT('v', {col}), '')" for col in columns]
+            return f"MD5(CONCAT_WS(CHAR(31), {', '.join(parts)}))"
+
+        parts = [f"COALESCE('v' || {col}::text, '')" for col in columns]
+        return f"MD5(CONCAT_WS(chr(31), {', '.join(parts)}))"
+
     def _get_boolean_value(self, value: bool) -> str:
         """Get database-specific boolean value."""
         if self.config.db_type == DatabaseType.SQLITE.value:
@@ -741,31 +1190,192 @@ class DatabaseManager:
             self.logger.error(f"Query execution failed: {e}")
             return []
 
+    def iter_query(self, query: str, params: tuple = None,
+                   chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute a SELECT and yield its rows in chunks instead of all at once.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+            chunk_size: Number of rows per chunk
+
+        Yields:
+            Lists of result dictionaries
+
+        Raises:
+            Exception: If the query fails, after logging it
+        """
+        try:
+            if not self.connection:
+                if not self.connect():
+                    raise RuntimeError("Database not connected")
+
+            with self.get_cursor(server_side=True) as cursor:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
+                columns = None
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+
+                    if not isinstance(rows[0], dict):
+                        # Convert tuple results to dictionaries
+                        if columns is None:
+                            columns = [desc[0] for desc in cursor.description]
+                        rows = [dict(zip(columns, row)) for row in rows]
+
+                    yield rows
+
+        except Exception as e:
+            self.logger.error(f"Query execution failed: {e}")
+            raise
+
+    def execute_many(self, query: str, params_list: List[tuple]) -> Optional[int]:
+        """
+        Execute a statement once for each parameter set in a single call.
+
+        Args:
+            query: SQL statement to execute
+            params_list: Sequence of parameter tuples
+
+        Returns:
+            Total number of affected rows if all parameter sets executed
+            successfully, None otherwise
+        """
+        try:
+            if not self.connection:
+                if not self.connect():
+                    return None
+
+            with self.get_cursor() as cursor:
+                cursor.executemany(query, params_list)
+                return cursor.rowcount
+
+        except Exception as e:
+            self.logger.error(f"Batch execution failed: {e}")
+            return None
+
+    def bulk_upsert(self, table_name: str, columns: List[str], rows: List[tuple],
+                    pk_columns: List[str], guard_column: str = None) -> Optional[int]:
+        """
+        Insert or update many rows with as few statements as the driver allows.
+
+        psycopg2's executemany makes a round trip per row, so PostgreSQL rows
+        are sent as a single multi-row INSERT ... ON CONFLICT instead. MySQL
+        drivers already fold executemany INSERTs into multi-row statements.
+
+        Args:
+            table_name: Name of the table
+            columns: Columns to write, in parameter order
+            rows: Sequence of parameter tuples
+            pk_columns: Primary key column names
+            guard_column: Timestamp column; existing rows with a newer value
+                are left unchanged
+
+        Returns:
+            Number of affected rows as reported by the driver, or None on failure
+        """
+        if not rows:
+            return 0
+
+        try:
+            if not self.connection:
+                if not self.connect():
+                    return None
+
+            with self.get_cursor() as cursor:
+                if self.config.db_type == DatabaseType.POSTGRESQL.value:
+                    query = self.build_upsert(table_name, columns, pk_columns, values='%s',
+                                              guard_column=guard_column)
+                    self.driver.extras.execute_values(cursor, query, rows, page_size=len(rows))
+                else:
+                    cursor.executemany(self.build_upsert(table_name, columns, pk_columns,
+                                                         guard_column=guard_column), rows)
+                return cursor.rowcount
+
+        except Exception as e:
+            self.logger.error(f"Bulk upsert into {table_name} failed: {e}")
+            return None
+
     def get_table_structure(self, table_name: str) -> Dict[str, Any]:
         """
         Get complete table structure including columns, types, and constraints.
 
+        Structures are cached for SCHEMA_CACHE_TTL seconds; call
+        invalidate_schema_cache() after changing a table's definition. The
+        returned dictionary is shared and must not be modified.
+
         Args:
             table_name: Name of the table
 
         Returns:
             Dictionary containing table structure information
         """
+        cached = self._get_cached_structure(table_name)
+        if cached:
+            return cached
+
         try:
             columns = self.get_table_columns(table_name)
             primary_keys = self.get_primary_key_columns(table_name)
 
-            return {
+            structure = {
                 'columns': {col['name']: col for col in columns},
                 'primary_keys': primary_keys,
                 'column_names': [col['name'] for col in columns],
-                'non_pk_columns': [col['name'] for col in columns if col['name'] not in primary_keys]
+                'non_pk_columns': [col['name'] for col in columns if col['name'] not in primary_keys],
+                'timestamp_columns': self._find_timestamp_columns(columns)
             }
 
+            if columns:
+                self._schema_cache[(self.config.id, table_name)] = (time.monotonic(), structure)
+
+            return structure
+
         except Exception as e:
             self.logger.error(f"Failed to get table structure for {table_name}: {e}")
             return {}
 
+    def _find_timestamp_columns(self, columns: List[Dict[str, Any]]) -> List[str]:
+        """Find columns that likely contain timestamps, by name or type."""
+        # Common timestamp column names and types
+        timestamp_names = ['updated_at', 'modified_at', 'timestamp', 'last_modified', 'created_at']
+        timestamp_types = ['timestamp', 'datetime', 'date']
+
+        timestamp_columns = []
+        for col in columns:
+            col_type = (col.get('type') or '').lower()
+
+            # Check by name or type
+            if (col['name'].lower() in timestamp_names or
+                    any(ts_type in col_type for ts_type in timestamp_types)):
+                timestamp_columns.append(col['name'])
+
+        return timestamp_columns
+
+    def _get_cached_structure(self, table_name: str) -> Optional[Dict[str, Any]]:
+        """Get a cached table structure if it has not expired."""
+        cached = self._schema_cache.get((self.config.id, table_name))
+        if cached and time.monotonic() - cached[0] < SCHEMA_CACHE_TTL:
+            return cached[1]
+        return None
+
+    def invalidate_schema_cache(self, table_name: str = None):
+        """
+        Drop cached table structures for this database.
+
+        Args:
+            table_name: Table to invalidate, or None for every table
+        """
+        for key in list(self._schema_cache):
+            if key[0] == self.config.id and (table_name is None or key[1] == table_name):
+                self._schema_cache.pop(key, None)
+
     def _create_mysql_triggers_with_full_data(self, cursor, table_name: str, changelog_table: str,
                                               pk_columns: List[str], db_id: str):
         """Create MySQL triggers that store complete record data."""
@@ -790,10 +1400,11 @@ class DatabaseManager:
         FOR EACH ROW
         INSERT INTO {changelog_table} 
         (operation, table_name, primary_key_values, change_data, database_id)
-        VALUES ('INSERT', '{table_name}', 
+        SELECT 'INSERT', '{table_name}', 
                 JSON_OBJECT({pk_json_new}), 
                 JSON_OBJECT({all_cols_json_new}), 
-                '{db_id}')
+                '{db_id}'
+                FROM DUAL WHERE @sync_suppress IS NULL
         """
 
         # UPDATE trigger - stores both old and new values
@@ -803,11 +1414,12 @@ class DatabaseManager:
         FOR EACH ROW
         INSERT INTO {changelog_table} 
         (operation, table_name, primary_key_values, change_data, database_id)
-        VALUES ('UPDATE', '{table_name}', 
+        SELECT 'UPDATE', '{table_name}', 
                 JSON_OBJECT({pk_json_new}), 
                 JSON_OBJECT('old', JSON_OBJECT({all_cols_json_old}), 
                            'new', JSON_OBJECT({all_cols_json_new})), 
-                '{db_id}')
+                '{db_id}'
+                FROM DUAL WHERE @sync_suppress IS NULL
         """
 
         # DELETE trigger - stores old values
@@ -817,10 +1429,11 @@ class DatabaseManager:
         FOR EACH ROW
         INSERT INTO {changelog_table} 
         (operation, table_name, primary_key_values, change_data, database_id)
-        VALUES ('DELETE', '{table_name}', 
+        SELECT 'DELETE', '{table_name}', 
                 JSON_OBJECT({pk_json_old}), 
                 JSON_OBJECT({all_cols_json_old}), 
-                '{db_id}')
+                '{db_id}'
+                FROM DUAL WHERE @sync_suppress IS NULL
         """
 
         # Drop existing triggers first
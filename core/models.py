@@ -19,6 +19,10 @@ class SyncDirection(Enum):
     BIDIRECTIONAL = "bidirectional"
 
 
+# Direct lookup for decoding stored directions without going through Enum.__call__
+_SYNC_DIR_BY_VALUE = {direction.value: direction for direction in SyncDirection}
+
+
 class JobStatus(Enum):
     """Enum for synchronization job status."""
     STOPPED = "Stopped"
@@ -64,7 +68,20 @@ class DatabaseConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        # Every field is a scalar, so build the dict directly instead of
+        # paying for asdict's recursive copy
+        return {
+            'id': self.id,
+            'name': self.name,
+            'db_type': self.db_type,
+            'host': self.host,
+            'port': self.port,
+            'database': self.database,
+            'username': self.username,
+            'password': self.password,
+            'is_local': self.is_local,
+            'connection_timeout': self.connection_timeout
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DatabaseConfig':
@@ -91,6 +108,8 @@ class TableSyncConfig:
     last_sync: Optional[str] = None
     is_enabled: bool = True
     conflict_resolution: str = "newer_wins"  # newer_wins, local_wins, cloud_wins
+    last_full_reconcile: Optional[str] = None
+    full_reconcile_interval: int = 3600  # 1 hour default
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -99,7 +118,9 @@ class TableSyncConfig:
             'sync_direction': self.sync_direction.value,  # Convert enum to string
             'last_sync': self.last_sync,
             'is_enabled': self.is_enabled,
-            'conflict_resolution': self.conflict_resolution
+            'conflict_resolution': self.conflict_resolution,
+            'last_full_reconcile': self.last_full_reconcile,
+            'full_reconcile_interval': self.full_reconcile_interval
         }
 
     @classmethod
@@ -108,14 +129,16 @@ class TableSyncConfig:
         # Convert string back to enum
         sync_direction = data['sync_direction']
         if isinstance(sync_direction, str):
-            sync_direction = SyncDirection(sync_direction)
+            sync_direction = _SYNC_DIR_BY_VALUE.get(sync_direction) or SyncDirection(sync_direction)
 
         return cls(
             table_name=data['table_name'],
             sync_direction=sync_direction,
             last_sync=data.get('last_sync'),
             is_enabled=data.get('is_enabled', True),
-            conflict_resolution=data.get('conflict_resolution', 'newer_wins')
+            conflict_resolution=data.get('conflict_resolution', 'newer_wins'),
+            last_full_reconcile=data.get('last_full_reconcile'),
+            full_reconcile_interval=data.get('full_reconcile_interval', 3600)
         )
 
 
@@ -5,14 +5,106 @@ This module contains the core logic for synchronizing data between
 local and cloud databases based on change records.
 """
 
+import base64
+import binascii
 import logging
-from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+import random
+import re
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from decimal import Decimal
+from typing import List, Dict, Any, Optional, Tuple, Sequence, Callable
 from contextlib import contextmanager
 
 from .models import DatabasePair, TableSyncConfig, SyncDirection, SyncResult, ChangeRecord
 from .database_manager import DatabaseManager
-from utils.constants import MAX_RETRY_ATTEMPTS, RETRY_DELAY
+from utils.constants import (
+    MAX_BATCH_SIZE, MAX_RETRY_ATTEMPTS, RETRY_DELAY, MAX_RETRY_DELAY,
+    BULK_STATEMENT_SIZE, EXECUTE_MANY_CHUNK_SIZE, TABLE_SYNC_WORKERS, STREAM_CHUNK_SIZE,
+    STATUS_RESULTS_LIMIT
+)
+
+# Strings that may hold a date or timestamp written as ISO text
+_ISO_DATE_PREFIX = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _canonical_value(value: Any) -> Any:
+    """
+    Normalize a column value so equal data compares equal across drivers.
+
+    Changelog JSON carries dates, timestamps and binary values as strings,
+    while drivers return native objects, and dialects disagree on numeric
+    and boolean types. Both sides of a primary key match go through here.
+    """
+    if value is None or type(value) is int:
+        return value
+    if isinstance(value, str):
+        if _ISO_DATE_PREFIX.match(value):
+            try:
+                return datetime.fromisoformat(value).isoformat()
+            except ValueError:
+                return value
+        if value.startswith('\\x'):
+            # PostgreSQL bytea rendered as JSON text
+            try:
+                return bytes.fromhex(value[2:])
+            except ValueError:
+                return value
+        if value.startswith('base64:type'):
+            # MySQL binary values rendered as JSON text
+            try:
+                return base64.b64decode(value.rsplit(':', 1)[1], validate=True)
+            except (binascii.Error, ValueError):
+                return value
+        return value
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, date):
+        return datetime.combine(value, dt_time()).isoformat()
+    if isinstance(value, dt_time):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    return value
+
+
+def _canonical_key(values: Sequence[Any]) -> tuple:
+    """Normalize a primary key value tuple with _canonical_value."""
+    return tuple(_canonical_value(value) for value in values)
+
+
+def _pk_values_key(pk_values: Dict[str, Any]) -> tuple:
+    """Build a hashable, column-order independent key from changelog primary key values."""
+    return tuple(sorted((column, _canonical_value(value)) for column, value in pk_values.items()))
+
+
+def _changelog_time(value: Any, utc_offset: timedelta) -> Optional[datetime]:
+    """
+    Convert a changelog timestamp to an aware UTC datetime.
+
+    Args:
+        value: Timestamp as returned by the driver or its string form
+        utc_offset: Session time zone offset of the database that wrote it
+
+    Returns:
+        UTC datetime, or None if the value cannot be parsed
+    """
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(str(value))
+        except ValueError:
+            return None
+
+    if value.tzinfo is None:
+        return (value - utc_offset).replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
 
 
 class SyncEngine:
@@ -30,9 +122,46 @@ class SyncEngine:
         self.cloud_manager = DatabaseManager(db_pair.cloud_db)
         self.logger = logging.getLogger(self.__class__.__name__)
 
-        self.sync_results = []
+        # Pairs are rebuilt from config on every change, so the enabled table
+        # list is fixed for the lifetime of this engine
+        self._sync_tables = tuple(db_pair.get_sync_enabled_tables())
+
+        # Only the most recent results are reported by get_sync_status
+        self.sync_results: deque = deque(maxlen=STATUS_RESULTS_LIMIT)
+        self._status_results: Optional[List[Dict[str, Any]]] = None  # Serialized for get_sync_status
         self.is_running = False
 
+        # Server-side row hashes are built from each dialect's text form of
+        # the values, which only agree between databases of the same type;
+        # mixed pairs compare decoded values instead
+        self._compare_by_value = db_pair.local_db.db_type != db_pair.cloud_db.db_type
+
+        # Highest timestamp column value seen per (source database id, table)
+        # by the last table comparison; later comparisons only examine newer rows
+        self._timestamp_watermarks: Dict[Tuple[str, str], Any] = {}
+
+        # Statements keyed by (table, operation, dialect, columns, primary
+        # key columns), each with the record columns its parameters bind to
+        self._sql_templates: Dict[Tuple, Tuple[str, Tuple[str, ...]]] = {}
+
+        # Changes that exhausted their retries, keyed by (database id, table,
+        # change id). They stay pending and are retried once per later sync
+        # instead of stalling the batch with backoff again
+        self._dead_letters: Dict[Tuple[str, str, int], ChangeRecord] = {}
+
+        # (change, source record, guard column) for changes that failed inside
+        # a batch transaction; they are retried with backoff after it commits
+        self._deferred_changes: List[Tuple[ChangeRecord, Optional[dict], Optional[str]]] = []
+
+        # Highest changelog id per database id and table, read once per sync,
+        # and the head each (database id, table) changelog was last fully
+        # drained at; a table whose head has not moved has nothing pending
+        self._changelog_heads: Dict[str, Dict[str, int]] = {}
+        self._drained_heads: Dict[Tuple[str, str], int] = {}
+
+        # Engines syncing individual tables on worker threads
+        self._table_workers: List['SyncEngine'] = []
+
     def setup_sync_infrastructure(self) -> bool:
         """
         Set up changelog tables and triggers for all sync-enabled tables.
@@ -53,7 +182,12 @@ class SyncEngine:
                 return False
 
             success = True
-            sync_tables = self.db_pair.get_sync_enabled_tables()
+            sync_tables = self._sync_tables
+
+            # Setup usually follows schema changes, so reread table structures
+            self.local_manager.invalidate_schema_cache()
+            self.cloud_manager.invalidate_schema_cache()
+            self._sql_templates.clear()
 
             for table_config in sync_tables:
                 table_name = table_config.table_name
@@ -117,7 +251,7 @@ class SyncEngine:
                 return False
 
             success = True
-            sync_tables = self.db_pair.get_sync_enabled_tables()
+            sync_tables = self._sync_tables
 
             for table_config in sync_tables:
                 table_name = table_config.table_name
@@ -157,7 +291,8 @@ class SyncEngine:
         """
         self.logger.info(f"Starting sync for database pair: {self.db_pair.name}")
         self.is_running = True
-        self.sync_results = []
+        self.sync_results.clear()
+        self._status_results = None
 
         try:
             # Connect to both databases
@@ -171,18 +306,30 @@ class SyncEngine:
                 error_result.add_error("Failed to connect to cloud database")
                 return [error_result]
 
-            sync_tables = self.db_pair.get_sync_enabled_tables()
+            sync_tables = self._sync_tables
 
             if not sync_tables:
                 self.logger.info("No tables configured for synchronization")
                 return []
 
-            for table_config in sync_tables:
-                if not self.is_running:
-                    self.logger.info("Sync stopped by user")
-                    break
+            # One query per database shows which changelogs gained entries
+            table_names = [table_config.table_name for table_config in sync_tables]
+            self._changelog_heads.clear()
+            self._changelog_heads[self.db_pair.local_db.id] = self.local_manager.get_changelog_heads(table_names)
+            self._changelog_heads[self.db_pair.cloud_db.id] = self.cloud_manager.get_changelog_heads(table_names)
+
+            if len(sync_tables) > 1 and self._can_sync_tables_concurrently():
+                results = self._sync_tables_concurrently(sync_tables)
+            else:
+                results = []
+                for table_config in sync_tables:
+                    if not self.is_running:
+                        self.logger.info("Sync stopped by user")
+                        break
+
+                    results.append(self.sync_table(table_config))
 
-                result = self.sync_table(table_config)
+            for table_config, result in zip(sync_tables, results):
                 self.sync_results.append(result)
 
                 # Update last sync time if successful
@@ -192,13 +339,13 @@ class SyncEngine:
             # Update database pair last sync time
             self.db_pair.last_sync = datetime.now().isoformat()
 
-            successful_syncs = sum(1 for result in self.sync_results if result.success)
-            total_records = sum(result.records_synced for result in self.sync_results)
+            successful_syncs = sum(1 for result in results if result.success)
+            total_records = sum(result.records_synced for result in results)
 
             self.logger.info(f"Sync completed: {successful_syncs}/{len(sync_tables)} tables, "
                              f"{total_records} records synchronized")
 
-            return self.sync_results
+            return results
 
         except Exception as e:
             self.logger.error(f"Error during sync: {e}")
@@ -207,9 +354,69 @@ class SyncEngine:
             return [error_result]
         finally:
             self.is_running = False
+            self._status_results = None
             self.local_manager.disconnect()
             self.cloud_manager.disconnect()
 
+    def _can_sync_tables_concurrently(self) -> bool:
+        """
+        Check whether tables of this pair can be synced on parallel connections.
+
+        SQLite allows a single writer per database file, so concurrent table
+        syncs against it would only wait on each other's locks.
+        """
+        return (TABLE_SYNC_WORKERS > 1 and
+                'sqlite' not in (self.db_pair.local_db.db_type, self.db_pair.cloud_db.db_type))
+
+    def _sync_tables_concurrently(self, sync_tables: Sequence[TableSyncConfig]) -> List[SyncResult]:
+        """
+        Synchronize tables in parallel, each on its own pair of connections.
+
+        Args:
+            sync_tables: Table configurations to sync
+
+        Returns:
+            Sync results in the same order as sync_tables
+        """
+        max_workers = min(TABLE_SYNC_WORKERS, len(sync_tables))
+        self.logger.info(f"Syncing {len(sync_tables)} tables with {max_workers} workers")
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='table-sync') as executor:
+            futures = [executor.submit(self._sync_table_on_worker, table_config)
+                       for table_config in sync_tables]
+            results = [future.result() for future in futures]
+
+        self._table_workers = []
+        return results
+
+    def _sync_table_on_worker(self, table_config: TableSyncConfig) -> SyncResult:
+        """Synchronize one table with a dedicated engine and connections."""
+        worker = SyncEngine(self.db_pair)
+        worker._timestamp_watermarks = self._timestamp_watermarks
+        worker._sql_templates = self._sql_templates
+        worker._dead_letters = self._dead_letters
+        worker._changelog_heads = self._changelog_heads
+        worker._drained_heads = self._drained_heads
+        worker.is_running = self.is_running
+        self._table_workers.append(worker)
+
+        if not worker.is_running:
+            result = SyncResult(success=False, table_name=table_config.table_name)
+            result.add_error("Sync stopped by user")
+            return result
+
+        try:
+            if not worker.local_manager.connect() or not worker.cloud_manager.connect():
+                result = SyncResult(success=False, table_name=table_config.table_name)
+                result.add_error("Failed to connect to databases")
+                return result
+
+            return worker.sync_table(table_config)
+
+        finally:
+            worker.local_manager.disconnect()
+            worker.cloud_manager.disconnect()
+
     def sync_table(self, table_config: TableSyncConfig) -> SyncResult:
         """
         Synchronize a single table based on its configuration.
@@ -236,40 +443,54 @@ class SyncEngine:
                 self.logger.debug(f"Table {table_name} is set to NO_SYNC, skipping")
                 return result
 
-            total_synced = 0
+            # The full table comparison is expensive, so it only runs when due;
+            # otherwise the changelog alone drives the sync
+            reconcile_due = self._is_full_reconcile_due(table_config)
 
-            if direction == SyncDirection.LOCAL_TO_CLOUD:
-                synced = self._sync_one_way(
-                    table_name, self.local_manager, self.cloud_manager,
-                    table_config.last_sync, self.db_pair.cloud_db.id
-                )
-                total_synced += synced
+            local_to_cloud = (self.local_manager, self.cloud_manager, self.db_pair.cloud_db.id)
+            cloud_to_local = (self.cloud_manager, self.local_manager, self.db_pair.local_db.id)
 
+            if direction == SyncDirection.LOCAL_TO_CLOUD:
+                passes = [local_to_cloud]
             elif direction == SyncDirection.CLOUD_TO_LOCAL:
-                synced = self._sync_one_way(
-                    table_name, self.cloud_manager, self.local_manager,
-                    table_config.last_sync, self.db_pair.local_db.id
-                )
-                total_synced += synced
+                passes = [cloud_to_local]
+            else:
+                passes = [local_to_cloud, cloud_to_local]
 
-            elif direction == SyncDirection.BIDIRECTIONAL:
-                # Sync local to cloud
-                synced1 = self._sync_one_way(
-                    table_name, self.local_manager, self.cloud_manager,
-                    table_config.last_sync, self.db_pair.cloud_db.id
-                )
+            if not reconcile_due and all(self._is_changelog_drained(source_manager, table_name)
+                                         for source_manager, _, _ in passes):
+                self.logger.debug(f"No new changelog entries for {table_name}, skipping")
+                result.end_time = datetime.now().isoformat()
+                return result
 
-                # Sync cloud to local
-                synced2 = self._sync_one_way(
-                    table_name, self.cloud_manager, self.local_manager,
-                    table_config.last_sync, self.db_pair.local_db.id
+            # Apply the changelog in every direction first, then reconcile the
+            # table once; in bidirectional mode a single comparison covers both
+            # directions instead of scanning the table twice
+            total_synced = 0
+            full_reconcile = reconcile_due
+            # Conflicts can only arise when both sides send changes
+            conflict_resolution = table_config.conflict_resolution if len(passes) > 1 else None
+
+            for source_manager, target_manager, exclude_db_id in passes:
+                synced, complete = self._apply_pending_changelog(
+                    table_name, source_manager, target_manager,
+                    exclude_db_id, conflict_resolution
                 )
+                total_synced += synced
+                full_reconcile = full_reconcile or not complete
 
-                total_synced = synced1 + synced2
+            source_manager, target_manager, _ = passes[0]
+            total_synced += self._reconcile_full(
+                table_name, source_manager, target_manager,
+                bidirectional=len(passes) > 1, force=full_reconcile
+            )
 
             result.records_synced = total_synced
             result.end_time = datetime.now().isoformat()
 
+            if reconcile_due:
+                table_config.last_full_reconcile = result.start_time
+
             if total_synced > 0:
                 self.logger.info(f"Successfully synced {total_synced} records for table {table_name}")
             else:
@@ -284,266 +505,671 @@ class SyncEngine:
             result.end_time = datetime.now().isoformat()
             return result
 
-    def _sync_one_way(self, table_name: str, source_manager: DatabaseManager,
-                      target_manager: DatabaseManager, last_sync: str = None,
-                      exclude_db_id: str = None) -> int:
+    def _is_full_reconcile_due(self, table_config: TableSyncConfig) -> bool:
+        """Check whether a table's periodic full comparison sync is due."""
+        if not table_config.last_full_reconcile:
+            return True
+
+        try:
+            last_run = datetime.fromisoformat(table_config.last_full_reconcile)
+        except ValueError:
+            return True
+
+        return (datetime.now() - last_run).total_seconds() >= table_config.full_reconcile_interval
+
+    def _is_changelog_drained(self, source_manager: DatabaseManager, table_name: str) -> bool:
+        """Check whether a changelog has had no new entries since it was last drained."""
+        head = self._changelog_heads.get(source_manager.config.id, {}).get(table_name)
+        return head is not None and self._drained_heads.get((source_manager.config.id, table_name)) == head
+
+    def _apply_pending_changelog(self, table_name: str, source_manager: DatabaseManager,
+                                 target_manager: DatabaseManager,
+                                 exclude_db_id: str = None,
+                                 conflict_resolution: str = None) -> Tuple[int, bool]:
         """
-        Perform one-way synchronization from source to target.
-        Now includes intelligent data comparison based on timestamps and record counts.
+        Apply pending source changelog entries to the target.
+
+        Args:
+            table_name: Name of the table to sync
+            source_manager: Source database manager
+            target_manager: Target database manager
+            exclude_db_id: Database ID whose changes should be skipped
+            conflict_resolution: Strategy for changes that conflict with
+                unsynced target changes, or None to apply every change
+
+        Returns:
+            Tuple of (number of changes applied, whether every pending change
+            was applied); a False flag means the tables may have diverged
         """
         try:
-            # First, try changelog-based sync for real-time changes
+            drain_key = (source_manager.config.id, table_name)
+            head = self._changelog_heads.get(source_manager.config.id, {}).get(table_name)
+
+            # The synced flag and the changelog id are the cursor: entries are
+            # read in id order and marked once settled, so no wall-clock filter
+            # is needed and entries left over from a partial batch are not lost
             pending_changes = source_manager.get_pending_changes(
-                table_name, last_sync, exclude_db_id
+                table_name, exclude_db_id=exclude_db_id
             )
+            drained = len(pending_changes) < MAX_BATCH_SIZE
+            complete = True
 
             changelog_synced = 0
             if pending_changes:
                 self.logger.info(f"Processing {len(pending_changes)} changelog entries for {table_name}")
 
-                applied_ids = []
-                for change in pending_changes:
-                    if not self.is_running:
-                        break
+                pending_changes, superseded = self._coalesce_changes(pending_changes)
+
+                # With newer_wins, the upsert itself also leaves target rows
+                # with a later modification time alone
+                guard_column = None
+                if conflict_resolution == 'newer_wins':
+                    guard_column = self._find_modified_column(target_manager.get_table_structure(table_name))
+
+                overridden = {}
+                if conflict_resolution:
+                    pending_changes, rejected_ids, overridden = self._resolve_conflicts_bulk(
+                        table_name, pending_changes, target_manager, conflict_resolution
+                    )
+                    # Losing changes are settled; the winning version reaches
+                    # this database from the other side
+                    if rejected_ids:
+                        rejected_ids.extend([superseded_id for change_id in rejected_ids
+                                             for superseded_id in superseded.get(change_id, ())])
+                        source_manager.mark_changes_synced(table_name, rejected_ids)
+
+                # get_pending_changes caps the batch at MAX_BATCH_SIZE, so the
+                # whole batch is applied in one transaction and costs a single
+                # commit; changes are only marked synced once it commits
+                self._deferred_changes = []
+                applied_ids = self._run_in_transaction(
+                    target_manager, self._apply_changes, table_name, pending_changes,
+                    target_manager, guard_column
+                )
 
-                    if self._apply_change_with_retry(change, target_manager):
-                        applied_ids.append(change.id)
-                    else:
-                        self.logger.warning(f"Failed to apply change {change.id} for table {table_name}")
+                # Changes that failed inside the batch are retried once it has
+                # committed, so backing off does not hold the target's lock
+                applied_ids.extend(self._retry_deferred_changes(target_manager))
 
-                # Mark successfully applied changes as synced
+                if len(applied_ids) < len(pending_changes):
+                    drained = False
+                    complete = False
+
+                # Mark successfully applied changes, and the entries they
+                # superseded, as synced
                 if applied_ids:
-                    source_manager.mark_changes_synced(table_name, applied_ids)
                     changelog_synced = len(applied_ids)
+                    target_ids = [target_id for change_id in applied_ids
+                                  for target_id in overridden.get(change_id, ())]
+                    applied_ids.extend([superseded_id for change_id in applied_ids
+                                        for superseded_id in superseded.get(change_id, ())])
+                    source_manager.mark_changes_synced(table_name, applied_ids)
 
-            # Then, perform full table comparison sync
-            self.logger.info(f"Performing full table comparison sync for {table_name}")
-            comparison_synced = self._compare_and_sync_table_data(
-                table_name, source_manager, target_manager
-            )
+                    # Target changes overwritten by a winning change must
+                    # not be sent back
+                    if target_ids:
+                        target_manager.mark_changes_synced(table_name, target_ids)
 
-            total_synced = changelog_synced + comparison_synced
+            if drained and head is not None:
+                self._drained_heads[drain_key] = head
 
-            if total_synced > 0:
-                self.logger.info(f"Synced {total_synced} records for {table_name} "
-                                 f"({changelog_synced} from changelog, {comparison_synced} from comparison)")
-            else:
-                self.logger.debug(f"No changes to sync for table {table_name}")
+            if changelog_synced > 0:
+                self.logger.info(f"Synced {changelog_synced} records for {table_name} from changelog")
 
-            return total_synced
+            return changelog_synced, complete
 
         except Exception as e:
-            self.logger.error(f"Failed one-way sync for {table_name}: {e}")
+            self.logger.error(f"Failed to apply changelog for {table_name}: {e}")
+            return 0, False
+
+    def _reconcile_full(self, table_name: str, source_manager: DatabaseManager,
+                        target_manager: DatabaseManager, bidirectional: bool = False,
+                        force: bool = True) -> int:
+        """
+        Reconcile table contents by comparing row digests.
+
+        Unless forced, the comparison only runs when the row counts of the
+        two tables disagree.
+
+        Args:
+            table_name: Name of the table to sync
+            source_manager: Source database manager
+            target_manager: Target database manager
+            bidirectional: Also copy rows the target has and the source lacks,
+                or holds a newer copy of, back to the source
+            force: Compare even when the row counts match
+
+        Returns:
+            Number of records synchronized
+        """
+        counts = (self._get_table_count(source_manager, table_name),
+                  self._get_table_count(target_manager, table_name))
+        if not force and counts[0] == counts[1]:
             return 0
 
-    def _apply_change_with_retry(self, change: ChangeRecord, target_manager: DatabaseManager) -> bool:
+        self.logger.info(f"Performing full table comparison sync for {table_name}")
+        comparison_synced = self._run_in_transaction(
+            target_manager, self._compare_and_sync_table_data,
+            table_name, source_manager, target_manager, bidirectional, counts
+        )
+
+        if comparison_synced > 0:
+            self.logger.info(f"Synced {comparison_synced} records for {table_name} from comparison")
+
+        return comparison_synced
+
+    def _coalesce_changes(self, changes: List[ChangeRecord]) -> Tuple[List[ChangeRecord], Dict[int, List[int]]]:
         """
-        Apply a change record with retry logic.
+        Reduce pending changes to the last change recorded for each row.
+
+        Inserts and updates copy the current source row when applied, so only
+        the terminal operation per primary key needs to run. A trailing DELETE
+        is always kept, since the target may already hold the row from a
+        previous comparison sync.
 
         Args:
-            change: Change record to apply
+            changes: Pending change records, ordered by timestamp
+
+        Returns:
+            Tuple of (changes to apply in order, mapping of each kept change
+            id to the ids of the earlier changes it supersedes)
+        """
+        keys = [_pk_values_key(change.primary_key_values) for change in changes]
+        last_index = {key: index for index, key in enumerate(keys)}
+
+        kept = []
+        superseded = {}
+        for index, change in enumerate(changes):
+            terminal = changes[last_index[keys[index]]]
+            if terminal is change:
+                kept.append(change)
+            else:
+                superseded.setdefault(terminal.id, []).append(change.id)
+
+        if len(kept) < len(changes):
+            self.logger.debug(f"Coalesced {len(changes) - len(kept)} superseded changelog entries")
+
+        return kept, superseded
+
+    def _apply_changes(self, table_name: str, changes: List[ChangeRecord],
+                       target_manager: DatabaseManager, guard_column: str = None) -> Sequence[int]:
+        """
+        Apply a list of change records to the target database.
+
+        Args:
+            table_name: Name of the table
+            changes: Change records to apply, in order
             target_manager: Target database manager
+            guard_column: Timestamp column; target rows with a newer value
+                are not overwritten
 
         Returns:
-            True if change applied successfully, False otherwise
+            IDs of the changes that were applied successfully
         """
-        for attempt in range(MAX_RETRY_ATTEMPTS):
-            try:
-                if self._apply_change(change, target_manager):
-                    return True
+        # Packed 64-bit ids instead of a list of int objects
+        applied_ids = array('q')
+        run = []
 
-                if attempt < MAX_RETRY_ATTEMPTS - 1:
-                    self.logger.warning(f"Retrying change application (attempt {attempt + 1})")
-                    import time
-                    time.sleep(RETRY_DELAY)
+        # Consecutive changes of the same kind are applied together; keeping
+        # runs in order preserves DELETE/INSERT ordering for the same row
+        for change in changes:
+            if not self.is_running:
+                break
 
-            except Exception as e:
-                self.logger.error(f"Error applying change (attempt {attempt + 1}): {e}")
-                if attempt < MAX_RETRY_ATTEMPTS - 1:
-                    import time
-                    time.sleep(RETRY_DELAY)
+            if run and (change.operation == 'DELETE') != (run[0].operation == 'DELETE'):
+                applied_ids.extend(self._apply_run(table_name, run, target_manager, guard_column))
+                run = []
 
-        return False
+            run.append(change)
+
+        if run and self.is_running:
+            applied_ids.extend(self._apply_run(table_name, run, target_manager, guard_column))
+
+        return applied_ids
+
+    def _apply_run(self, table_name: str, changes: List[ChangeRecord],
+                   target_manager: DatabaseManager, guard_column: str = None) -> List[int]:
+        """Apply a run of changes that are all DELETEs or all INSERT/UPDATEs."""
+        if changes[0].operation == 'DELETE':
+            applied_ids = self._apply_deletes(table_name, changes, target_manager)
+        else:
+            applied_ids = self._apply_writes(table_name, changes, target_manager, guard_column)
+
+        if len(applied_ids) < len(changes):
+            self.logger.warning(f"Failed to apply {len(changes) - len(applied_ids)} changes for table {table_name}")
 
-    def _apply_change(self, change: ChangeRecord, target_manager: DatabaseManager) -> bool:
+        return applied_ids
+
+    def _apply_writes(self, table_name: str, changes: List[ChangeRecord],
+                      target_manager: DatabaseManager, guard_column: str = None) -> List[int]:
         """
-        Apply a single change record to the target database.
+        Apply a run of INSERT/UPDATE changes in batches.
+
+        Source rows are read with one query per chunk of keys, then upserted
+        into the target with one executemany per chunk.
 
         Args:
-            change: Change record to apply
+            table_name: Name of the table
+            changes: INSERT/UPDATE change records
             target_manager: Target database manager
+            guard_column: Timestamp column; target rows with a newer value
+                are not overwritten
 
         Returns:
-            True if applied successfully, False otherwise
+            IDs of the changes that were applied successfully
         """
-        try:
-            operation = change.operation
-            table_name = change.table_name
-            pk_values = change.primary_key_values
+        applied_ids = []
+        source_manager = self.local_manager if target_manager == self.cloud_manager else self.cloud_manager
 
-            if operation == 'INSERT':
-                return self._apply_insert(table_name, change, target_manager)
-            elif operation == 'UPDATE':
-                return self._apply_update(table_name, change, target_manager)
-            elif operation == 'DELETE':
-                return self._apply_delete(table_name, pk_values, target_manager)
-            else:
-                self.logger.error(f"Unknown operation type: {operation}")
-                return False
+        # Group by primary key column set so each statement has a fixed shape
+        groups = {}
+        for change in changes:
+            groups.setdefault(tuple(change.primary_key_values), []).append(change)
 
-        except Exception as e:
-            self.logger.error(f"Failed to apply change: {e}")
-            return False
+        for pk_columns, group in groups.items():
+            if not pk_columns:
+                applied_ids.extend(c.id for c in group
+                                   if self._apply_change_with_retry(c, target_manager, guard_column=guard_column))
+                continue
 
-    def _apply_insert(self, table_name: str, change: ChangeRecord, target_manager: DatabaseManager) -> bool:
-        """Apply an INSERT operation."""
-        try:
-            # Get the complete record data from source database using primary key
-            source_manager = self.local_manager if target_manager == self.cloud_manager else self.cloud_manager
+            pk_columns = list(pk_columns)
+            keys = [tuple(c.primary_key_values[col] for col in pk_columns) for c in group]
 
-            # Build query to get full record
-            pk_conditions = []
-            pk_params = []
+            source_rows = self._fetch_rows_by_pk(source_manager, table_name, pk_columns, keys)
 
-            for col, val in change.primary_key_values.items():
-                if source_manager.config.db_type == 'sqlite':
-                    pk_conditions.append(f"{col} = ?")
+            rows = []
+            for change, key in zip(group, keys):
+                record = source_rows.get(key)
+                if record is None:
+                    self.logger.warning(f"Source record not found for {change.operation.lower()}: "
+                                        f"{change.primary_key_values}")
                 else:
-                    pk_conditions.append(f"{col} = %s")
-                pk_params.append(val)
+                    rows.append((change, record))
 
-            # Get the complete record from source
-            select_query = f"SELECT * FROM {table_name} WHERE {' AND '.join(pk_conditions)}"
-            records = source_manager.execute_query(select_query, tuple(pk_params))
+            def apply_single(change, record):
+                return self._apply_change_with_retry(change, target_manager, record, guard_column)
 
-            if not records:
-                self.logger.warning(f"Source record not found for insert: {change.primary_key_values}")
-                return False
+            written = self._write_rows(table_name, pk_columns, rows, target_manager, apply_single, guard_column)
+            applied_ids.extend(change.id for change in written)
 
-            record = records[0]
+        return applied_ids
 
-            # Check if record already exists in target
-            check_query = f"SELECT COUNT(*) as count FROM {table_name} WHERE {' AND '.join(pk_conditions)}"
-            results = target_manager.execute_query(check_query, tuple(pk_params))
+    def _fetch_rows_by_pk(self, manager: DatabaseManager, table_name: str, pk_columns: List[str],
+                          keys: List[tuple], columns: str = '*') -> Dict[tuple, dict]:
+        """
+        Fetch rows for many primary keys with one query per chunk of keys.
 
-            if results and results[0].get('count', 0) > 0:
-                self.logger.debug(f"Record already exists in {table_name}, skipping insert")
-                return True
+        Args:
+            manager: Database manager to read from
+            table_name: Name of the table
+            pk_columns: Primary key column names
+            keys: Primary key value tuples, ordered like pk_columns
+            columns: Column list to select
+
+        Returns:
+            Dictionary mapping the requested primary key tuples to rows
+        """
+        rows = {}
+        keys_per_statement = max(1, BULK_STATEMENT_SIZE // len(pk_columns))
+
+        # Keys decoded from changelog JSON can differ in type from what the
+        # driver returns (a DATE key arrives as a string), so rows that do
+        # not match a requested key directly are matched on canonical values
+        requested = set(keys)
+        by_canonical = None
+
+        for start in range(0, len(keys), keys_per_statement):
+            chunk = keys[start:start + keys_per_statement]
+            condition = manager.build_pk_in_clause(pk_columns, len(chunk))
+            params = tuple(value for key in chunk for value in key)
+
+            for row in manager.execute_query(f"SELECT {columns} FROM {table_name} WHERE {condition}", params):
+                key = tuple(row[col] for col in pk_columns)
+                if key not in requested:
+                    if by_canonical is None:
+                        by_canonical = {_canonical_key(k): k for k in keys}
+                    key = by_canonical.get(_canonical_key(key))
+                    if key is None:
+                        continue
+                rows[key] = row
+
+        return rows
+
+    def _write_rows(self, table_name: str, pk_columns: List[str], rows: List[Tuple[Any, dict]],
+                    target_manager: DatabaseManager, fallback: Callable[[Any, dict], bool],
+                    guard_column: str = None) -> List[Any]:
+        """
+        Upsert source rows into the target in bulk.
 
-            # Build INSERT statement
-            columns = list(record.keys())
-            values = [record[col] for col in columns]
+        Args:
+            table_name: Name of the table
+            pk_columns: Primary key column names
+            rows: (tag, source record) pairs; tags identify rows to the caller
+            target_manager: Target database manager
+            fallback: Called per row with (tag, record) if its batch fails
+            guard_column: Timestamp column; target rows with a newer value
+                are not overwritten
 
-            if target_manager.config.db_type == 'sqlite':
-                placeholders = ', '.join(['?' for _ in columns])
-            else:
-                placeholders = ', '.join(['%s' for _ in columns])
+        Returns:
+            Tags of the rows that were written
+        """
+        if not rows:
+            return []
 
-            insert_query = f"""
-            INSERT INTO {table_name} ({', '.join(columns)}) 
-            VALUES ({placeholders})
-            """
+        columns = list(rows[0][1].keys())
+        params = [tuple(record[col] for col in columns) for _, record in rows]
 
-            result = target_manager.execute_query(insert_query, tuple(values))
+        written = []
+        for start in range(0, len(rows), EXECUTE_MANY_CHUNK_SIZE):
+            chunk = rows[start:start + EXECUTE_MANY_CHUNK_SIZE]
 
-            if result and result[0].get('affected_rows', 0) > 0:
-                self.logger.info(f"Inserted record into {table_name}: {change.primary_key_values}")
-                return True
+            with target_manager.savepoint():
+                affected = target_manager.bulk_upsert(table_name, columns,
+                                                      params[start:start + EXECUTE_MANY_CHUNK_SIZE],
+                                                      pk_columns, guard_column)
+
+            if affected is not None:
+                written.extend(tag for tag, _ in chunk)
+                self.logger.info(f"Upserted {len(chunk)} records in {table_name}")
             else:
-                self.logger.error(f"Failed to insert record into {table_name}")
-                return False
+                # Batch failed, fall back to writing rows one at a time
+                for tag, record in chunk:
+                    with target_manager.savepoint():
+                        if fallback(tag, record):
+                            written.append(tag)
 
-        except Exception as e:
-            self.logger.error(f"Failed to apply INSERT: {e}")
-            return False
+        return written
 
-    def _apply_update(self, table_name: str, change: ChangeRecord, target_manager: DatabaseManager) -> bool:
-        """Apply an UPDATE operation."""
-        try:
-            # Get the complete updated record from source
-            source_manager = self.local_manager if target_manager == self.cloud_manager else self.cloud_manager
+    def _apply_deletes(self, table_name: str, changes: List[ChangeRecord],
+                       target_manager: DatabaseManager) -> List[int]:
+        """
+        Apply a run of DELETE changes using one statement per chunk of keys.
+
+        Deleting a row that is already gone is not an error, so affected row
+        counts are not checked per primary key.
+
+        Args:
+            table_name: Name of the table
+            changes: DELETE change records
+            target_manager: Target database manager
+
+        Returns:
+            IDs of the changes that were applied successfully
+        """
+        applied_ids = []
+
+        # Group by primary key column set so each statement has a fixed shape
+        groups = {}
+        for change in changes:
+            groups.setdefault(tuple(change.primary_key_values), []).append(change)
 
-            pk_conditions = []
-            pk_params = []
+        for pk_columns, group in groups.items():
+            if not pk_columns:
+                applied_ids.extend(c.id for c in group if self._apply_change_with_retry(c, target_manager))
+                continue
 
-            for col, val in change.primary_key_values.items():
-                if source_manager.config.db_type == 'sqlite':
-                    pk_conditions.append(f"{col} = ?")
+            rows_per_statement = max(1, BULK_STATEMENT_SIZE // len(pk_columns))
+
+            for start in range(0, len(group), rows_per_statement):
+                chunk = group[start:start + rows_per_statement]
+                condition = target_manager.build_pk_in_clause(list(pk_columns), len(chunk))
+                params = tuple(c.primary_key_values[col] for c in chunk for col in pk_columns)
+
+                with target_manager.savepoint():
+                    results = target_manager.execute_query(f"DELETE FROM {table_name} WHERE {condition}", params)
+
+                if results:
+                    applied_ids.extend(c.id for c in chunk)
+                    self.logger.info(f"Deleted {results[0].get('affected_rows', 0)} records from {table_name} "
+                                     f"for {len(chunk)} delete changes")
                 else:
-                    pk_conditions.append(f"{col} = %s")
-                pk_params.append(val)
+                    # Bulk statement failed, fall back to row-by-row deletes
+                    applied_ids.extend(c.id for c in chunk if self._apply_change_with_retry(c, target_manager))
 
-            # Get current record from source
-            select_query = f"SELECT * FROM {table_name} WHERE {' AND '.join(pk_conditions)}"
-            records = source_manager.execute_query(select_query, tuple(pk_params))
+        return applied_ids
 
-            if not records:
-                self.logger.warning(f"Source record not found for update: {change.primary_key_values}")
-                return False
+    def _run_in_transaction(self, manager: DatabaseManager, operation, *args):
+        """
+        Run an operation inside a single transaction on the given manager.
 
-            record = records[0]
+        Writes made inside the transaction are not recorded by the manager's
+        changelog triggers, so applied changes are not echoed back. Failing
+        rows are isolated with savepoints by the apply helpers; if the
+        transaction still fails it is rolled back and the operation is re-run
+        with each statement in its own untracked transaction, so one bad row
+        cannot block the rest and nothing is echoed back either.
 
-            # Check if target record exists
-            check_query = f"SELECT COUNT(*) as count FROM {table_name} WHERE {' AND '.join(pk_conditions)}"
-            results = target_manager.execute_query(check_query, tuple(pk_params))
+        Args:
+            manager: Database manager whose writes should be grouped
+            operation: Callable performing the writes
+            *args: Arguments passed to the operation
 
-            if not results or results[0].get('count', 0) == 0:
-                # Record doesn't exist, treat as insert
-                self.logger.info(f"Target record not found, inserting instead of updating: {table_name}")
-                return self._apply_insert(table_name, change, target_manager)
+        Returns:
+            Whatever the operation returns
+        """
+        try:
+            with manager.transaction(), manager.suppress_change_tracking():
+                return operation(*args)
+        except Exception as e:
+            self.logger.error(f"Batched transaction on {manager.config.name} failed, "
+                              f"retrying with per-statement transactions: {e}")
+            # Changes queued by the failed batch are attempted again by the re-run
+            self._deferred_changes = []
+            with manager.untracked_statements():
+                return operation(*args)
+
+    def _get_sql_template(self, manager: DatabaseManager, table_name: str, operation: str,
+                          columns, pk_columns, guard_column: str = None) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Get a statement for a table, building it on first use.
 
-            # Build UPDATE statement
-            pk_columns = set(change.primary_key_values.keys())
-            update_columns = [col for col in record.keys() if col not in pk_columns]
+        Args:
+            manager: Database manager the statement will run on
+            table_name: Name of the table
+            operation: One of 'SELECT', 'UPSERT', 'UPDATE' or 'DELETE'
+            columns: Record columns written by UPSERT/UPDATE, in record order
+            pk_columns: Primary key column names
+            guard_column: Timestamp column an UPDATE or UPSERT must not move
+                backwards
 
-            if not update_columns:
-                self.logger.debug(f"No non-primary key columns to update for {table_name}")
-                return True
+        Returns:
+            Tuple of (SQL statement, record columns to bind in order). The
+            statement is empty for an UPDATE with no non-key columns.
+        """
+        key = (table_name, operation, manager.config.db_type, tuple(columns), tuple(pk_columns), guard_column)
+        template = self._sql_templates.get(key)
+        if template is not None:
+            return template
+
+        columns = list(columns)
+        pk_columns = list(pk_columns)
+        placeholder = manager.param_marker
+        where_clause = ' AND '.join(f"{col} = {placeholder}" for col in pk_columns)
+
+        if operation == 'SELECT':
+            template = (f"SELECT * FROM {table_name} WHERE {where_clause}", tuple(pk_columns))
+        elif operation == 'DELETE':
+            template = (f"DELETE FROM {table_name} WHERE {where_clause}", tuple(pk_columns))
+        elif operation == 'UPSERT':
+            template = (manager.build_upsert(table_name, columns, pk_columns, guard_column=guard_column),
+                        tuple(columns))
+        elif operation == 'UPDATE':
+            update_columns = [col for col in columns if col not in pk_columns]
+            if update_columns:
+                set_clause = ', '.join(f"{col} = {placeholder}" for col in update_columns)
+                param_columns = update_columns + pk_columns
+                if guard_column:
+                    where_clause += (f" AND ({guard_column} IS NULL OR {placeholder} IS NULL"
+                                     f" OR {guard_column} < {placeholder})")
+                    param_columns += [guard_column, guard_column]
+                template = (f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}",
+                            tuple(param_columns))
+            else:
+                template = ('', ())
+        else:
+            raise ValueError(f"Unknown statement type: {operation}")
+
+        self._sql_templates[key] = template
+        return template
+
+    def _apply_change_with_retry(self, change: ChangeRecord, target_manager: DatabaseManager,
+                                 record: dict = None, guard_column: str = None) -> bool:
+        """
+        Apply a change record with retry logic.
+
+        Inside a batch transaction a change gets a single attempt, since
+        backing off there would hold the target's write lock; a failed change
+        is queued for _retry_deferred_changes instead. Otherwise retries back
+        off exponentially with jitter. A change that already exhausted its
+        retries in an earlier sync is only attempted once.
+
+        Args:
+            change: Change record to apply
+            target_manager: Target database manager
+            record: Source row already fetched for an INSERT/UPDATE, if any
+            guard_column: Timestamp column; a target row with a newer value
+                is not overwritten
+
+        Returns:
+            True if change applied successfully, False otherwise
+        """
+        dead_letter_key = (change.database_id, change.table_name, change.id)
+        dead_lettered = dead_letter_key in self._dead_letters
+        in_transaction = target_manager._in_transaction
+        attempts = 1 if dead_lettered or in_transaction else MAX_RETRY_ATTEMPTS
+
+        for attempt in range(attempts):
+            try:
+                # A failed attempt only rolls back its own statements
+                with target_manager.savepoint():
+                    applied = self._apply_change(change, target_manager, record, guard_column)
+
+                if applied:
+                    self._dead_letters.pop(dead_letter_key, None)
+                    return True
+
+                if attempt < attempts - 1:
+                    self.logger.warning(f"Retrying change application (attempt {attempt + 1})")
+
+            except Exception as e:
+                self.logger.error(f"Error applying change (attempt {attempt + 1}): {e}")
+
+            if attempt < attempts - 1:
+                time.sleep(min(MAX_RETRY_DELAY, RETRY_DELAY * (2 ** attempt)) * (0.5 + random.random()))
+
+        if in_transaction and not dead_lettered:
+            self._deferred_changes.append((change, record, guard_column))
+        else:
+            self._dead_letters[dead_letter_key] = change
+        return False
+
+    def _retry_deferred_changes(self, target_manager: DatabaseManager) -> List[int]:
+        """
+        Retry the changes that failed inside a batch transaction.
+
+        Runs after the batch has committed; each statement gets its own
+        untracked transaction, so the backoff between attempts holds no lock.
+
+        Args:
+            target_manager: Target database manager
 
-            if target_manager.config.db_type == 'sqlite':
-                set_clauses = [f"{col} = ?" for col in update_columns]
+        Returns:
+            IDs of the changes that were applied successfully
+        """
+        deferred, self._deferred_changes = self._deferred_changes, []
+        if not deferred:
+            return []
+
+        self.logger.info(f"Retrying {len(deferred)} changes that failed in the batch")
+
+        applied_ids = []
+        with target_manager.untracked_statements():
+            for change, record, guard_column in deferred:
+                if not self.is_running:
+                    break
+
+                if self._apply_change_with_retry(change, target_manager, record, guard_column):
+                    applied_ids.append(change.id)
+
+        return applied_ids
+
+    def _apply_change(self, change: ChangeRecord, target_manager: DatabaseManager,
+                      record: dict = None, guard_column: str = None) -> bool:
+        """
+        Apply a single change record to the target database.
+
+        Args:
+            change: Change record to apply
+            target_manager: Target database manager
+            record: Source row already fetched for an INSERT/UPDATE, if any
+            guard_column: Timestamp column; a target row with a newer value
+                is not overwritten
+
+        Returns:
+            True if applied successfully, False otherwise
+        """
+        try:
+            operation = change.operation
+            table_name = change.table_name
+            pk_values = change.primary_key_values
+
+            if operation in ('INSERT', 'UPDATE'):
+                return self._apply_upsert(table_name, change, target_manager, record, guard_column)
+            elif operation == 'DELETE':
+                return self._apply_delete(table_name, pk_values, target_manager)
             else:
-                set_clauses = [f"{col} = %s" for col in update_columns]
+                self.logger.error(f"Unknown operation type: {operation}")
+                return False
 
-            update_values = [record[col] for col in update_columns]
-            update_values.extend(pk_params)  # Add PK values for WHERE clause
+        except Exception as e:
+            self.logger.error(f"Failed to apply change: {e}")
+            return False
 
-            update_query = f"""
-            UPDATE {table_name} 
-            SET {', '.join(set_clauses)}
-            WHERE {' AND '.join(pk_conditions)}
-            """
+    def _apply_upsert(self, table_name: str, change: ChangeRecord, target_manager: DatabaseManager,
+                      record: dict = None, guard_column: str = None) -> bool:
+        """Apply an INSERT or UPDATE operation by upserting the source row (fetched if not given)."""
+        try:
+            pk_columns = tuple(change.primary_key_values)
+
+            if record is None:
+                # Get the complete record data from source database using primary key
+                source_manager = self.local_manager if target_manager == self.cloud_manager else self.cloud_manager
+
+                select_query, _ = self._get_sql_template(source_manager, table_name, 'SELECT', (), pk_columns)
+                records = source_manager.execute_query(select_query, tuple(change.primary_key_values.values()))
 
-            result = target_manager.execute_query(update_query, tuple(update_values))
+                if not records:
+                    self.logger.warning(f"Source record not found for {change.operation.lower()}: "
+                                        f"{change.primary_key_values}")
+                    return False
+
+                record = records[0]
+
+            # A single upsert replaces the separate existence check and
+            # INSERT/UPDATE round-trips
+            upsert_query, param_columns = self._get_sql_template(
+                target_manager, table_name, 'UPSERT', record.keys(), pk_columns, guard_column
+            )
+            result = target_manager.execute_query(upsert_query, tuple(record[col] for col in param_columns))
 
-            if result and result[0].get('affected_rows', 0) > 0:
-                self.logger.info(f"Updated record in {table_name}: {change.primary_key_values}")
+            # MySQL reports 0 affected rows when the existing row was already
+            # identical, so any non-error result counts as applied
+            if result:
+                self.logger.info(f"Upserted record into {table_name}: {change.primary_key_values}")
                 return True
             else:
-                self.logger.warning(f"No rows updated in {table_name}: {change.primary_key_values}")
-                return True  # Consider successful if no rows affected (idempotent)
+                self.logger.error(f"Failed to upsert record into {table_name}")
+                return False
 
         except Exception as e:
-            self.logger.error(f"Failed to apply UPDATE: {e}")
+            self.logger.error(f"Failed to apply {change.operation}: {e}")
             return False
 
     def _apply_delete(self, table_name: str, pk_values: Dict[str, Any], target_manager: DatabaseManager) -> bool:
         """Apply a DELETE operation."""
         try:
-            # Build WHERE clause for primary key
-            pk_conditions = []
-            pk_params = []
-
-            for col, val in pk_values.items():
-                if target_manager.config.db_type == 'sqlite':
-                    pk_conditions.append(f"{col} = ?")
-                else:
-                    pk_conditions.append(f"{col} = %s")
-                pk_params.append(val)
-
-            # Execute delete
-            delete_query = f"DELETE FROM {table_name} WHERE {' AND '.join(pk_conditions)}"
-            results = target_manager.execute_query(delete_query, tuple(pk_params))
+            delete_query, _ = self._get_sql_template(target_manager, table_name, 'DELETE', (), pk_values)
+            results = target_manager.execute_query(delete_query, tuple(pk_values.values()))
 
             if results and results[0].get('affected_rows', 0) > 0:
                 self.logger.info(f"Deleted record from {table_name} with PK: {pk_values}")
@@ -557,7 +1183,8 @@ class SyncEngine:
             return False
 
     def _compare_and_sync_table_data(self, table_name: str, source_manager: DatabaseManager,
-                                     target_manager: DatabaseManager) -> int:
+                                     target_manager: DatabaseManager, bidirectional: bool = False,
+                                     counts: Tuple[int, int] = None) -> int:
         """
         Compare table data between source and target and sync based on timestamps and record count.
 
@@ -565,6 +1192,8 @@ class SyncEngine:
             table_name: Name of the table to sync
             source_manager: Source database manager
             target_manager: Target database manager
+            bidirectional: Also sync rows from the target back to the source
+            counts: (source, target) row counts if already known
 
         Returns:
             Number of records synchronized
@@ -587,77 +1216,177 @@ class SyncEngine:
             # Find timestamp/updated_at columns
             timestamp_columns = self._find_timestamp_columns(source_structure)
 
-            # Get record counts
-            source_count = self._get_table_count(source_manager, table_name)
-            target_count = self._get_table_count(target_manager, table_name)
+            # Get record counts, unless the caller already has them
+            if counts:
+                source_count, target_count = counts
+            else:
+                source_count = self._get_table_count(source_manager, table_name)
+                target_count = self._get_table_count(target_manager, table_name)
 
             self.logger.info(f"Table {table_name}: Source={source_count}, Target={target_count} records")
 
-            # If source has no data, nothing to sync
-            if source_count == 0:
+            # If neither side has data to send, nothing to sync
+            if source_count == 0 and (not bidirectional or target_count == 0):
                 return 0
 
-            # Get all records from source
-            source_records = self._get_all_records(source_manager, table_name, timestamp_columns)
+            # With matching counts, only rows modified since the previous
+            # comparison are examined; otherwise the whole table is compared
+            watermark_key = (source_manager.config.id, table_name)
+            target_watermark_key = (target_manager.config.id, table_name)
+            timestamp_column = self._find_modified_column(source_structure)
+            watermark = None
+            target_watermark = None
+            new_watermark = None
+            new_target_watermark = None
+            if timestamp_column:
+                if source_count == target_count:
+                    watermark = self._timestamp_watermarks.get(watermark_key)
+                    if bidirectional:
+                        target_watermark = self._timestamp_watermarks.get(target_watermark_key)
+                        if target_watermark is None:
+                            watermark = None
+                new_watermark = self._get_max_value(source_manager, table_name, timestamp_column)
+                if bidirectional:
+                    new_target_watermark = self._get_max_value(target_manager, table_name, timestamp_column)
+
+            # Compare compact (primary key, row hash) digests instead of full
+            # rows. When comparing by value the digests are keyed by canonical
+            # primary keys, mapped back to each side's own values here
+            column_names = source_structure.get('column_names', [])
+            source_keys = {}
+            target_keys = {}
+            source_digests = self._get_row_digests(source_manager, table_name, pk_columns, column_names,
+                                                   timestamp_column, watermark, source_keys)
+
+            if watermark is None:
+                target_digests = self._get_row_digests(target_manager, table_name, pk_columns, column_names,
+                                                       native_keys=target_keys)
+            else:
+                target_digests = {}
+                if bidirectional:
+                    # Rows modified on either side since the last comparison are
+                    # looked up on the other side by primary key
+                    target_digests = self._get_row_digests(target_manager, table_name, pk_columns,
+                                                           column_names, timestamp_column, target_watermark,
+                                                           target_keys)
+                    source_digests.update(self._get_row_digests_by_pk(
+                        source_manager, table_name, pk_columns, column_names,
+                        [target_keys.get(pk_value, pk_value) for pk_value in target_digests
+                         if pk_value not in source_digests],
+                        source_keys
+                    ))
+
+                self.logger.info(f"Comparing {len(source_digests)} rows of {table_name} "
+                                 f"modified after {watermark}")
+                target_digests.update(self._get_row_digests_by_pk(
+                    target_manager, table_name, pk_columns, column_names,
+                    [source_keys.get(pk_value, pk_value) for pk_value in source_digests
+                     if pk_value not in target_digests],
+                    target_keys
+                ))
+
+            # Existing rows are only overwritten where the source is newer;
+            # the check runs inside the UPDATE, so target timestamps are not
+            # fetched or parsed
+            guard_column = timestamp_columns[0] if timestamp_columns else None
+
+            # Set difference of the item views runs in C rather than as a
+            # per-row Python loop
+            changed_keys = [pk_value for pk_value, _ in source_digests.items() - target_digests.items()]
+            synced_count = self._push_changed_rows(table_name, source_manager, target_manager,
+                                                   pk_columns, changed_keys, target_digests, guard_column,
+                                                   source_keys)
+
+            if bidirectional:
+                # Rows missing from the source flow back, as do rows the target
+                # holds a newer copy of; without a timestamp the source has
+                # already won every conflict above
+                reverse_keys = [pk_value for pk_value, _ in target_digests.items() - source_digests.items()
+                                if guard_column or pk_value not in source_digests]
+                if reverse_keys:
+                    synced_count += self._run_in_transaction(
+                        source_manager, self._push_changed_rows, table_name, target_manager,
+                        source_manager, pk_columns, reverse_keys, source_digests, guard_column, target_keys
+                    )
 
-            if not source_records:
-                return 0
+            if new_watermark is not None:
+                self._timestamp_watermarks[watermark_key] = new_watermark
+            if new_target_watermark is not None:
+                self._timestamp_watermarks[target_watermark_key] = new_target_watermark
 
-            # Get existing records from target for comparison
-            target_records_map = self._get_records_map(target_manager, table_name, pk_columns, timestamp_columns)
+            return synced_count
 
-            synced_count = 0
+        except Exception as e:
+            self.logger.error(f"Failed to compare and sync table data for {table_name}: {e}")
+            return 0
 
-            for record in source_records:
-                # Build primary key for this record
-                pk_value = tuple(record.get(col) for col in pk_columns)
+    def _push_changed_rows(self, table_name: str, source_manager: DatabaseManager,
+                           target_manager: DatabaseManager, pk_columns: List[str],
+                           changed_keys: List[tuple], target_digests: dict,
+                           guard_column: Optional[str], native_keys: dict = None) -> int:
+        """
+        Copy source rows whose digests differ from the target.
 
-                target_record = target_records_map.get(pk_value)
+        Args:
+            table_name: Name of the table
+            source_manager: Source database manager
+            target_manager: Target database manager
+            pk_columns: Primary key column names
+            changed_keys: Primary key values of the rows to copy
+            target_digests: Digests of the target rows, keyed by primary key
+            guard_column: Timestamp column guarding updates, or None
+            native_keys: Source primary key values for canonical keys, when
+                the digests are keyed by canonical values
 
-                should_sync = False
+        Returns:
+            Number of records synchronized
+        """
+        def sync_insert(_pk_value, record):
+            return self._sync_single_record(record, table_name, target_manager, pk_columns)
+
+        # Only rows whose hash differs are fetched in full, a chunk at a
+        # time so memory use does not grow with the table
+        synced_count = 0
+        for start in range(0, len(changed_keys), STREAM_CHUNK_SIZE):
+            chunk_keys = changed_keys[start:start + STREAM_CHUNK_SIZE]
+            fetch_keys = chunk_keys
+            if native_keys:
+                fetch_keys = [native_keys.get(pk_value, pk_value) for pk_value in chunk_keys]
+            source_records = self._fetch_rows_by_pk(source_manager, table_name, pk_columns, fetch_keys)
+
+            inserts = []
+            updates = []
+
+            for pk_value, fetch_key in zip(chunk_keys, fetch_keys):
+                record = source_records.get(fetch_key)
+                if record is None:
+                    continue
 
-                if target_record is None:
+                if pk_value not in target_digests:
                     # Record doesn't exist in target - insert it
-                    should_sync = True
                     self.logger.debug(f"New record for PK {pk_value}")
-                else:
-                    # Record exists - compare timestamps
-                    should_sync = self._should_update_based_on_timestamp(
-                        record, target_record, timestamp_columns
-                    )
+                    inserts.append((pk_value, record))
 
-                    if should_sync:
-                        self.logger.debug(f"Source record newer for PK {pk_value}")
+                else:
+                    updates.append(record)
 
-                if should_sync:
-                    if self._sync_single_record(record, table_name, target_manager, pk_columns,
-                                                target_record is not None):
-                        synced_count += 1
+            synced_count += len(self._write_rows(table_name, pk_columns, inserts,
+                                                 target_manager, sync_insert))
+            synced_count += self._write_guarded_updates(table_name, pk_columns, updates,
+                                                        guard_column, target_manager)
 
-            return synced_count
-
-        except Exception as e:
-            self.logger.error(f"Failed to compare and sync table data for {table_name}: {e}")
-            return 0
+        return synced_count
 
     def _find_timestamp_columns(self, table_structure: dict) -> list:
         """Find columns that likely contain timestamps."""
-        columns = table_structure.get('columns', {})
-        timestamp_columns = []
-
-        # Common timestamp column names and types
-        timestamp_names = ['updated_at', 'modified_at', 'timestamp', 'last_modified', 'created_at']
-        timestamp_types = ['timestamp', 'datetime', 'date']
-
-        for col_name, col_info in columns.items():
-            col_type = col_info.get('type', '').lower()
-
-            # Check by name or type
-            if (col_name.lower() in timestamp_names or
-                    any(ts_type in col_type for ts_type in timestamp_types)):
-                timestamp_columns.append(col_name)
+        # Derived once by get_table_structure before the structure is cached
+        return table_structure.get('timestamp_columns', [])
 
-        return timestamp_columns
+    def _find_modified_column(self, table_structure: dict) -> Optional[str]:
+        """Find the column recording when a row was last modified, if any."""
+        # Creation timestamps do not move on update, so they are not used
+        return next((col for col in self._find_timestamp_columns(table_structure)
+                     if col.lower() in ('updated_at', 'modified_at', 'last_modified')), None)
 
     def _get_table_count(self, manager: DatabaseManager, table_name: str) -> int:
         """Get total record count for a table."""
@@ -668,192 +1397,241 @@ class SyncEngine:
             self.logger.error(f"Failed to get count for {table_name}: {e}")
             return 0
 
-    def _get_all_records(self, manager: DatabaseManager, table_name: str, timestamp_columns: list) -> list:
-        """Get all records from a table, ordered by timestamp if available."""
+    def _get_max_value(self, manager: DatabaseManager, table_name: str, column: str) -> Any:
+        """Get the largest value of a column, or None if the table is empty."""
         try:
-            query = f"SELECT * FROM {table_name}"
-
-            # Order by timestamp columns if available
-            if timestamp_columns:
-                order_cols = ', '.join([f"{col} DESC" for col in timestamp_columns[:1]])  # Use first timestamp column
-                query += f" ORDER BY {order_cols}"
-
-            return manager.execute_query(query)
+            results = manager.execute_query(f"SELECT MAX({column}) AS max_value FROM {table_name}")
+            return results[0]['max_value'] if results else None
         except Exception as e:
-            self.logger.error(f"Failed to get records from {table_name}: {e}")
-            return []
+            self.logger.error(f"Failed to get max {column} for {table_name}: {e}")
+            return None
+
+    def _get_row_digests(self, manager: DatabaseManager, table_name: str, pk_columns: list,
+                         column_names: list, timestamp_column: str = None, since: Any = None,
+                         native_keys: dict = None) -> dict:
+        """
+        Get a map of primary key values to a hash of each row.
 
-    def _get_records_map(self, manager: DatabaseManager, table_name: str, pk_columns: list,
-                         timestamp_columns: list) -> dict:
-        """Get existing records as a map keyed by primary key values."""
+        Within one database type the hash is computed server-side. Across
+        types it is computed here from canonical values, and the map is keyed
+        by canonical primary keys; native_keys then receives each canonical
+        key's value as read. If since is given, only rows whose
+        timestamp_column is later are read.
+        """
         try:
-            records = manager.execute_query(f"SELECT * FROM {table_name}")
-            records_map = {}
+            if self._compare_by_value:
+                query = f"SELECT {', '.join(column_names)} FROM {table_name}"
+            else:
+                row_hash = manager.build_row_hash_expression(column_names)
+                query = f"SELECT {', '.join(pk_columns)}, {row_hash} AS row_hash FROM {table_name}"
+            params = None
+
+            if timestamp_column and since is not None:
+                query += f" WHERE {timestamp_column} > {manager.param_marker}"
+                params = (since,)
+
+            # Stream the scan so only the compact digests are held in memory
+            digests = {}
+            for records in manager.iter_query(query, params):
+                if self._compare_by_value:
+                    for record in records:
+                        self._add_value_digest(digests, record, pk_columns, column_names, native_keys)
+                    continue
 
-            for record in records:
-                pk_value = tuple(record.get(col) for col in pk_columns)
-                records_map[pk_value] = record
+                for record in records:
+                    digests[tuple(record.get(col) for col in pk_columns)] = record['row_hash']
 
-            return records_map
+            return digests
         except Exception as e:
-            self.logger.error(f"Failed to get records map for {table_name}: {e}")
+            self.logger.error(f"Failed to get row digests for {table_name}: {e}")
             return {}
 
-    def _should_update_based_on_timestamp(self, source_record: dict, target_record: dict,
-                                          timestamp_columns: list) -> bool:
-        """Determine if source record should overwrite target based on timestamps."""
-        if not timestamp_columns:
-            # No timestamp columns - always update (source wins)
-            return True
+    def _get_row_digests_by_pk(self, manager: DatabaseManager, table_name: str, pk_columns: list,
+                               column_names: list, keys: List[tuple], native_keys: dict = None) -> dict:
+        """Get the row hashes of the rows with the given primary key values, as _get_row_digests."""
+        if not keys:
+            return {}
 
-        from datetime import datetime
-        import dateutil.parser
+        if self._compare_by_value:
+            rows = self._fetch_rows_by_pk(manager, table_name, pk_columns, keys,
+                                          columns=', '.join(column_names))
+            digests = {}
+            for row in rows.values():
+                self._add_value_digest(digests, row, pk_columns, column_names, native_keys)
+            return digests
+
+        row_hash = manager.build_row_hash_expression(column_names)
+        rows = self._fetch_rows_by_pk(
+            manager, table_name, pk_columns, keys,
+            columns=f"{', '.join(pk_columns)}, {row_hash} AS row_hash"
+        )
+        return {pk_value: row['row_hash'] for pk_value, row in rows.items()}
+
+    def _add_value_digest(self, digests: dict, record: dict, pk_columns: list, column_names: list,
+                          native_keys: Optional[dict]):
+        """Add a row's digest computed from canonical values, keyed by its canonical primary key."""
+        native = tuple(record.get(col) for col in pk_columns)
+        key = _canonical_key(native)
+        digests[key] = hash(_canonical_key([record.get(col) for col in column_names]))
+        if native_keys is not None:
+            native_keys[key] = native
+
+    def _write_guarded_updates(self, table_name: str, pk_columns: List[str], records: List[dict],
+                               guard_column: Optional[str], target_manager: DatabaseManager) -> int:
+        """
+        Update existing target rows unless the target copy is newer.
 
-        try:
-            # Compare first available timestamp column
-            for col in timestamp_columns:
-                source_ts = source_record.get(col)
-                target_ts = target_record.get(col)
+        Each UPDATE carries a "target timestamp is older" predicate on
+        guard_column, so rows modified more recently on the target are left
+        alone without reading them first. A missing timestamp on either side
+        lets the source win.
 
-                if source_ts is None or target_ts is None:
-                    continue
+        Args:
+            table_name: Name of the table
+            pk_columns: Primary key column names
+            records: Source records to write
+            guard_column: Timestamp column to compare, or None to always update
+            target_manager: Target database manager
 
-                # Parse timestamps
-                if isinstance(source_ts, str):
-                    source_dt = dateutil.parser.parse(source_ts)
-                else:
-                    source_dt = source_ts
+        Returns:
+            Number of target rows updated
+        """
+        if not records:
+            return 0
 
-                if isinstance(target_ts, str):
-                    target_dt = dateutil.parser.parse(target_ts)
-                else:
-                    target_dt = target_ts
+        query, param_columns = self._get_sql_template(
+            target_manager, table_name, 'UPDATE', records[0].keys(), pk_columns, guard_column
+        )
+        if not query:
+            return 0  # Nothing to update
 
-                # Source wins if it's newer
-                return source_dt > target_dt
+        params = [tuple(record[col] for col in param_columns) for record in records]
 
-            # If no valid timestamps found, source wins
-            return True
+        updated = 0
+        for start in range(0, len(params), EXECUTE_MANY_CHUNK_SIZE):
+            chunk = params[start:start + EXECUTE_MANY_CHUNK_SIZE]
 
-        except Exception as e:
-            self.logger.error(f"Error comparing timestamps: {e}")
-            return True  # Default to source wins
+            with target_manager.savepoint():
+                affected = target_manager.execute_many(query, chunk)
 
-    def _sync_single_record(self, record: dict, table_name: str, target_manager: DatabaseManager,
-                            pk_columns: list, is_update: bool) -> bool:
-        """Sync a single record to target database."""
-        try:
-            if is_update:
-                # Update existing record
-                set_clauses = []
-                update_values = []
-                where_clauses = []
-                where_values = []
-
-                # Build SET clause for non-PK columns
-                for col, value in record.items():
-                    if col not in pk_columns:
-                        if target_manager.config.db_type == 'sqlite':
-                            set_clauses.append(f"{col} = ?")
-                        else:
-                            set_clauses.append(f"{col} = %s")
-                        update_values.append(value)
-
-                # Build WHERE clause for PK columns
-                for col in pk_columns:
-                    if target_manager.config.db_type == 'sqlite':
-                        where_clauses.append(f"{col} = ?")
-                    else:
-                        where_clauses.append(f"{col} = %s")
-                    where_values.append(record[col])
-
-                if not set_clauses:
-                    return True  # Nothing to update
-
-                query = f"UPDATE {table_name} SET {', '.join(set_clauses)} WHERE {' AND '.join(where_clauses)}"
-                params = update_values + where_values
+            if affected is None:
+                # Batch failed, fall back to updating rows one at a time
+                affected = 0
+                for row_params in chunk:
+                    with target_manager.savepoint():
+                        result = target_manager.execute_query(query, row_params)
+                    if result:
+                        affected += result[0].get('affected_rows', 0)
 
-            else:
-                # Insert new record
-                columns = list(record.keys())
-                values = [record[col] for col in columns]
+            updated += affected
 
-                if target_manager.config.db_type == 'sqlite':
-                    placeholders = ', '.join(['?' for _ in columns])
-                else:
-                    placeholders = ', '.join(['%s' for _ in columns])
+        if updated:
+            self.logger.info(f"Updated {updated} records in {table_name}")
 
-                query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
-                params = values
+        return updated
 
-            # Execute the query
-            result = target_manager.execute_query(query, tuple(params))
-            return result and result[0].get('affected_rows', 0) > 0
+    def _sync_single_record(self, record: dict, table_name: str, target_manager: DatabaseManager,
+                            pk_columns: list) -> bool:
+        """Insert a single record into the target, overwriting it if it appeared meanwhile."""
+        try:
+            query, param_columns = self._get_sql_template(
+                target_manager, table_name, 'UPSERT', record.keys(), pk_columns
+            )
+            result = target_manager.execute_query(query, tuple(record[col] for col in param_columns))
+            return bool(result)
 
         except Exception as e:
             self.logger.error(f"Failed to sync record: {e}")
             return False
 
-    def _resolve_conflict(self, table_name: str, change: ChangeRecord,
-                          target_manager: DatabaseManager, conflict_resolution: str) -> bool:
+    def _resolve_conflicts_bulk(self, table_name: str, changes: List[ChangeRecord],
+                                target_manager: DatabaseManager, conflict_resolution: str
+                                ) -> Tuple[List[ChangeRecord], List[int], Dict[int, List[int]]]:
         """
         Resolve conflicts during bidirectional sync.
 
+        A change conflicts when the target changelog holds unsynced changes
+        to the same row that were made on the target itself. Those entries
+        are read with a single query and matched in memory.
+
         Args:
             table_name: Name of the table
-            change: Change record causing conflict
+            changes: Source change records about to be applied
             target_manager: Target database manager
             conflict_resolution: Resolution strategy (newer_wins, local_wins, cloud_wins)
 
         Returns:
-            True if conflict resolved and change should be applied, False otherwise
+            Tuple of (changes to apply, IDs of the changes rejected, mapping
+            of applied change IDs to the target change IDs they override)
         """
-        try:
-            # Get target record timestamp if it exists
-            pk_conditions = []
-            pk_params = []
-
-            for col, val in change.primary_key_values.items():
-                if target_manager.config.db_type == 'sqlite':
-                    pk_conditions.append(f"{col} = ?")
+        target_changes = target_manager.get_unsynced_changes(table_name, target_manager.config.id)
+        if not target_changes:
+            return changes, [], {}
+
+        # Latest target timestamp and all target entry ids per row
+        latest = {}
+        for row in target_changes:
+            key = _pk_values_key(row['primary_key_values'])
+            timestamp = str(row['timestamp'])
+            if key in latest:
+                latest_timestamp, target_ids = latest[key]
+                target_ids.append(row['id'])
+                if timestamp > latest_timestamp:
+                    latest[key] = (timestamp, target_ids)
+            else:
+                latest[key] = (timestamp, [row['id']])
+
+        source_is_local = target_manager is self.cloud_manager
+
+        # The two changelogs may be written in different session time zones,
+        # so newer_wins compares their timestamps in UTC
+        if conflict_resolution not in ('local_wins', 'cloud_wins'):
+            source_manager = self.local_manager if source_is_local else self.cloud_manager
+            source_offset = source_manager.get_utc_offset()
+            target_offset = target_manager.get_utc_offset()
+
+        accepted = []
+        rejected = []
+        overridden = {}
+        for change in changes:
+            conflict = latest.get(_pk_values_key(change.primary_key_values))
+            if conflict is None:
+                accepted.append(change)
+                continue
+
+            target_timestamp, target_ids = conflict
+            if conflict_resolution == 'local_wins':
+                wins = source_is_local
+            elif conflict_resolution == 'cloud_wins':
+                wins = not source_is_local
+            else:
+                source_time = _changelog_time(change.timestamp, source_offset)
+                target_time = _changelog_time(target_timestamp, target_offset)
+                if source_time is None or target_time is None:
+                    wins = str(change.timestamp) > target_timestamp
                 else:
-                    pk_conditions.append(f"{col} = %s")
-                pk_params.append(val)
+                    wins = source_time > target_time
 
-            # Check if there's a conflicting change in target's changelog
-            changelog_table = f"{table_name}_changelog"
-            conflict_query = f"""
-            SELECT MAX(timestamp) as latest_timestamp 
-            FROM {changelog_table}
-            WHERE {' AND '.join([f"JSON_EXTRACT(primary_key_values, '$.{col}') = {'?' if target_manager.config.db_type == 'sqlite' else '%s'}" for col in change.primary_key_values.keys()])}
-            AND database_id = %s
-            """
-
-            params = list(change.primary_key_values.values()) + [target_manager.config.id]
-            results = target_manager.execute_query(conflict_query, tuple(params))
-
-            if results and results[0].get('latest_timestamp'):
-                target_timestamp = results[0]['latest_timestamp']
-                change_timestamp = change.timestamp
-
-                if conflict_resolution == 'newer_wins':
-                    return change_timestamp > target_timestamp
-                elif conflict_resolution == 'local_wins':
-                    return target_manager.config.is_local
-                elif conflict_resolution == 'cloud_wins':
-                    return not target_manager.config.is_local
+            if wins:
+                accepted.append(change)
+                overridden[change.id] = target_ids
+            else:
+                rejected.append(change.id)
 
-            return True  # No conflict found
+        if rejected:
+            self.logger.info(f"Skipping {len(rejected)} changes to {table_name} that lost a conflict "
+                             f"({conflict_resolution})")
 
-        except Exception as e:
-            self.logger.error(f"Error resolving conflict: {e}")
-            return True  # Default to applying the change
+        return accepted, rejected, overridden
 
     def stop_sync(self):
         """Stop the synchronization process."""
         self.logger.info("Stopping synchronization...")
         self.is_running = False
 
+        for worker in list(self._table_workers):
+            worker.is_running = False
+
     def get_sync_status(self) -> Dict[str, Any]:
         """
         Get current synchronization status.
@@ -861,13 +1639,18 @@ class SyncEngine:
         Returns:
             Dictionary containing sync status information
         """
+        # Results only change when a sync runs, so they are serialized once
+        if self._status_results is None:
+            self._status_results = [result.to_dict() for result in self.sync_results]
+
         return {
             'is_running': self.is_running,
             'database_pair': self.db_pair.name,
             'last_sync': self.db_pair.last_sync,
             'total_tables': len(self.db_pair.tables),
-            'sync_enabled_tables': len(self.db_pair.get_sync_enabled_tables()),
-            'last_results': [result.to_dict() for result in self.sync_results[-10:]]  # Last 10 results
+            'sync_enabled_tables': len(self._sync_tables),
+            'failed_changes': len(self._dead_letters),
+            'last_results': self._status_results  # Last STATUS_RESULTS_LIMIT results
         }
 
     def validate_sync_configuration(self) -> List[str]:
@@ -890,12 +1673,12 @@ class SyncEngine:
             # Check if sync-enabled tables exist in both databases
             if not errors:  # Only check tables if connections are working
                 try:
-                    local_tables = set(self.local_manager.get_tables())
-                    cloud_tables = set(self.cloud_manager.get_tables())
-
-                    for table_config in self.db_pair.get_sync_enabled_tables():
-                        table_name = table_config.table_name
+                    # One catalog query per database covers existence and keys
+                    table_names = [table_config.table_name for table_config in self._sync_tables]
+                    local_tables = self.local_manager.get_tables_with_pks(table_names)
+                    cloud_tables = self.cloud_manager.get_tables_with_pks(table_names)
 
+                    for table_name in table_names:
                         if table_name not in local_tables:
                             errors.append(f"Table '{table_name}' not found in local database")
 
@@ -903,15 +1686,11 @@ class SyncEngine:
                             errors.append(f"Table '{table_name}' not found in cloud database")
 
                         # Check for primary keys
-                        if table_name in local_tables:
-                            local_pk = self.local_manager.get_primary_key_columns(table_name)
-                            if not local_pk:
-                                errors.append(f"No primary key found for table '{table_name}' in local database")
-
-                        if table_name in cloud_tables:
-                            cloud_pk = self.cloud_manager.get_primary_key_columns(table_name)
-                            if not cloud_pk:
-                                errors.append(f"No primary key found for table '{table_name}' in cloud database")
+                        if table_name in local_tables and not local_tables[table_name]:
+                            errors.append(f"No primary key found for table '{table_name}' in local database")
+
+                        if table_name in cloud_tables and not cloud_tables[table_name]:
+                            errors.append(f"No primary key found for table '{table_name}' in cloud database")
 
                 except Exception as e:
                     errors.append(f"Error validating table configuration: {e}")
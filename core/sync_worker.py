@@ -6,14 +6,19 @@ while sync operations are running in the background.
 """
 
 import logging
+import threading
 import time
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 
-from PySide6.QtCore import QObject, Signal, QMutex, QWaitCondition
+from PySide6.QtCore import QObject, Signal
 
 from .models import DatabasePair, JobStatus, SyncResult
 from .sync_engine import SyncEngine
+from .connection_pool import connection_pool
+from utils.constants import VALIDATION_CACHE_TTL, PAIR_SYNC_WORKERS, PROGRESS_EMIT_INTERVAL
 
 
 class SyncWorker(QObject):
@@ -21,7 +26,7 @@ class SyncWorker(QObject):
 
     # Signals for communication with UI
     status_changed = Signal(str)  # JobStatus value
-    log_message = Signal(str, str)  # level, message
+    logs_pending = Signal()  # queued messages are ready in take_pending_logs()
     progress_updated = Signal(int)  # progress percentage (0-100)
     sync_completed = Signal(list)  # List of SyncResult objects
     error_occurred = Signal(str)  # Error message
@@ -37,14 +42,26 @@ class SyncWorker(QObject):
         self._stop_requested = False
         self._current_status = JobStatus.STOPPED
 
-        # Thread synchronization
-        self._mutex = QMutex()
-        self._condition = QWaitCondition()
+        # Guards state transitions; single attribute reads need no lock
+        self._state_lock = threading.RLock()
 
         # Sync configuration
         self._db_pairs: List[DatabasePair] = []
         self._sync_engines: Dict[str, SyncEngine] = {}
 
+        # Monotonic time each pair last passed validation
+        self._validation_cache: Dict[str, float] = {}
+
+        # Log messages waiting for the UI; one logs_pending signal covers every
+        # message queued before the UI drains them
+        self._pending_logs: deque = deque()
+        self._log_lock = threading.Lock()
+        self._logs_signalled = False
+
+        # Last emitted progress, used to throttle progress signals
+        self._last_progress = -1
+        self._last_progress_time = 0.0
+
         # Statistics
         self._sync_stats = {
             'total_syncs': 0,
@@ -57,29 +74,17 @@ class SyncWorker(QObject):
     @property
     def is_running(self) -> bool:
         """Check if worker is currently running."""
-        self._mutex.lock()
-        try:
-            return self._is_running
-        finally:
-            self._mutex.unlock()
+        return self._is_running
 
     @property
     def is_scheduled(self) -> bool:
         """Check if scheduled sync is active."""
-        self._mutex.lock()
-        try:
-            return self._is_scheduled
-        finally:
-            self._mutex.unlock()
+        return self._is_scheduled
 
     @property
     def current_status(self) -> JobStatus:
         """Get current job status."""
-        self._mutex.lock()
-        try:
-            return self._current_status
-        finally:
-            self._mutex.unlock()
+        return self._current_status
 
     def set_database_pairs(self, db_pairs: List[DatabasePair]):
         """
@@ -88,27 +93,26 @@ class SyncWorker(QObject):
         Args:
             db_pairs: List of database pair configurations
         """
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             self._db_pairs = db_pairs
             self._sync_engines.clear()
+            self._validation_cache.clear()
+
+            # Drop idle connections that may belong to edited or removed databases
+            connection_pool.close_all()
 
             # Create sync engines for each pair
             for pair in db_pairs:
                 if pair.is_enabled:
                     self._sync_engines[pair.id] = SyncEngine(pair)
 
-            self.log_message.emit("INFO", f"Configured {len(self._sync_engines)} database pairs for sync")
-
-        finally:
-            self._mutex.unlock()
+            self._log("INFO", f"Configured {len(self._sync_engines)} database pairs for sync")
 
     def start_scheduled_sync(self):
         """Start scheduled synchronization."""
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             if self._is_running:
-                self.log_message.emit("WARNING", "Sync already running")
+                self._log("WARNING", "Sync already running")
                 return
 
             if not self._sync_engines:
@@ -119,15 +123,11 @@ class SyncWorker(QObject):
             self._stop_requested = False
             self._update_status(JobStatus.RUNNING)
 
-            self.log_message.emit("INFO", "Scheduled synchronization started")
-
-        finally:
-            self._mutex.unlock()
+            self._log("INFO", "Scheduled synchronization started")
 
     def stop_scheduled_sync(self):
         """Stop scheduled synchronization."""
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             self._is_scheduled = False
             self._stop_requested = True
 
@@ -136,17 +136,13 @@ class SyncWorker(QObject):
                 engine.stop_sync()
 
             self._update_status(JobStatus.STOPPED)
-            self.log_message.emit("INFO", "Scheduled synchronization stopped")
-
-        finally:
-            self._mutex.unlock()
+            self._log("INFO", "Scheduled synchronization stopped")
 
     def run_manual_sync(self):
         """Run a one-time manual synchronization."""
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             if self._is_running:
-                self.log_message.emit("WARNING", "Sync already in progress")
+                self._log("WARNING", "Sync already in progress")
                 return
 
             if not self._sync_engines:
@@ -157,46 +153,33 @@ class SyncWorker(QObject):
             self._stop_requested = False
             self._update_status(JobStatus.RUNNING)
 
-        finally:
-            self._mutex.unlock()
-
         # Run sync in background
         try:
             self._perform_sync_operation("Manual sync")
         finally:
-            self._mutex.lock()
-            try:
+            with self._state_lock:
                 self._is_running = False
                 if not self._is_scheduled:
                     self._update_status(JobStatus.STOPPED)
-            finally:
-                self._mutex.unlock()
 
     def run_scheduled_sync_cycle(self):
         """Run a scheduled sync cycle."""
         if not self.is_scheduled:
             return
 
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             if self._is_running:
-                self.log_message.emit("DEBUG", "Skipping scheduled sync - already running")
+                self._log("DEBUG", "Skipping scheduled sync - already running")
                 return
 
             self._is_running = True
 
-        finally:
-            self._mutex.unlock()
-
         # Run sync in background
         try:
             self._perform_sync_operation("Scheduled sync")
         finally:
-            self._mutex.lock()
-            try:
+            with self._state_lock:
                 self._is_running = False
-            finally:
-                self._mutex.unlock()
 
     def _perform_sync_operation(self, operation_name: str):
         """
@@ -205,90 +188,76 @@ class SyncWorker(QObject):
         Args:
             operation_name: Name of the operation for logging
         """
-        self.log_message.emit("INFO", f"{operation_name} started")
-        start_time = datetime.now()
+        self._log("INFO", f"{operation_name} started")
+        start_time = time.monotonic()
 
         all_results = []
         total_engines = len(self._sync_engines)
         completed_engines = 0
+        progress_lock = threading.Lock()
+        self._last_progress = -1
 
-        try:
-            for pair_id, engine in self._sync_engines.items():
+        def sync_group(engines: List[SyncEngine]) -> List[SyncResult]:
+            nonlocal completed_engines
+            group_results = []
+
+            for engine in engines:
                 if self._stop_requested:
-                    self.log_message.emit("INFO", f"{operation_name} stopped by user")
                     break
 
-                pair_name = engine.db_pair.name
-                self.log_message.emit("INFO", f"Syncing database pair: {pair_name}")
-
-                # Validate configuration before sync
-                validation_errors = engine.validate_sync_configuration()
-                if validation_errors:
-                    self.log_message.emit("ERROR", f"Validation failed for {pair_name}: {'; '.join(validation_errors)}")
-
-                    # Create error result
-                    error_result = SyncResult(success=False, table_name="validation")
-                    for error in validation_errors:
-                        error_result.add_error(error)
-                    all_results.append(error_result)
+                group_results.extend(self._sync_pair(engine))
 
+                with progress_lock:
                     completed_engines += 1
                     self._update_progress(completed_engines, total_engines)
-                    continue
-
-                # Perform sync
-                try:
-                    sync_results = engine.sync_all_tables()
-                    all_results.extend(sync_results)
-
-                    # Log results
-                    successful_tables = sum(1 for result in sync_results if result.success)
-                    total_records = sum(result.records_synced for result in sync_results)
-
-                    self.log_message.emit("INFO",
-                        f"Completed {pair_name}: {successful_tables}/{len(sync_results)} tables, "
-                        f"{total_records} records synced")
-
-                    # Update statistics
-                    self._update_sync_stats(sync_results)
 
-                except Exception as e:
-                    self.log_message.emit("ERROR", f"Error syncing {pair_name}: {e}")
-                    error_result = SyncResult(success=False, table_name="sync_error")
-                    error_result.add_error(str(e))
-                    all_results.append(error_result)
+            return group_results
 
-                completed_engines += 1
-                self._update_progress(completed_engines, total_engines)
+        try:
+            # Pairs sharing a database run one after another; otherwise they
+            # are independent and run in parallel
+            groups = self._group_engines_by_database()
+
+            if len(groups) > 1:
+                with ThreadPoolExecutor(max_workers=min(len(groups), PAIR_SYNC_WORKERS)) as executor:
+                    for group_results in executor.map(sync_group, groups):
+                        all_results.extend(group_results)
+            else:
+                for group in groups:
+                    all_results.extend(sync_group(group))
 
-                # Small delay between pairs to prevent overwhelming the databases
-                if not self._stop_requested and completed_engines < total_engines:
-                    time.sleep(0.5)
+            if self._stop_requested:
+                self._log("INFO", f"{operation_name} stopped by user")
 
             # Complete the operation
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-
-            successful_results = [r for r in all_results if r.success]
-            failed_results = [r for r in all_results if not r.success]
-            total_records = sum(r.records_synced for r in successful_results)
-
-            self.log_message.emit("INFO",
+            # Monotonic clock so wall-clock adjustments cannot skew the duration
+            duration = time.monotonic() - start_time
+
+            # Tally every count in a single pass over the results
+            successful_count = 0
+            total_records = 0
+            for r in all_results:
+                if r.success:
+                    successful_count += 1
+                    total_records += r.records_synced
+            failed_count = len(all_results) - successful_count
+
+            self._log("INFO",
                 f"{operation_name} completed in {duration:.2f}s: "
-                f"{len(successful_results)} successful, {len(failed_results)} failed, "
+                f"{successful_count} successful, {failed_count} failed, "
                 f"{total_records} records synced")
 
             # Update final statistics
             self._sync_stats['total_syncs'] += 1
-            if failed_results:
+            if failed_count:
                 self._sync_stats['failed_syncs'] += 1
             else:
                 self._sync_stats['successful_syncs'] += 1
 
-            self._sync_stats['last_sync_time'] = end_time.isoformat()
+            self._sync_stats['last_sync_time'] = datetime.now().isoformat()
 
-            # Emit completion signal
-            self.sync_completed.emit([result.to_dict() for result in all_results])
+            # Emit completion signal; receivers serialize only what they need
+            self.sync_completed.emit(all_results)
 
             if not self._is_scheduled:
                 self._update_status(JobStatus.COMPLETED)
@@ -301,6 +270,133 @@ class SyncWorker(QObject):
         finally:
             self._update_progress(100, 100)  # Ensure progress shows complete
 
+    def _sync_pair(self, engine: SyncEngine) -> List[SyncResult]:
+        """
+        Validate and synchronize one database pair.
+
+        Args:
+            engine: Sync engine of the pair
+
+        Returns:
+            Sync results for the pair's tables, or a single error result
+        """
+        pair_name = engine.db_pair.name
+        self._log("INFO", f"Syncing database pair: {pair_name}")
+
+        # Validate configuration before sync
+        validation_errors = self._validate_pair(engine.db_pair.id, engine)
+        if validation_errors:
+            self._log("ERROR", f"Validation failed for {pair_name}: {'; '.join(validation_errors)}")
+
+            # Create error result
+            error_result = SyncResult(success=False, table_name="validation")
+            for error in validation_errors:
+                error_result.add_error(error)
+            return [error_result]
+
+        # Perform sync
+        try:
+            sync_results = engine.sync_all_tables()
+
+            # Log results
+            successful_tables = sum(1 for result in sync_results if result.success)
+            total_records = sum(result.records_synced for result in sync_results)
+
+            self._log("INFO",
+                f"Completed {pair_name}: {successful_tables}/{len(sync_results)} tables, "
+                f"{total_records} records synced")
+
+            # Update statistics
+            self._update_sync_stats(sync_results)
+
+            return sync_results
+
+        except Exception as e:
+            self._log("ERROR", f"Error syncing {pair_name}: {e}")
+            error_result = SyncResult(success=False, table_name="sync_error")
+            error_result.add_error(str(e))
+            return [error_result]
+
+    def _group_engines_by_database(self) -> List[List[SyncEngine]]:
+        """
+        Group sync engines so that pairs sharing a database are in one group.
+
+        Returns:
+            Groups of engines, in configuration order
+        """
+        groups: List[List[SyncEngine]] = []
+        group_databases: List[set] = []
+
+        for engine in self._sync_engines.values():
+            databases = {engine.db_pair.local_db.id, engine.db_pair.cloud_db.id}
+
+            # Merge every existing group this pair shares a database with
+            merged = [engine]
+            for index in reversed(range(len(groups))):
+                if group_databases[index] & databases:
+                    merged = groups.pop(index) + merged
+                    databases |= group_databases.pop(index)
+
+            groups.append(merged)
+            group_databases.append(databases)
+
+        return groups
+
+    def _validate_pair(self, pair_id: str, engine: SyncEngine) -> List[str]:
+        """
+        Validate a pair's configuration, reusing a recent passing result.
+
+        Failed validations are not cached, so fixes are picked up on the
+        next cycle.
+
+        Args:
+            pair_id: ID of the database pair
+            engine: Sync engine of the pair
+
+        Returns:
+            List of validation error messages
+        """
+        validated_at = self._validation_cache.get(pair_id)
+        if validated_at is not None and time.monotonic() - validated_at < VALIDATION_CACHE_TTL:
+            return []
+
+        errors = engine.validate_sync_configuration()
+        if errors:
+            self._validation_cache.pop(pair_id, None)
+        else:
+            self._validation_cache[pair_id] = time.monotonic()
+
+        return errors
+
+    def _log(self, level: str, message: str):
+        """
+        Queue a log message for the UI.
+
+        Args:
+            level: Log level name
+            message: Log message
+        """
+        with self._log_lock:
+            self._pending_logs.append((level, message))
+            if self._logs_signalled:
+                return
+            self._logs_signalled = True
+
+        self.logs_pending.emit()
+
+    def take_pending_logs(self) -> List[Tuple[str, str]]:
+        """
+        Take every queued log message.
+
+        Returns:
+            List of (level, message) tuples in the order they were logged
+        """
+        with self._log_lock:
+            messages = list(self._pending_logs)
+            self._pending_logs.clear()
+            self._logs_signalled = False
+        return messages
+
     def _update_status(self, status: JobStatus):
         """Update the current status and emit signal."""
         self._current_status = status
@@ -308,15 +404,24 @@ class SyncWorker(QObject):
         self.logger.debug(f"Status changed to: {status.value}")
 
     def _update_progress(self, completed: int, total: int):
-        """Update and emit progress percentage."""
+        """Update and emit progress percentage, at most once per PROGRESS_EMIT_INTERVAL."""
         if total > 0:
             percentage = min(100, int((completed / total) * 100))
+            now = time.monotonic()
+
+            # Completion is always shown; intermediate steps may be dropped
+            if percentage == self._last_progress or (
+                    percentage < 100 and now - self._last_progress_time < PROGRESS_EMIT_INTERVAL):
+                return
+
+            self._last_progress = percentage
+            self._last_progress_time = now
             self.progress_updated.emit(percentage)
 
     def _update_sync_stats(self, sync_results: List[SyncResult]):
         """Update synchronization statistics."""
-        for result in sync_results:
-            self._sync_stats['total_records_synced'] += result.records_synced
+        with self._state_lock:
+            self._sync_stats['total_records_synced'] += sum(result.records_synced for result in sync_results)
 
     def get_sync_statistics(self) -> Dict[str, Any]:
         """
@@ -325,8 +430,7 @@ class SyncWorker(QObject):
         Returns:
             Dictionary containing sync statistics
         """
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             stats = self._sync_stats.copy()
             stats['is_running'] = self._is_running
             stats['is_scheduled'] = self._is_scheduled
@@ -334,8 +438,6 @@ class SyncWorker(QObject):
             stats['configured_pairs'] = len(self._db_pairs)
             stats['active_engines'] = len(self._sync_engines)
             return stats
-        finally:
-            self._mutex.unlock()
 
     def setup_sync_infrastructure(self) -> bool:
         """
@@ -344,10 +446,9 @@ class SyncWorker(QObject):
         Returns:
             True if setup successful for all pairs, False otherwise
         """
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             if self._is_running:
-                self.log_message.emit("WARNING", "Cannot setup infrastructure while sync is running")
+                self._log("WARNING", "Cannot setup infrastructure while sync is running")
                 return False
 
             if not self._sync_engines:
@@ -357,37 +458,32 @@ class SyncWorker(QObject):
             self._is_running = True
             self._update_status(JobStatus.RUNNING)
 
-        finally:
-            self._mutex.unlock()
-
-        self.log_message.emit("INFO", "Setting up sync infrastructure...")
+        self._log("INFO", "Setting up sync infrastructure...")
+        self._validation_cache.clear()
 
         success = True
         total_pairs = len(self._sync_engines)
         completed_pairs = 0
+        self._last_progress = -1
 
         try:
             for pair_id, engine in self._sync_engines.items():
                 pair_name = engine.db_pair.name
-                self.log_message.emit("INFO", f"Setting up infrastructure for: {pair_name}")
+                self._log("INFO", f"Setting up infrastructure for: {pair_name}")
 
                 if not engine.setup_sync_infrastructure():
-                    self.log_message.emit("ERROR", f"Failed to setup infrastructure for: {pair_name}")
+                    self._log("ERROR", f"Failed to setup infrastructure for: {pair_name}")
                     success = False
                 else:
-                    self.log_message.emit("INFO", f"Successfully set up infrastructure for: {pair_name}")
+                    self._log("INFO", f"Successfully set up infrastructure for: {pair_name}")
 
                 completed_pairs += 1
                 self._update_progress(completed_pairs, total_pairs)
 
-                # Small delay between setups
-                if completed_pairs < total_pairs:
-                    time.sleep(0.5)
-
             if success:
-                self.log_message.emit("INFO", "Sync infrastructure setup completed successfully")
+                self._log("INFO", "Sync infrastructure setup completed successfully")
             else:
-                self.log_message.emit("WARNING", "Sync infrastructure setup completed with errors")
+                self._log("WARNING", "Sync infrastructure setup completed with errors")
 
             return success
 
@@ -397,12 +493,9 @@ class SyncWorker(QObject):
             return False
 
         finally:
-            self._mutex.lock()
-            try:
+            with self._state_lock:
                 self._is_running = False
                 self._update_status(JobStatus.STOPPED)
-            finally:
-                self._mutex.unlock()
 
     def teardown_sync_infrastructure(self) -> bool:
         """
@@ -411,10 +504,9 @@ class SyncWorker(QObject):
         Returns:
             True if teardown successful for all pairs, False otherwise
         """
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             if self._is_running:
-                self.log_message.emit("WARNING", "Cannot teardown infrastructure while sync is running")
+                self._log("WARNING", "Cannot teardown infrastructure while sync is running")
                 return False
 
             if not self._sync_engines:
@@ -424,37 +516,32 @@ class SyncWorker(QObject):
             self._is_running = True
             self._update_status(JobStatus.RUNNING)
 
-        finally:
-            self._mutex.unlock()
-
-        self.log_message.emit("INFO", "Tearing down sync infrastructure...")
+        self._log("INFO", "Tearing down sync infrastructure...")
+        self._validation_cache.clear()
 
         success = True
         total_pairs = len(self._sync_engines)
         completed_pairs = 0
+        self._last_progress = -1
 
         try:
             for pair_id, engine in self._sync_engines.items():
                 pair_name = engine.db_pair.name
-                self.log_message.emit("INFO", f"Removing infrastructure for: {pair_name}")
+                self._log("INFO", f"Removing infrastructure for: {pair_name}")
 
                 if not engine.teardown_sync_infrastructure():
-                    self.log_message.emit("ERROR", f"Failed to teardown infrastructure for: {pair_name}")
+                    self._log("ERROR", f"Failed to teardown infrastructure for: {pair_name}")
                     success = False
                 else:
-                    self.log_message.emit("INFO", f"Successfully removed infrastructure for: {pair_name}")
+                    self._log("INFO", f"Successfully removed infrastructure for: {pair_name}")
 
                 completed_pairs += 1
                 self._update_progress(completed_pairs, total_pairs)
 
-                # Small delay between teardowns
-                if completed_pairs < total_pairs:
-                    time.sleep(0.5)
-
             if success:
-                self.log_message.emit("INFO", "Sync infrastructure teardown completed successfully")
+                self._log("INFO", "Sync infrastructure teardown completed successfully")
             else:
-                self.log_message.emit("WARNING", "Sync infrastructure teardown completed with errors")
+                self._log("WARNING", "Sync infrastructure teardown completed with errors")
 
             return success
 
@@ -464,12 +551,9 @@ class SyncWorker(QObject):
             return False
 
         finally:
-            self._mutex.lock()
-            try:
+            with self._state_lock:
                 self._is_running = False
                 self._update_status(JobStatus.STOPPED)
-            finally:
-                self._mutex.unlock()
 
     def get_database_pair_status(self, pair_id: str) -> Dict[str, Any]:
         """
@@ -481,8 +565,7 @@ class SyncWorker(QObject):
         Returns:
             Dictionary containing pair status information
         """
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             if pair_id in self._sync_engines:
                 engine = self._sync_engines[pair_id]
                 return engine.get_sync_status()
@@ -491,8 +574,6 @@ class SyncWorker(QObject):
                     'error': 'Database pair not found or not enabled',
                     'pair_id': pair_id
                 }
-        finally:
-            self._mutex.unlock()
 
     def validate_all_configurations(self) -> Dict[str, List[str]]:
         """
@@ -501,8 +582,7 @@ class SyncWorker(QObject):
         Returns:
             Dictionary mapping pair IDs to lists of validation errors
         """
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             if self._is_running:
                 return {'error': ['Cannot validate while sync is running']}
 
@@ -514,26 +594,22 @@ class SyncWorker(QObject):
                     validation_results[pair_id] = errors
 
                     if errors:
-                        self.log_message.emit("WARNING",
+                        self._log("WARNING",
                             f"Validation issues found for {engine.db_pair.name}: {len(errors)} errors")
                     else:
-                        self.log_message.emit("INFO",
+                        self._log("INFO",
                             f"Configuration valid for {engine.db_pair.name}")
 
                 except Exception as e:
                     validation_results[pair_id] = [f"Validation error: {e}"]
-                    self.log_message.emit("ERROR",
+                    self._log("ERROR",
                         f"Error validating {engine.db_pair.name}: {e}")
 
             return validation_results
 
-        finally:
-            self._mutex.unlock()
-
     def reset_statistics(self):
         """Reset synchronization statistics."""
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             self._sync_stats = {
                 'total_syncs': 0,
                 'successful_syncs': 0,
@@ -541,14 +617,11 @@ class SyncWorker(QObject):
                 'last_sync_time': None,
                 'total_records_synced': 0
             }
-            self.log_message.emit("INFO", "Sync statistics reset")
-        finally:
-            self._mutex.unlock()
+            self._log("INFO", "Sync statistics reset")
 
     def cleanup(self):
         """Clean up resources and stop all operations."""
-        self._mutex.lock()
-        try:
+        with self._state_lock:
             self._stop_requested = True
             self._is_scheduled = False
 
@@ -565,7 +638,4 @@ class SyncWorker(QObject):
             if self._is_running:
                 self._update_status(JobStatus.STOPPED)
 
-            self.log_message.emit("INFO", "Sync worker cleaned up")
-
-        finally:
-            self._mutex.unlock()
\ No newline at end of file
+            self._log("INFO", "Sync worker cleaned up")
\ No newline at end of file
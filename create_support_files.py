@@ -3,29 +3,36 @@
 Script to create all supporting files needed for the installer
 """
 
-import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def create_config_template():
-    """Create a configuration template file."""
-    template = {
-        "app_password_hash": "d74ff0ee8da3b9806b18c877dbf29bbde50b5bd8e4dad7a3a725000feb82e8f1",
-        "database_pairs": [],
-        "log_level": "INFO",
-        "auto_start": False,
-        "default_sync_interval": 300,
-        "max_log_size": 10,
-        "backup_enabled": True
-    }
-
-    with open('config.json.template', 'w') as f:
-        json.dump(template, f, indent=4)
-    print("✓ Created config.json.template")
-
-def create_readme():
-    """Create a README file for distribution."""
-    readme_content = '''Database Sync Tool v1.0.0
+from _config_defaults import write_config_template
+
+# A minimal ICO file (16x16 black square), built once
+# This is a basic ICO file structure - you should replace with a proper icon
+_ICO_PAYLOAD = bytes([
+    # ICO header
+    0x00, 0x00,  # Reserved
+    0x01, 0x00,  # Type: ICO
+    0x01, 0x00,  # Number of images: 1
+    # Image directory entry
+    0x10,        # Width: 16
+    0x10,        # Height: 16
+    0x00,        # Colors: 0 (256 colors)
+    0x00,        # Reserved
+    0x01, 0x00,  # Planes: 1
+    0x20, 0x00,  # Bits per pixel: 32
+    0x80, 0x04, 0x00, 0x00,  # Image data size: 1152 bytes
+    0x16, 0x00, 0x00, 0x00,  # Image data offset: 22
+]) + bytes(1152)  # Simple black 16x16 bitmap data
+
+# Keeps output from concurrently running generators from interleaving
+_print_lock = threading.Lock()
+
+# Distribution documents, stripped and encoded once
+_README_BYTES = '''Database Sync Tool v1.0.0
 ==========================
 
 A powerful database synchronization tool for keeping your local and cloud databases in sync.
@@ -77,15 +84,9 @@ SUPPORT
 For support and documentation, please contact the developer.
 
 Copyright (C) 2024 Moses Oghene
-'''
-
-    with open('README.txt', 'w', encoding='utf-8') as f:
-        f.write(readme_content.strip())
-    print("✓ Created README.txt")
+'''.strip().encode('utf-8')
 
-def create_license():
-    """Create a basic license file."""
-    license_content = '''MIT License
+_LICENSE_BYTES = '''MIT License
 
 Copyright (c) 2024 Moses Oghene
 
@@ -106,54 +107,71 @@ AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
 LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
-'''
+'''.strip().encode('utf-8')
+
+def _report(*lines):
+    """Print lines together; the generators run on several threads at once."""
+    with _print_lock:
+        print("\n".join(lines))
+
+def create_config_template():
+    """Create a configuration template file."""
+    if write_config_template():
+        _report("✓ Created config.json.template")
+    else:
+        _report("✓ config.json.template is already up to date")
+
+def _write_if_changed(path, payload):
+    """Write payload to path unless the file already holds exactly those bytes."""
+    path = Path(path)
+    try:
+        if path.read_bytes() == payload:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(payload)
+    return True
 
-    with open('LICENSE.txt', 'w', encoding='utf-8') as f:
-        f.write(license_content.strip())
-    print("✓ Created LICENSE.txt")
+def create_readme():
+    """Create a README file for distribution."""
+    if _write_if_changed('README.txt', _README_BYTES):
+        _report("✓ Created README.txt")
+    else:
+        _report("✓ README.txt is already up to date")
+
+def create_license():
+    """Create a basic license file."""
+    if _write_if_changed('LICENSE.txt', _LICENSE_BYTES):
+        _report("✓ Created LICENSE.txt")
+    else:
+        _report("✓ LICENSE.txt is already up to date")
 
 def create_basic_icon():
     """Create a basic icon file if one doesn't exist."""
-    assets_dir = Path('assets')
-    icon_path = assets_dir / 'icon.ico'
+    icon_path = os.path.join('assets', 'icon.ico')
     
-    if icon_path.exists():
-        print(f"✓ Icon already exists: {icon_path}")
+    if os.path.isfile(icon_path):
+        _report(f"✓ Icon already exists: {icon_path}")
         return
     
-    # Create assets directory if it doesn't exist
-    assets_dir.mkdir(exist_ok=True)
-    
-    # Create a minimal ICO file (16x16 black square)
-    # This is a basic ICO file structure - you should replace with a proper icon
-    ico_data = bytes([
-        # ICO header
-        0x00, 0x00,  # Reserved
-        0x01, 0x00,  # Type: ICO
-        0x01, 0x00,  # Number of images: 1
-        # Image directory entry
-        0x10,        # Width: 16
-        0x10,        # Height: 16
-        0x00,        # Colors: 0 (256 colors)
-        0x00,        # Reserved
-        0x01, 0x00,  # Planes: 1
-        0x20, 0x00,  # Bits per pixel: 32
-        0x80, 0x04, 0x00, 0x00,  # Image data size: 1152 bytes
-        0x16, 0x00, 0x00, 0x00,  # Image data offset: 22
-    ])
-    
-    # Add a simple bitmap data (this creates a basic icon)
-    # For a proper icon, you should use an actual ICO file
-    bitmap_data = b'\x00' * 1152  # Simple black 16x16 icon
+    # Create assets directory if it doesn't exist; attempting the mkdir is
+    # one call, where mkdir(exist_ok=True) may check first
+    try:
+        os.mkdir('assets')
+    except FileExistsError:
+        pass
     
     try:
-        with open(icon_path, 'wb') as f:
-            f.write(ico_data + bitmap_data)
-        print(f"✓ Created basic icon: {icon_path}")
-        print("  (You should replace this with a proper icon file)")
+        fd = os.open(icon_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            os.write(fd, _ICO_PAYLOAD)
+        finally:
+            os.close(fd)
+        _report(f"✓ Created basic icon: {icon_path}",
+                "  (You should replace this with a proper icon file)")
     except Exception as e:
-        print(f"✗ Could not create icon: {e}")
-        print("  You'll need to create assets/icon.ico manually")
+        _report(f"✗ Could not create icon: {e}",
+                "  You'll need to create assets/icon.ico manually")
 
 def check_required_files():
     """Check if all required files exist."""
@@ -167,10 +185,21 @@ def check_required_files():
         ('LICENSE.txt', 'License file')
     ]
     
+    # List each parent directory once instead of stat-ing every file
+    listings = {}
+    for file_path, _ in required_files:
+        parent = os.path.dirname(file_path) or '.'
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except OSError:
+                listings[parent] = set()
+    
     all_exist = True
     for file_path, description in required_files:
-        path = Path(file_path)
-        if path.exists():
+        parent = os.path.dirname(file_path) or '.'
+        if os.path.basename(file_path) in listings[parent]:
             print(f"✓ {description}: {file_path}")
         else:
             print(f"✗ {description}: {file_path} - MISSING!")
@@ -182,16 +211,15 @@ if __name__ == "__main__":
     print("Creating supporting files for installer...")
     print("=" * 50)
     
-    # Create all supporting files
-    create_config_template()
-    create_readme()
-    create_license()
-    create_basic_icon()
-    
     # Ensure installer output directory exists
     os.makedirs('dist/installer', exist_ok=True)
     print("✓ Created dist/installer directory")
     
+    # Create all supporting files; they are independent, so the writes overlap
+    generators = [create_config_template, create_readme, create_license, create_basic_icon]
+    with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+        list(executor.map(lambda generate: generate(), generators))
+    
     print("\n" + "=" * 50)
     
     # Check if all required files now exist
@@ -3,10 +3,15 @@
 Debug script to test ISCC availability
 """
 
+import functools
+import shutil
 import subprocess
 import sys
 
+from iscc_debug import run_with_tail
 
+
+@functools.lru_cache(maxsize=1)
 def test_iscc():
     print("Testing ISCC availability...")
     print(f"Python version: {sys.version}")
@@ -14,34 +19,30 @@ def test_iscc():
     print("-" * 50)
 
     try:
-        print("Attempting to run 'iscc'...")
-        result = subprocess.run(['iscc'], capture_output=True, text=True, timeout=10)
+        # Looking ISCC up on PATH is far cheaper than spawning a process
+        # just to find out it is missing
+        iscc_path = shutil.which('iscc')
+        if not iscc_path:
+            print("✗ ISCC not on PATH")
+            return False
+
+        print(f"Attempting to run '{iscc_path}'...")
+        returncode, stdout, stderr = run_with_tail([iscc_path], timeout=10)
 
-        print(f"Return code: {result.returncode}")
-        print(f"STDOUT length: {len(result.stdout) if result.stdout else 0}")
-        print(f"STDERR length: {len(result.stderr) if result.stderr else 0}")
+        print(f"Return code: {returncode}")
+        print(f"STDOUT length: {len(stdout)}")
+        print(f"STDERR length: {len(stderr)}")
 
-        if result.stdout:
+        if stdout:
             print("STDOUT content:")
-            print(result.stdout[:500])  # First 500 chars
+            print(stdout[:500])  # First 500 chars
 
-        if result.stderr:
+        if stderr:
             print("STDERR content:")
-            print(result.stderr[:500])  # First 500 chars
-
-        # Check for success indicators
-        success_indicators = [
-            b'Inno Setup' in result.stderr.encode() if result.stderr else False,
-            b'Inno Setup' in result.stdout.encode() if result.stdout else False,
-            'Inno Setup' in result.stderr if result.stderr else False,
-            'Inno Setup' in result.stdout if result.stdout else False,
-            result.returncode == 1
-        ]
-
-        print(f"Success indicators: {success_indicators}")
-        print(f"Any success indicator True: {any(success_indicators)}")
+            print(stderr[:500])  # First 500 chars
 
-        if result.returncode == 1 and ('Inno Setup' in (result.stderr or '') or 'Inno Setup' in (result.stdout or '')):
+        # ISCC run without a script prints its banner and exits with code 1
+        if returncode == 1 and ('Inno Setup' in stdout or 'Inno Setup' in stderr):
             print("✓ ISCC appears to be working correctly!")
             return True
         else:
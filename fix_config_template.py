@@ -7,25 +7,16 @@ import json
 import os
 from pathlib import Path
 
+from _config_defaults import DEFAULT_CONFIG, TEMPLATE_FILE, write_config_template
+
 def create_default_config_template():
     """Create config template with only default settings."""
-    # Default configuration with 'admin' password hash
-    default_config = {
-        "app_password_hash": "d74ff0ee8da3b9806b18c877dbf29bbde50b5bd8e4dad7a3a725000feb82e8f1",
-        "database_pairs": [],
-        "log_level": "INFO",
-        "auto_start": False,
-        "default_sync_interval": 300,
-        "max_log_size": 10,
-        "backup_enabled": True
-    }
-
-    # Write to config.json.template (this is what the installer will use)
-    template_path = Path('config.json.template')
-    with open(template_path, 'w', encoding='utf-8') as f:
-        json.dump(default_config, f, indent=4)
-    
-    print(f"✓ Created fresh config template: {template_path}")
+    # config.json.template is what the installer will use
+    template_path = Path(TEMPLATE_FILE)
+    if write_config_template():
+        print(f"✓ Created fresh config template: {template_path}")
+    else:
+        print(f"✓ Config template already up to date: {template_path}")
     print("  Password: 'admin'")
     print("  Database pairs: empty")
     return str(template_path)
@@ -36,9 +27,11 @@ def backup_existing_config():
     if config_path.exists():
         backup_path = Path('config.json.backup')
         
-        # Create backup
+        # Create backup; copy beside it first so the swap is atomic
         import shutil
-        shutil.copy2(config_path, backup_path)
+        tmp_path = backup_path.with_name(backup_path.name + '.tmp')
+        shutil.copyfile(config_path, tmp_path)  # Kernel-side copy where available
+        os.replace(tmp_path, backup_path)
         print(f"✓ Backed up existing config to: {backup_path}")
         return str(backup_path)
     else:
@@ -48,17 +41,24 @@ def backup_existing_config():
 def verify_template():
     """Verify the template has correct default values."""
     template_path = Path('config.json.template')
-    if not template_path.exists():
-        print("✗ Template file not found!")
-        return False
     
     try:
-        with open(template_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        # Reading straight away saves a separate existence check
+        try:
+            raw = template_path.read_bytes()
+        except FileNotFoundError:
+            print("✗ Template file not found!")
+            return False
+        config = json.loads(raw)
         
-        # Verify key settings
+        print("\nTemplate verification:")
+        if config == DEFAULT_CONFIG:
+            print("✓ All settings match the defaults (password: 'admin')")
+            return True
+
+        # Only a mismatch needs the per-setting breakdown
         checks = [
-            (config.get('app_password_hash') == 'd74ff0ee8da3b9806b18c877dbf29bbde50b5bd8e4dad7a3a725000feb82e8f1', 
+            (config.get('app_password_hash') == DEFAULT_CONFIG['app_password_hash'], 
              "Password hash matches 'admin'"),
             (config.get('database_pairs') == [], "Database pairs is empty"),
             (config.get('log_level') == 'INFO', "Log level is INFO"),
@@ -68,16 +68,14 @@ def verify_template():
             (config.get('backup_enabled') == True, "Backup is enabled")
         ]
         
-        print("\nTemplate verification:")
-        all_good = True
         for check, description in checks:
             if check:
                 print(f"✓ {description}")
             else:
                 print(f"✗ {description}")
-                all_good = False
         
-        return all_good
+        # Extra keys are fine as long as every checked setting is a default
+        return all(check for check, _ in checks)
         
     except Exception as e:
         print(f"✗ Error reading template: {e}")
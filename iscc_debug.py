@@ -3,42 +3,95 @@
 Debug script to diagnose ISCC compilation issues
 """
 
+import functools
 import subprocess
 import sys
 import shutil
+import threading
+from collections import deque
 from pathlib import Path
 import os
 
+@functools.lru_cache(maxsize=1)
 def find_iscc():
     """Find the Inno Setup Compiler executable on Windows."""
-    # First try using shutil.which
-    iscc_path = shutil.which('iscc')
-    if iscc_path:
-        print(f"Found iscc via shutil.which: {iscc_path}")
-        return iscc_path
-    
-    # Try the exact path we know exists
-    known_path = r"C:\Program Files (x86)\Inno Setup 6\ISCC.exe"
-    if Path(known_path).exists():
-        print(f"Found iscc at known location: {known_path}")
-        return known_path
-    
-    # Try other common paths
-    common_paths = [
+    # Check the install locations first; each is a single stat, while
+    # shutil.which probes every directory on PATH
+    known_paths = [
+        r"C:\Program Files (x86)\Inno Setup 6\ISCC.exe",
         r"C:\Program Files\Inno Setup 6\ISCC.exe",
         r"C:\Program Files (x86)\Inno Setup 5\ISCC.exe", 
         r"C:\Program Files\Inno Setup 5\ISCC.exe",
     ]
     
-    for path in common_paths:
-        if Path(path).exists():
+    for path in known_paths:
+        if os.path.isfile(path):
             print(f"Found iscc at: {path}")
             return path
     
+    iscc_path = shutil.which('iscc')
+    if iscc_path:
+        print(f"Found iscc via shutil.which: {iscc_path}")
+        return iscc_path
+    
     return None
 
+def run_with_tail(cmd, timeout, max_lines=200, cwd=None):
+    """
+    Run a command, keeping only the last lines of its output in memory.
+
+    Returns:
+        Tuple of (return code, stdout tail, stderr tail)
+    """
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               text=True, bufsize=1, cwd=cwd)
+    stdout_tail = deque(maxlen=max_lines)
+    stderr_tail = deque(maxlen=max_lines)
+
+    def pump(stream, tail):
+        for line in stream:
+            tail.append(line)
+        stream.close()
+
+    # Both pipes are drained as the tool writes, so neither can fill up and
+    # block it, and memory stays bounded however verbose the output is
+    threads = [
+        threading.Thread(target=pump, args=(process.stdout, stdout_tail), daemon=True),
+        threading.Thread(target=pump, args=(process.stderr, stderr_tail), daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        for thread in threads:
+            thread.join()
+
+    return process.returncode, ''.join(stdout_tail), ''.join(stderr_tail)
+
+def _walk_files(root, max_entries=2000):
+    """Yield file paths under root, stopping after max_entries files."""
+    # DirEntry carries the file type from the directory listing, so unlike
+    # rglob plus is_file this does not stat every bundled file
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    if max_entries <= 0:
+                        return
+                    max_entries -= 1
+                    yield entry.path
+
 def debug_iscc_compile():
-    """Run ISCC with verbose output to see what's failing."""
+    """Run ISCC and show the errors that make compilation fail."""
     print("Debugging ISCC compilation...")
     print("=" * 50)
     
@@ -76,45 +129,35 @@ def debug_iscc_compile():
     # Check dist directory structure
     print("\nDist directory structure:")
     dist_path = Path('dist')
-    if dist_path.exists():
-        for item in dist_path.rglob('*'):
-            if item.is_file():
-                print(f"  {item}")
+    if dist_path.is_dir():
+        for path in _walk_files(dist_path):
+            print(f"  {path}")
     else:
         print("  dist/ directory not found!")
     
-    # Try to compile with verbose output
+    # Try to compile; quiet mode keeps only the error messages on the pipe
     print("\nRunning ISCC compilation:")
     try:
-        # Use more verbose flags
-        cmd = [iscc_path, '/V9', 'installer.iss']  # /V9 = maximum verbosity
+        cmd = [iscc_path, '/Q', 'installer.iss']  # /Q = print error messages only
         print(f"Command: {' '.join(cmd)}")
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd=Path.cwd()
-        )
+        returncode, stdout, stderr = run_with_tail(cmd, timeout=60, cwd=Path.cwd())
         
-        print(f"\nReturn code: {result.returncode}")
-        print(f"STDOUT length: {len(result.stdout)}")
-        print(f"STDERR length: {len(result.stderr)}")
+        print(f"\nReturn code: {returncode}")
         
-        if result.stdout:
-            print("\n--- STDOUT ---")
-            print(result.stdout)
+        if stdout:
+            print("\n--- STDOUT (last 200 lines) ---")
+            print(stdout)
         
-        if result.stderr:
-            print("\n--- STDERR ---")
-            print(result.stderr)
+        if stderr:
+            print("\n--- STDERR (last 200 lines) ---")
+            print(stderr)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("\n✓ Compilation successful!")
             return True
         else:
-            print(f"\n✗ Compilation failed with exit code {result.returncode}")
+            print(f"\n✗ Compilation failed with exit code {returncode}")
             return False
             
     except subprocess.TimeoutExpired:
@@ -147,19 +190,18 @@ Source: "installer.iss"; DestDir: "{app}"
     if iscc_path:
         try:
             os.makedirs('dist/installer', exist_ok=True)
-            result = subprocess.run([iscc_path, 'test_minimal.iss'], 
-                                  capture_output=True, text=True, timeout=30)
+            returncode, stdout, stderr = run_with_tail([iscc_path, 'test_minimal.iss'], timeout=30)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 print("✓ Minimal script compiled successfully!")
                 print("✓ ISCC is working correctly")
                 return True
             else:
-                print(f"✗ Minimal script failed: {result.returncode}")
-                if result.stdout:
-                    print("STDOUT:", result.stdout[:500])
-                if result.stderr:
-                    print("STDERR:", result.stderr[:500])
+                print(f"✗ Minimal script failed: {returncode}")
+                if stdout:
+                    print("STDOUT:", stdout[:500])
+                if stderr:
+                    print("STDERR:", stderr[:500])
                 return False
         except Exception as e:
             print(f"✗ Error testing minimal script: {e}")
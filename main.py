@@ -9,7 +9,12 @@ Supports command line arguments for startup options and system tray integration.
 import sys
 import os
 import logging
+import faulthandler
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 import tempfile
 
 
@@ -24,17 +29,23 @@ def setup_user_working_directory():
         else:
             app_dir = os.path.join(os.path.expanduser("~"), ".database-sync-tool")
 
-        # Create directory if it doesn't exist
-        os.makedirs(app_dir, exist_ok=True)
+        # A marker left by the first launch means the tree already exists, so
+        # warm launches skip creating the directories altogether
+        marker = os.path.join(app_dir, ".initialized")
+        if not os.path.isfile(marker):
+            # The parent (LOCALAPPDATA or home) always exists, so a plain
+            # mkdir per directory is enough
+            directories = [app_dir] + [os.path.join(app_dir, name) for name in ("logs", "backups", "temp")]
+            for directory in directories:
+                try:
+                    os.mkdir(directory)
+                except FileExistsError:
+                    pass
+            open(marker, 'w').close()
 
         # Change to this directory so ALL relative paths work from here
         os.chdir(app_dir)
 
-        # Create common subdirectories
-        os.makedirs("logs", exist_ok=True)
-        os.makedirs("backups", exist_ok=True)
-        os.makedirs("temp", exist_ok=True)
-
         return app_dir
 
     return None
@@ -44,37 +55,99 @@ def setup_user_working_directory():
 user_app_dir = setup_user_working_directory()
 
 # Add the current directory to Python path for imports
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
 
-from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtGui import QPalette, QColor, QIcon
-from PySide6.QtCore import QTimer
-
-from ui.main_window import MainWindow
+# PySide6 and the UI are imported inside main(); the main window only once
+# the dependency check has passed, so a failed check does not load the UI
 from utils.startup_manager import parse_command_line_args
-from utils.constants import APP_NAME, APP_VERSION, ORGANIZATION_NAME
-
-# Import path management after directory setup
-try:
-    from utils.app_paths import setup_logging, app_paths
-except ImportError:
-    # Fallback if app_paths module is not available
-    def setup_logging():
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_dir / "app.log", encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
-
-
-def setup_application_properties(app: QApplication):
+from utils.constants import APP_NAME, APP_VERSION, ORGANIZATION_NAME, DARK_THEME_COLORS
+
+# Kept open for the life of the process for faulthandler to write to
+_fault_log = None
+
+
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+
+def _fallback_setup_logging():
+    """Log to logs/app.log in the working directory."""
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+
+    # Attach the handlers directly rather than through basicConfig
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    for handler in (logging.FileHandler(log_dir / "app.log", encoding='utf-8', delay=True),
+                    logging.StreamHandler(sys.stdout)):
+        handler.setFormatter(_LOG_FORMATTER)
+        root.addHandler(handler)
+
+
+def setup_logging():
+    """Set up logging, preferring the user-writable paths from utils.app_paths."""
+    # Path management is imported on first use, after directory setup
+    try:
+        from utils.app_paths import setup_logging as configure_logging
+    except ImportError:
+        # Fallback if app_paths module is not available
+        configure_logging = _fallback_setup_logging
+
+    configure_logging()
+
+
+# Dark theme palette roles and the DARK_THEME_COLORS entry for each
+_PALETTE_ROLES = (
+    ("Window", "window"),
+    ("WindowText", "window_text"),
+    ("Base", "base"),
+    ("AlternateBase", "alternate_base"),
+    ("ToolTipBase", "tooltip_base"),
+    ("ToolTipText", "tooltip_text"),
+    ("Text", "text"),
+    ("Button", "button"),
+    ("ButtonText", "button_text"),
+    ("BrightText", "bright_text"),
+    ("Link", "link"),
+    ("Highlight", "highlight"),
+    ("HighlightedText", "highlighted_text"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_icon() -> Optional[str]:
+    """Return the path of the first application icon found, or None."""
+    icon_paths = [
+        os.path.join("assets", "icon.ico"),  # Current directory (user data dir)
+        os.path.join(os.path.dirname(sys.executable), "assets", "icon.ico"),  # Next to exe
+        os.path.join(current_dir, "assets", "icon.ico")  # Original source directory
+    ]
+
+    for icon_path in icon_paths:
+        try:
+            os.stat(icon_path)
+        except OSError:
+            continue
+        return icon_path
+
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _dark_palette():
+    """Build the dark theme palette once from DARK_THEME_COLORS."""
+    from PySide6.QtGui import QPalette, QColor
+
+    palette = QPalette()
+    for role, color_key in _PALETTE_ROLES:
+        palette.setColor(getattr(QPalette, role), QColor(*DARK_THEME_COLORS[color_key]))
+    return palette
+
+
+def setup_application_properties(app: "QApplication"):
     """Set up application properties and styling."""
+    from PySide6.QtGui import QIcon
+
     # Set application properties
     app.setApplicationName(APP_NAME)
     app.setApplicationVersion(APP_VERSION)
@@ -82,37 +155,13 @@ def setup_application_properties(app: QApplication):
     app.setQuitOnLastWindowClosed(False)  # Keep app running when window is closed
 
     # Set application icon - look in original installation directory
-    icon_paths = [
-        Path("assets/icon.ico"),  # Current directory (user data dir)
-        Path(sys.executable).parent / "assets" / "icon.ico",  # Next to exe
-        current_dir / "assets" / "icon.ico"  # Original source directory
-    ]
-
-    for icon_path in icon_paths:
-        if icon_path.exists():
-            app.setWindowIcon(QIcon(str(icon_path)))
-            break
+    icon_path = _find_icon()
+    if icon_path:
+        app.setWindowIcon(QIcon(icon_path))
 
     # Apply a modern dark theme
     app.setStyle("Fusion")
-    dark_palette = QPalette()
-
-    # Define colors
-    dark_palette.setColor(QPalette.Window, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
-    dark_palette.setColor(QPalette.Base, QColor(25, 25, 25))
-    dark_palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ToolTipBase, QColor(0, 0, 0))
-    dark_palette.setColor(QPalette.ToolTipText, QColor(255, 255, 255))
-    dark_palette.setColor(QPalette.Text, QColor(255, 255, 255))
-    dark_palette.setColor(QPalette.Button, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
-    dark_palette.setColor(QPalette.BrightText, QColor(255, 0, 0))
-    dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.HighlightedText, QColor(0, 0, 0))
-
-    app.setPalette(dark_palette)
+    app.setPalette(_dark_palette())
 
 
 def handle_exception(exc_type, exc_value, exc_traceback):
@@ -124,6 +173,19 @@ def handle_exception(exc_type, exc_value, exc_traceback):
     logging.critical("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
 
 
+def enable_fault_handler():
+    """Dump tracebacks of fatal native crashes to logs/fault.log."""
+    global _fault_log
+    # Crashes inside Qt or a database driver kill the process without
+    # reaching sys.excepthook; faulthandler writes from C, so it still works
+    try:
+        os.makedirs("logs", exist_ok=True)
+        _fault_log = open(os.path.join("logs", "fault.log"), 'a', encoding='utf-8')
+        faulthandler.enable(file=_fault_log)
+    except OSError as e:
+        logging.warning(f"Could not enable crash logging: {e}")
+
+
 def override_file_operations():
     """Override common file operations to prevent writing to installation directory."""
     if not getattr(sys, 'frozen', False):
@@ -132,19 +194,26 @@ def override_file_operations():
     # Store original open function
     original_open = open
 
+    # Resolved once; every write below is compared against this prefix
+    install_dir = os.path.normcase(os.path.dirname(os.path.realpath(sys.executable)))
+
     def safe_open(file, mode='r', **kwargs):
         """Wrapper around open() to redirect problematic paths to user directory."""
-        if isinstance(file, (str, Path)):
-            file_path = Path(file)
+        # Reads never need redirecting, so they skip the path checks
+        if 'w' not in mode and 'a' not in mode:
+            return original_open(file, mode, **kwargs)
+
+        if isinstance(file, (str, os.PathLike)):
+            # abspath is pure string work, unlike resolve() which stats
+            # every path component
+            file_path = os.path.abspath(file)
 
             # If trying to write to installation directory, redirect to user directory
-            if 'w' in str(mode) or 'a' in str(mode):
-                install_dir = Path(sys.executable).parent
-                if str(file_path.resolve()).startswith(str(install_dir.resolve())):
-                    # Redirect to current working directory (user data dir)
-                    new_path = Path.cwd() / file_path.name
-                    logging.warning(f"Redirected file write from {file_path} to {new_path}")
-                    file = new_path
+            if os.path.normcase(file_path).startswith(install_dir):
+                # Redirect to current working directory (user data dir)
+                new_path = os.path.join(os.getcwd(), os.path.basename(file_path))
+                logging.warning(f"Redirected file write from {file} to {new_path}")
+                file = new_path
 
         return original_open(file, mode, **kwargs)
 
@@ -158,6 +227,12 @@ def main():
     # Set up exception handling
     sys.excepthook = handle_exception
 
+    # Probing dependencies is mostly sys.path lookups, so it runs in the
+    # background while logging and Qt start up
+    dependency_executor = ThreadPoolExecutor(max_workers=1)
+    dependency_check = dependency_executor.submit(check_dependencies)
+    dependency_executor.shutdown(wait=False)
+
     # Parse command line arguments
     args = parse_command_line_args()
 
@@ -166,14 +241,14 @@ def main():
 
     # Set up logging with proper user paths
     setup_logging()
+    enable_fault_handler()
 
-    # Log startup information
-    logging.info(f"Starting {APP_NAME} v{APP_VERSION}")
-    logging.info(f"Command line args: {sys.argv}")
-    logging.info(f"Python version: {sys.version}")
-    logging.info(f"Working directory: {os.getcwd()}")
-    if user_app_dir:
-        logging.info(f"User app directory: {user_app_dir}")
+    # Log startup information as one record
+    logging.info(
+        "Starting %s v%s\n  Command line args: %s\n  Python version: %s\n"
+        "  Working directory: %s\n  User app directory: %s",
+        APP_NAME, APP_VERSION, sys.argv, sys.version, os.getcwd(), user_app_dir
+    )
 
     # Log path information if available
     try:
@@ -183,18 +258,22 @@ def main():
     except ImportError:
         logging.info("App paths module not available, using current directory")
 
+    from PySide6.QtWidgets import QApplication, QMessageBox
+
     # Create QApplication
     app = QApplication(sys.argv)
 
     # Set up application properties and styling
     setup_application_properties(app)
 
+    # Check for required dependencies before loading the UI
+    missing_deps = dependency_check.result()
+    if missing_deps:
+        show_dependency_error(missing_deps)
+        return 1
+
     try:
-        # Check for required dependencies
-        missing_deps = check_dependencies()
-        if missing_deps:
-            show_dependency_error(missing_deps)
-            return 1
+        from ui.main_window import MainWindow
 
         # Create and configure main window
         window = MainWindow()
@@ -238,36 +317,40 @@ def main():
 
 def check_dependencies():
     """Check for required dependencies and return list of missing ones."""
-    missing = []
-
-    # Check for database drivers
-    try:
-        import pymysql
-    except ImportError:
-        missing.append("pymysql (for MySQL support)")
-
-    try:
-        import psycopg2
-    except ImportError:
-        missing.append("psycopg2 (for PostgreSQL support)")
-
-    # SQLite is built into Python, so no need to check
+    # Database drivers; SQLite is built into Python, so no need to check
+    probes = [
+        ("pymysql", "pymysql (for MySQL support)"),
+        ("psycopg2", "psycopg2 (for PostgreSQL support)"),
+    ]
 
     # Check for Windows-specific modules (if on Windows)
     if sys.platform.startswith('win'):
+        probes.append(("winreg", "winreg (for Windows startup integration)"))
+
+    # Frozen builds record at build time which modules they bundle
+    if getattr(sys, 'frozen', False):
         try:
-            import winreg
+            from _dep_manifest import MISSING_MODULES
         except ImportError:
-            missing.append("winreg (for Windows startup integration)")
+            pass  # Built without a manifest; probe at runtime
+        else:
+            return [description for module_name, description in probes
+                    if module_name in MISSING_MODULES]
 
-    return missing
+    # find_spec only locates each module on sys.path without executing it;
+    # the drivers are imported when a database of that type is first opened
+    return [description for module_name, description in probes
+            if importlib.util.find_spec(module_name) is None]
 
 
 def show_dependency_error(missing_deps):
-    """Show error dialog for missing dependencies."""
-    app = QApplication.instance()
-    if not app:
-        app = QApplication(sys.argv)
+    """
+    Show error dialog for missing dependencies.
+
+    The caller must already own the QApplication; main() creates it before
+    reporting missing dependencies.
+    """
+    from PySide6.QtWidgets import QMessageBox
 
     deps_text = "\n".join(f"• {dep}" for dep in missing_deps)
 
@@ -13,7 +13,8 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
     QLineEdit, QSpinBox, QComboBox, QPushButton, QTableWidget,
     QTableWidgetItem, QCheckBox, QHeaderView, QMessageBox,
-    QProgressDialog, QLabel, QSplitter, QTextEdit, QWidget, QSizePolicy
+    QProgressDialog, QLabel, QSplitter, QTextEdit, QWidget, QSizePolicy,
+    QRadioButton, QButtonGroup
 )
 from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtGui import QFont
@@ -78,6 +79,9 @@ class DatabaseConnectionDialog(QDialog):
         self.cloud_tables = []
         self.common_tables = []
 
+        # One exclusive sync direction group per table row
+        self.direction_groups: List[QButtonGroup] = []
+
         self.setup_ui()
 
         if self.is_editing:
@@ -427,43 +431,39 @@ class DatabaseConnectionDialog(QDialog):
                                 "No tables found that exist in both databases.")
             return
 
-        self.tables_widget.setRowCount(len(self.common_tables))
-
-        for i, table_name in enumerate(sorted(self.common_tables)):
-            # Table name
-            self.tables_widget.setItem(i, 0, QTableWidgetItem(table_name))
-
-            # Create radio button group for sync direction
-            local_to_cloud = QCheckBox()
-            cloud_to_local = QCheckBox()
-            bidirectional = QCheckBox()
-            no_sync = QCheckBox()
-
-            # Set no_sync as default
-            no_sync.setChecked(True)
-
-            # Make them mutually exclusive
-            def make_exclusive(current_cb, others, row=i):
-                def toggle():
-                    if current_cb.isChecked():
-                        for other in others:
-                            other.setChecked(False)
-
-                return toggle
-
-            local_to_cloud.toggled.connect(
-                make_exclusive(local_to_cloud, [cloud_to_local, bidirectional, no_sync]))
-            cloud_to_local.toggled.connect(
-                make_exclusive(cloud_to_local, [local_to_cloud, bidirectional, no_sync]))
-            bidirectional.toggled.connect(
-                make_exclusive(bidirectional, [local_to_cloud, cloud_to_local, no_sync]))
-            no_sync.toggled.connect(
-                make_exclusive(no_sync, [local_to_cloud, cloud_to_local, bidirectional]))
-
-            self.tables_widget.setCellWidget(i, 1, local_to_cloud)
-            self.tables_widget.setCellWidget(i, 2, cloud_to_local)
-            self.tables_widget.setCellWidget(i, 3, bidirectional)
-            self.tables_widget.setCellWidget(i, 4, no_sync)
+        # Repaint once after all rows are filled instead of once per cell
+        self.tables_widget.setUpdatesEnabled(False)
+        try:
+            for group in self.direction_groups:
+                group.deleteLater()
+            self.direction_groups = []
+
+            self.tables_widget.setRowCount(len(self.common_tables))
+
+            for i, table_name in enumerate(sorted(self.common_tables)):
+                # Table name
+                self.tables_widget.setItem(i, 0, QTableWidgetItem(table_name))
+
+                # Create radio button group for sync direction
+                local_to_cloud = QRadioButton()
+                cloud_to_local = QRadioButton()
+                bidirectional = QRadioButton()
+                no_sync = QRadioButton()
+
+                group = QButtonGroup(self.tables_widget)
+                for button in (local_to_cloud, cloud_to_local, bidirectional, no_sync):
+                    group.addButton(button)
+                self.direction_groups.append(group)
+
+                # Set no_sync as default
+                no_sync.setChecked(True)
+
+                self.tables_widget.setCellWidget(i, 1, local_to_cloud)
+                self.tables_widget.setCellWidget(i, 2, cloud_to_local)
+                self.tables_widget.setCellWidget(i, 3, bidirectional)
+                self.tables_widget.setCellWidget(i, 4, no_sync)
+        finally:
+            self.tables_widget.setUpdatesEnabled(True)
 
         self.status_text.append(f"Loaded {len(self.common_tables)} tables for configuration")
 
@@ -6,16 +6,14 @@ in Qt widgets while also maintaining thread safety.
 """
 
 import logging
+from collections import deque
 from datetime import datetime
 from typing import Optional
 from PySide6.QtWidgets import QTextEdit
-from PySide6.QtCore import QObject, Signal, QMutex
-from PySide6.QtGui import QTextCursor, QColor
+from PySide6.QtCore import QMutex, QTimer
+from PySide6.QtGui import QTextCursor, QColor, QTextCharFormat
 
-
-class LogSignals(QObject):
-    """Signals for thread-safe log message emission."""
-    log_received = Signal(str, str, str)  # timestamp, level, message
+from utils.constants import LOG_FLUSH_INTERVAL, LOG_VIEWER_MAX_LINES
 
 
 class UILogHandler(logging.Handler):
@@ -25,16 +23,17 @@ class UILogHandler(logging.Handler):
         """
         Initialize the UI log handler.
 
+        Must be created in the UI thread, which owns the flush timer.
+
         Args:
             text_widget: QTextEdit widget to display logs in
         """
         super().__init__()
-        self.text_widget = text_widget
-        self.signals = LogSignals()
+        self.text_widget = None
         self.mutex = QMutex()
 
-        # Connect signal to handler method
-        self.signals.log_received.connect(self._handle_log_message)
+        # Records from any thread queue here; the UI thread drains them in batches
+        self._pending = deque()
 
         # Color scheme for different log levels
         self.level_colors = {
@@ -44,12 +43,25 @@ class UILogHandler(logging.Handler):
             'ERROR': QColor(255, 0, 0),  # Red
             'CRITICAL': QColor(139, 0, 0)  # Dark Red
         }
+        self._level_formats = {}
+        for level, color in self.level_colors.items():
+            text_format = QTextCharFormat()
+            text_format.setForeground(color)
+            self._level_formats[level] = text_format
 
         # Set default format
         self.setFormatter(logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         ))
 
+        self._flush_timer = QTimer()
+        self._flush_timer.setInterval(LOG_FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self.flush_pending)
+        self._flush_timer.start()
+
+        if text_widget is not None:
+            self.set_text_widget(text_widget)
+
     def set_text_widget(self, text_widget: QTextEdit):
         """
         Set or change the text widget for log display.
@@ -60,12 +72,15 @@ class UILogHandler(logging.Handler):
         self.mutex.lock()
         try:
             self.text_widget = text_widget
+            if text_widget is not None:
+                # Qt drops the oldest lines itself once the limit is reached
+                text_widget.document().setMaximumBlockCount(LOG_VIEWER_MAX_LINES)
         finally:
             self.mutex.unlock()
 
     def emit(self, record: logging.LogRecord):
         """
-        Emit a log record to the UI widget.
+        Queue a log record for display in the UI widget.
 
         Args:
             record: Log record to emit
@@ -74,83 +89,65 @@ class UILogHandler(logging.Handler):
             # Format the message
             message = self.format(record)
             timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S')
-            level = record.levelname
 
-            # Emit signal for thread-safe UI update
-            self.signals.log_received.emit(timestamp, level, message)
+            self._pending.append((timestamp, record.levelname, message))
 
         except Exception:
             # Handle errors in log handler gracefully
             self.handleError(record)
 
-    def _handle_log_message(self, timestamp: str, level: str, message: str):
-        """
-        Handle log message in the UI thread.
+    def flush_pending(self):
+        """Write all queued log messages to the widget in one edit."""
+        if not self._pending:
+            return
 
-        Args:
-            timestamp: Formatted timestamp
-            level: Log level
-            message: Log message
-        """
         self.mutex.lock()
         try:
-            if not self.text_widget:
-                return
-
-            # Get current cursor position
-            cursor = self.text_widget.textCursor()
-            cursor.movePosition(QTextCursor.End)
-
-            # Format the log entry
-            log_entry = f"[{timestamp}] {level}: {message}"
-
-            # Set color based on log level
-            if level in self.level_colors:
-                self.text_widget.setTextColor(self.level_colors[level])
-            else:
-                self.text_widget.setTextColor(self.level_colors['INFO'])
-
-            # Append the message
-            cursor.insertText(log_entry + '\n')
-
-            # Auto-scroll to bottom
-            self.text_widget.ensureCursorVisible()
-
-            # Limit the number of lines to prevent memory issues
-            self._limit_log_lines()
-
+            self._flush_pending_locked()
         finally:
             self.mutex.unlock()
 
-    def _limit_log_lines(self, max_lines: int = 1000):
-        """
-        Limit the number of log lines displayed to prevent memory issues.
-
-        Args:
-            max_lines: Maximum number of lines to keep
-        """
+    def _flush_pending_locked(self):
+        """Drain the queue into the widget; the caller holds the mutex."""
         if not self.text_widget:
+            self._pending.clear()
             return
 
-        document = self.text_widget.document()
-        if document.blockCount() > max_lines:
-            # Remove excess lines from the beginning
-            cursor = QTextCursor(document)
-            cursor.movePosition(QTextCursor.Start)
+        cursor = self.text_widget.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        try:
+            # Consecutive entries of the same level share one insert
+            run_format = None
+            run_lines = []
+            while self._pending:
+                timestamp, level, message = self._pending.popleft()
+                text_format = self._level_formats.get(level, self._level_formats['INFO'])
+                if text_format is not run_format and run_lines:
+                    cursor.insertText(''.join(run_lines), run_format)
+                    run_lines = []
+                run_format = text_format
+                run_lines.append(f"[{timestamp}] {level}: {message}\n")
+
+            if run_lines:
+                cursor.insertText(''.join(run_lines), run_format)
+        finally:
+            cursor.endEditBlock()
 
-            # Calculate how many lines to remove
-            lines_to_remove = document.blockCount() - max_lines
+        # Auto-scroll to bottom
+        self.text_widget.setTextCursor(cursor)
+        self.text_widget.ensureCursorVisible()
 
-            # Select and delete excess lines
-            for _ in range(lines_to_remove):
-                cursor.select(QTextCursor.BlockUnderCursor)
-                cursor.removeSelectedText()
-                cursor.deleteChar()  # Remove the newline
+    def close(self):
+        """Stop the flush timer and close the handler."""
+        self._flush_timer.stop()
+        super().close()
 
     def clear_logs(self):
         """Clear all log messages from the widget."""
         self.mutex.lock()
         try:
+            self._pending.clear()
             if self.text_widget:
                 self.text_widget.clear()
         finally:
@@ -171,6 +168,7 @@ class UILogHandler(logging.Handler):
             if not self.text_widget:
                 return False
 
+            self._flush_pending_locked()
             content = self.text_widget.toPlainText()
 
             with open(filename, 'w', encoding='utf-8') as f:
@@ -293,6 +291,7 @@ class LogManager:
         """Remove the UI handler."""
         if self.ui_handler:
             logging.getLogger().removeHandler(self.ui_handler)
+            self.ui_handler.close()
             self.ui_handler = None
             logging.info("UI log handler removed")
 
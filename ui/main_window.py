@@ -22,7 +22,7 @@ from PySide6.QtGui import QFont, QAction, QIcon, QColor, QCloseEvent
 
 from core.config_manager import ConfigManager
 from core.sync_worker import SyncWorker
-from core.models import JobStatus, DatabasePair
+from core.models import JobStatus, DatabasePair, SyncResult, SyncDirection
 from .log_handler import LogManager
 from .password_dialog import PasswordDialog
 from .settings_dialog import SettingsDialog
@@ -356,7 +356,7 @@ class MainWindow(QMainWindow):
 
         # Sync worker signals
         self.sync_worker.status_changed.connect(self.update_status)
-        self.sync_worker.log_message.connect(self.handle_worker_log)
+        self.sync_worker.logs_pending.connect(self.handle_worker_logs)
         self.sync_worker.progress_updated.connect(self.update_progress)
         self.sync_worker.sync_completed.connect(self.handle_sync_completed)
         self.sync_worker.error_occurred.connect(self.handle_worker_error)
@@ -693,27 +693,22 @@ class MainWindow(QMainWindow):
             # Hide progress bar after a short delay
             QTimer.singleShot(2000, lambda: self.progress_bar.setVisible(False))
 
-    def handle_worker_log(self, level: str, message: str):
-        """
-        Handle log messages from the sync worker.
-
-        Args:
-            level: Log level
-            message: Log message
-        """
+    def handle_worker_logs(self):
+        """Drain and log every message queued by the sync worker."""
         logger = logging.getLogger("SyncWorker")
-        getattr(logger, level.lower())(message)
+        for level, message in self.sync_worker.take_pending_logs():
+            getattr(logger, level.lower())(message)
 
-    def handle_sync_completed(self, results: List[dict]):
+    def handle_sync_completed(self, results: List[SyncResult]):
         """
         Handle sync completion.
 
         Args:
-            results: List of sync result dictionaries
+            results: List of sync results
         """
-        successful = sum(1 for result in results if result.get('success', False))
+        successful = sum(1 for result in results if result.success)
         total = len(results)
-        records = sum(result.get('records_synced', 0) for result in results)
+        records = sum(result.records_synced for result in results)
 
         # Update status bar
         self.status_bar.showMessage(
@@ -786,42 +781,48 @@ class MainWindow(QMainWindow):
     def update_pairs_table(self):
         """Update the database pairs table."""
         db_pairs = self.config_manager.get_database_pairs()
-        self.pairs_table.setRowCount(len(db_pairs))
-
-        for i, pair in enumerate(db_pairs):
-            # Name
-            name_item = QTableWidgetItem(pair.name)
-            if not pair.is_enabled:
-                name_item.setForeground(QColor("gray"))
-            self.pairs_table.setItem(i, 0, name_item)
-
-            # Status
-            status_item = QTableWidgetItem("Enabled" if pair.is_enabled else "Disabled")
-            status_item.setForeground(QColor("green") if pair.is_enabled else QColor("gray"))
-            self.pairs_table.setItem(i, 1, status_item)
-
-            # Last sync
-            last_sync = pair.last_sync if pair.last_sync else "Never"
-            if pair.last_sync:
-                try:
-                    sync_time = datetime.fromisoformat(pair.last_sync)
-                    last_sync = sync_time.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    last_sync = "Invalid date"
-
-            self.pairs_table.setItem(i, 2, QTableWidgetItem(last_sync))
-
-            # Tables count
-            sync_enabled = sum(1 for table in pair.tables if table.sync_direction.value != "no_sync")
-            tables_text = f"{sync_enabled}/{len(pair.tables)}"
-            self.pairs_table.setItem(i, 3, QTableWidgetItem(tables_text))
-
-            # Interval
-            self.pairs_table.setItem(i, 4, QTableWidgetItem(str(pair.sync_interval)))
-
-            # Actions (placeholder)
-            actions_item = QTableWidgetItem("Sync Now")
-            self.pairs_table.setItem(i, 5, actions_item)
+
+        # Repaint once after all rows are filled instead of once per cell
+        self.pairs_table.setUpdatesEnabled(False)
+        try:
+            self.pairs_table.setRowCount(len(db_pairs))
+
+            for i, pair in enumerate(db_pairs):
+                # Name
+                name_item = QTableWidgetItem(pair.name)
+                if not pair.is_enabled:
+                    name_item.setForeground(QColor("gray"))
+                self.pairs_table.setItem(i, 0, name_item)
+
+                # Status
+                status_item = QTableWidgetItem("Enabled" if pair.is_enabled else "Disabled")
+                status_item.setForeground(QColor("green") if pair.is_enabled else QColor("gray"))
+                self.pairs_table.setItem(i, 1, status_item)
+
+                # Last sync
+                last_sync = pair.last_sync if pair.last_sync else "Never"
+                if pair.last_sync:
+                    try:
+                        sync_time = datetime.fromisoformat(pair.last_sync)
+                        last_sync = sync_time.strftime("%Y-%m-%d %H:%M:%S")
+                    except:
+                        last_sync = "Invalid date"
+
+                self.pairs_table.setItem(i, 2, QTableWidgetItem(last_sync))
+
+                # Tables count
+                sync_enabled = sum(1 for table in pair.tables if table.sync_direction is not SyncDirection.NO_SYNC)
+                tables_text = f"{sync_enabled}/{len(pair.tables)}"
+                self.pairs_table.setItem(i, 3, QTableWidgetItem(tables_text))
+
+                # Interval
+                self.pairs_table.setItem(i, 4, QTableWidgetItem(str(pair.sync_interval)))
+
+                # Actions (placeholder)
+                actions_item = QTableWidgetItem("Sync Now")
+                self.pairs_table.setItem(i, 5, actions_item)
+        finally:
+            self.pairs_table.setUpdatesEnabled(True)
 
     def validate_configurations(self):
         """Validate all database configurations."""
@@ -282,39 +282,45 @@ class SettingsDialog(QDialog):
     def refresh_pairs_table(self):
         """Refresh the database pairs table."""
         pairs = self.config_manager.get_database_pairs()
-        self.pairs_table.setRowCount(len(pairs))
-
-        for i, pair in enumerate(pairs):
-            # Name
-            name_item = QTableWidgetItem(pair.name)
-            if not pair.is_enabled:
-                name_item.setBackground(Qt.lightGray)
-            self.pairs_table.setItem(i, 0, name_item)
-
-            # Status
-            status = "Enabled" if pair.is_enabled else "Disabled"
-            status_item = QTableWidgetItem(status)
-            self.pairs_table.setItem(i, 1, status_item)
-
-            # Local DB
-            local_db_text = f"{pair.local_db.db_type}://{pair.local_db.host}:{pair.local_db.port}/{pair.local_db.database}"
-            self.pairs_table.setItem(i, 2, QTableWidgetItem(local_db_text))
-
-            # Cloud DB
-            cloud_db_text = f"{pair.cloud_db.db_type}://{pair.cloud_db.host}:{pair.cloud_db.port}/{pair.cloud_db.database}"
-            self.pairs_table.setItem(i, 3, QTableWidgetItem(cloud_db_text))
-
-            # Tables
-            sync_tables = len([t for t in pair.tables if t.sync_direction != SyncDirection.NO_SYNC])
-            tables_text = f"{sync_tables}/{len(pair.tables)}"
-            self.pairs_table.setItem(i, 4, QTableWidgetItem(tables_text))
-
-            # Interval
-            self.pairs_table.setItem(i, 5, QTableWidgetItem(f"{pair.sync_interval}s"))
-
-            # Last sync
-            last_sync = pair.last_sync if pair.last_sync else "Never"
-            self.pairs_table.setItem(i, 6, QTableWidgetItem(last_sync))
+
+        # Repaint once after all rows are filled instead of once per cell
+        self.pairs_table.setUpdatesEnabled(False)
+        try:
+            self.pairs_table.setRowCount(len(pairs))
+
+            for i, pair in enumerate(pairs):
+                # Name
+                name_item = QTableWidgetItem(pair.name)
+                if not pair.is_enabled:
+                    name_item.setBackground(Qt.lightGray)
+                self.pairs_table.setItem(i, 0, name_item)
+
+                # Status
+                status = "Enabled" if pair.is_enabled else "Disabled"
+                status_item = QTableWidgetItem(status)
+                self.pairs_table.setItem(i, 1, status_item)
+
+                # Local DB
+                local_db_text = f"{pair.local_db.db_type}://{pair.local_db.host}:{pair.local_db.port}/{pair.local_db.database}"
+                self.pairs_table.setItem(i, 2, QTableWidgetItem(local_db_text))
+
+                # Cloud DB
+                cloud_db_text = f"{pair.cloud_db.db_type}://{pair.cloud_db.host}:{pair.cloud_db.port}/{pair.cloud_db.database}"
+                self.pairs_table.setItem(i, 3, QTableWidgetItem(cloud_db_text))
+
+                # Tables
+                sync_tables = sum(1 for t in pair.tables if t.sync_direction is not SyncDirection.NO_SYNC)
+                tables_text = f"{sync_tables}/{len(pair.tables)}"
+                self.pairs_table.setItem(i, 4, QTableWidgetItem(tables_text))
+
+                # Interval
+                self.pairs_table.setItem(i, 5, QTableWidgetItem(f"{pair.sync_interval}s"))
+
+                # Last sync
+                last_sync = pair.last_sync if pair.last_sync else "Never"
+                self.pairs_table.setItem(i, 6, QTableWidgetItem(last_sync))
+        finally:
+            self.pairs_table.setUpdatesEnabled(True)
 
     def on_pair_selection_changed(self):
         """Handle pair selection changes."""
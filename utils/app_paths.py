@@ -4,11 +4,14 @@ Path management utilities for Database Sync Tool
 This module ensures all file operations use appropriate user-writable directories
 """
 
+import atexit
 import os
+import queue
 import sys
 import tempfile
 from pathlib import Path
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 
 class AppPaths:
@@ -138,41 +141,68 @@ class AppPaths:
 app_paths = AppPaths()
 
 
+# Background thread writing queued log records to the real handlers
+_log_listener = None
+
+
+def _stop_log_listener():
+    """Flush queued log records and stop the background log writer."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 def setup_logging():
     """Set up logging configuration with proper user-writable paths."""
+    global _log_listener
+
     # Ensure we're using user-writable paths
     log_file = app_paths.get_log_file("app")
 
     # Clear any existing handlers
     for handler in logging.root.handlers[:]:
         logging.root.removeHandler(handler)
+    _stop_log_listener()
 
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     try:
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ],
-            force=True  # Force reconfiguration
-        )
+        handlers = [
+            logging.FileHandler(log_file, encoding='utf-8'),
+            logging.StreamHandler(sys.stdout)
+        ]
+        file_logging = True
+    except Exception as e:
+        # Ultimate fallback - just use console logging
+        handlers = [logging.StreamHandler(sys.stdout)]
+        file_logging = False
+        file_error = e
+
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Callers, including the Qt event loop, only enqueue records; the file
+    # and console writes happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+
+    logging.root.setLevel(logging.INFO)
+    logging.root.addHandler(QueueHandler(log_queue))
+
+    if file_logging:
         logging.info(f"Logging initialized. Log file: {log_file}")
         logging.info(f"App data directory: {app_paths.app_data_dir}")
         logging.info(f"Config directory: {app_paths.config_dir}")
-
-    except Exception as e:
-        # Ultimate fallback - just use console logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[logging.StreamHandler(sys.stdout)],
-            force=True
-        )
-        logging.error(f"Could not set up file logging: {e}")
+    else:
+        logging.error(f"Could not set up file logging: {file_error}")
         logging.info("Using console logging only")
 
 
+# Make sure queued records reach the log file before the process exits
+atexit.register(_stop_log_listener)
+
+
 def get_safe_file_path(filename, subdirectory=None):
     """Get a safe file path in the user data directory"""
     if subdirectory:
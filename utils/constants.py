@@ -24,6 +24,10 @@ DEFAULT_CONNECTION_TIMEOUT = 30  # seconds
 DEFAULT_LOG_LEVEL = "INFO"
 DEFAULT_MAX_LOG_SIZE = 10  # MB
 
+# Password Hashing
+PASSWORD_HASH_ITERATIONS = 200000  # PBKDF2-HMAC-SHA256 rounds for new hashes
+PASSWORD_SALT_BYTES = 16
+
 # Database Configuration
 SUPPORTED_DATABASES = ["mysql", "postgresql", "sqlite"]
 DEFAULT_MYSQL_PORT = 3306
@@ -33,6 +37,10 @@ DEFAULT_POSTGRESQL_PORT = 5432
 CHANGELOG_TABLE_SUFFIX = "_changelog"
 TRIGGER_SUFFIX = "_trigger"
 
+# Marker table checked by SQLite triggers; a row inserted inside the sync
+# transaction suppresses changelog writes for that connection only
+SQLITE_SUPPRESS_TABLE = "_sync_suppress"
+
 # SQL Templates for different database types
 MYSQL_CHANGELOG_TABLE = """
 CREATE TABLE IF NOT EXISTS {changelog_table} (
@@ -46,10 +54,14 @@ CREATE TABLE IF NOT EXISTS {changelog_table} (
     synced BOOLEAN DEFAULT FALSE,
     INDEX idx_table_synced (table_name, synced),
     INDEX idx_timestamp (timestamp),
-    INDEX idx_database_id (database_id)
+    INDEX idx_database_id (database_id),
+    INDEX idx_pending (synced, database_id, id)
 );
 """
 
+# Added separately so changelog tables created before the index existed get it
+MYSQL_CHANGELOG_PENDING_INDEX = "CREATE INDEX idx_pending ON {changelog_table} (synced, database_id, id)"
+
 POSTGRESQL_CHANGELOG_TABLE = """
 CREATE TABLE IF NOT EXISTS {changelog_table} (
     id BIGSERIAL PRIMARY KEY,
@@ -70,6 +82,9 @@ ON {changelog_table} (timestamp);
 
 CREATE INDEX IF NOT EXISTS idx_{changelog_table}_database_id 
 ON {changelog_table} (database_id);
+
+CREATE INDEX IF NOT EXISTS idx_{changelog_table}_pending
+ON {changelog_table} (synced, database_id, id);
 """
 
 SQLITE_CHANGELOG_TABLE = """
@@ -92,18 +107,34 @@ ON {changelog_table} (timestamp);
 
 CREATE INDEX IF NOT EXISTS idx_{changelog_table}_database_id 
 ON {changelog_table} (database_id);
+
+CREATE INDEX IF NOT EXISTS idx_{changelog_table}_pending
+ON {changelog_table} (synced, database_id, id);
 """
 
 # UI Constants
 WINDOW_MIN_WIDTH = 800
 WINDOW_MIN_HEIGHT = 600
 LOG_VIEWER_MAX_HEIGHT = 200
+LOG_VIEWER_MAX_LINES = 1000  # oldest lines are dropped beyond this
+LOG_FLUSH_INTERVAL = 100  # milliseconds between batched log viewer updates
 REFRESH_INTERVAL = 5000  # 5 seconds in milliseconds
+PROGRESS_EMIT_INTERVAL = 0.05  # seconds between progress updates sent to the UI
 
 # Sync Constants
-MAX_BATCH_SIZE = 1000
+MAX_BATCH_SIZE = 1000  # changelog entries fetched and applied per target transaction
 MAX_RETRY_ATTEMPTS = 3
 RETRY_DELAY = 5  # seconds
+MAX_RETRY_DELAY = 30  # seconds, cap for exponential retry backoff
+BULK_STATEMENT_SIZE = 500  # max bound parameters per bulk statement
+EXECUTE_MANY_CHUNK_SIZE = 500  # parameter sets per executemany call
+TABLE_SYNC_WORKERS = 4  # tables synced concurrently per database pair
+PAIR_SYNC_WORKERS = 4  # database pairs synced concurrently
+CONNECTION_POOL_SIZE = 5  # idle connections kept per database between syncs
+SCHEMA_CACHE_TTL = 600  # seconds a cached table structure stays valid
+STREAM_CHUNK_SIZE = 5000  # rows fetched and compared at a time when scanning tables
+VALIDATION_CACHE_TTL = 300  # seconds a passing pair validation is reused between syncs
+STATUS_RESULTS_LIMIT = 10  # most recent table results kept for status reporting
 
 # Color Schemes for Dark Theme
 DARK_THEME_COLORS = {